@@ -0,0 +1,139 @@
+# app/core/admission.py
+
+import asyncio
+import math
+import time
+from collections import deque  # 대기 순서 (FIFO)
+from typing import Any, Deque, Dict, List, Optional
+
+from app.core.metrics import counter, gauge, histogram  # 동시 처리/대기/거절 메트릭
+
+_LIMITERS: List["ConcurrencyLimiter"] = []  # 메트릭/상태 조회용
+
+ADMISSION_SHED = counter(
+    "admission_shed_total",
+    "동시 처리 한도를 넘어 거절한 요청 수 (queue_full: 대기열 초과, predicted: 예상 대기 시간 초과, timeout: 대기 중 기한 초과)",
+    ("budget", "reason"),
+)
+ADMISSION_WAIT = histogram(
+    "admission_wait_seconds",
+    "처리 순서를 기다린 시간 (초, 허용된 요청만)",
+    ("budget",),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+gauge(
+    "admission_in_flight",
+    "처리 중인 요청 수",
+    ("budget",),
+    callback=lambda: [((limiter.name,), limiter.active) for limiter in _LIMITERS],
+)
+gauge(
+    "admission_queue_depth",
+    "처리 순서를 기다리는 요청 수",
+    ("budget",),
+    callback=lambda: [((limiter.name,), limiter.waiting) for limiter in _LIMITERS],
+)
+
+
+class AdmissionRejected(Exception):
+    """요청을 받아들이지 않기로 했을 때 발생하는 예외 (retry_after초 후 재시도 권장)"""
+
+    def __init__(self, reason: str, retry_after: float) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class ConcurrencyLimiter:
+    """
+    동시에 처리하는 요청 수를 limit개로 제한하고, 나머지는 최대 queue_size개까지 도착 순서대로 대기시킵니다.
+    처리 시간의 이동 평균으로 예상 대기 시간을 계산해, 기한 안에 처리될 수 없는 요청은 기다리게 하지 않고 바로 거절합니다.
+    """
+
+    def __init__(self, name: str, limit: int, queue_size: int, max_wait: float) -> None:
+        self.name = name
+        self.limit = max(1, limit)
+        self.queue_size = queue_size
+        self.max_wait = max_wait
+        self.active = 0
+        self.waiting = 0
+        self.service_seconds = 0.0  # 요청 처리 시간 이동 평균 (EWMA)
+        self._waiters: Deque[asyncio.Future] = deque()
+        _LIMITERS.append(self)
+
+    def estimated_wait(self, ahead: int) -> float:
+        """앞에 ahead개가 기다리고 있을 때 예상 대기 시간 (초)"""
+        return (ahead + 1) / self.limit * self.service_seconds
+
+    def _reject(self, reason: str, retry_after: float) -> AdmissionRejected:
+        ADMISSION_SHED.inc(self.name, reason)
+        return AdmissionRejected(reason, retry_after)
+
+    async def acquire(self, deadline: float) -> None:
+        """
+        처리 순서를 받을 때까지 기다립니다.
+
+        :param deadline: 이 시각(time.perf_counter 기준)까지 순서를 받지 못하면 거절
+        :raises AdmissionRejected: 대기열이 가득 찼거나 기한 안에 처리될 수 없는 경우
+        """
+        if self.active < self.limit and not self.waiting:
+            self.active += 1
+            ADMISSION_WAIT.observe(0.0, self.name)
+            return
+
+        estimate = self.estimated_wait(self.waiting)
+        if self.waiting >= self.queue_size:
+            raise self._reject("queue_full", estimate)
+        started = time.perf_counter()
+        remaining = deadline - started
+        if estimate > remaining:
+            raise self._reject("predicted", estimate)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(waiter, remaining)
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                self._handoff()  # 순서를 넘겨받은 직후 기한 초과/취소됨 → 다음 요청에 넘김
+            if isinstance(e, asyncio.TimeoutError):
+                raise self._reject("timeout", self.estimated_wait(self.waiting)) from None
+            raise
+        finally:
+            self.waiting -= 1
+        ADMISSION_WAIT.observe(time.perf_counter() - started, self.name)
+
+    def release(self, elapsed: Optional[float] = None) -> None:
+        """처리가 끝난 요청의 순서를 반납합니다 (elapsed: 처리 시간, 주어지면 이동 평균 갱신)."""
+        if elapsed is not None:
+            self.service_seconds += 0.1 * (elapsed - self.service_seconds)
+        self._handoff()
+
+    def _handoff(self) -> None:
+        # 처리 순서를 대기 중인 다음 요청에 그대로 넘김 (취소/기한 초과된 대기자는 건너뜀)
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "inFlight": self.active,
+            "queued": self.waiting,
+            "queueSize": self.queue_size,
+            "maxWaitSeconds": self.max_wait,
+            "serviceSecondsAvg": round(self.service_seconds, 6),
+        }
+
+
+def admission_status() -> Dict[str, Dict[str, Any]]:
+    """현재 워커의 동시 처리 한도별 상태를 반환합니다."""
+    return {limiter.name: limiter.stats() for limiter in _LIMITERS}
@@ -0,0 +1,196 @@
+# app/core/cache.py
+
+import time  # TTL 계산 (monotonic)
+from abc import ABC, abstractmethod
+from collections import OrderedDict  # LRU 순서 관리
+from typing import Any, Awaitable, Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class CacheBackend(ABC):
+    """
+    여러 워커가 함께 쓰는 공유 캐시 백엔드 인터페이스 (예: Redis).
+    값은 직렬화된 문자열로 저장합니다.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """키에 해당하는 값을 반환합니다. 없거나 만료되었으면 None."""
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """키에 값을 ttl초 동안 저장합니다."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """키를 삭제합니다."""
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """프로세스 내부 dict로 동작하는 CacheBackend 구현 (로컬 개발/테스트용)"""
+
+    def __init__(self) -> None:
+        self._data: Dict[str, Tuple[str, float]] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return value
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        self._data[key] = (value, time.monotonic() + ttl)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+
+class LRUCache(Generic[T]):
+    """최대 개수와 TTL이 있는 프로세스 내 LRU 캐시"""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[T, float]]" = OrderedDict()
+        self.evictions = 0  # 용량 초과로 밀려난 항목 수
+        self.expirations = 0  # TTL 만료로 제거된 항목 수
+
+    def get(self, key: str) -> Optional[T]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.expirations += 1
+            return None
+        self._data.move_to_end(key)  # 최근 사용 항목으로 갱신
+        return value
+
+    def set(self, key: str, value: T) -> None:
+        self._data[key] = (value, time.monotonic() + self.ttl)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)  # 가장 오래 사용되지 않은 항목 제거
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ReadThroughCache(Generic[T]):
+    """
+    로컬 LRU → 공유 백엔드(선택) → loader 순서로 조회하는 read-through 캐시.
+
+    쓰기(set/invalidate)가 일어나면 키별 쓰기 순번을 기록하고, 그보다 먼저 시작된
+    조회 결과는 캐시에 저장하지 않습니다. 따라서 이 프로세스의 마지막 쓰기보다
+    오래된 값이 캐시에 다시 들어가지 않습니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int,
+        ttl: float,
+        dumps: Callable[[T], str],
+        loads: Callable[[str], T],
+        backend: Optional[CacheBackend] = None,
+    ) -> None:
+        self.name = name
+        self.local: LRUCache[T] = LRUCache(max_size=max_size, ttl=ttl)
+        self.backend = backend
+        self._dumps = dumps
+        self._loads = loads
+        self._write_seq = 0  # 쓰기 순번 (단조 증가)
+        self._last_write: "OrderedDict[str, int]" = OrderedDict()  # 키별 마지막 쓰기 순번
+        self._write_floor = 0  # _last_write에서 밀려난 기록 중 가장 큰 순번
+        self.hits = 0
+        self.misses = 0
+        self.backend_hits = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.name}:{key}"
+
+    def _mark_write(self, key: str) -> None:
+        self._write_seq += 1
+        self._last_write[key] = self._write_seq
+        self._last_write.move_to_end(key)
+        while len(self._last_write) > self.local.max_size:
+            _, seq = self._last_write.popitem(last=False)
+            self._write_floor = max(self._write_floor, seq)
+
+    def _written_since(self, key: str, seq: int) -> bool:
+        """조회 시작(seq) 이후 해당 키에 쓰기가 있었는지 확인합니다."""
+        return self._last_write.get(key, self._write_floor) > seq
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[Optional[T]]], store: bool = True
+    ) -> Optional[T]:
+        """
+        캐시에서 값을 찾고, 없으면 loader로 불러와 저장합니다.
+        loader가 None을 반환하면(존재하지 않음) 캐시하지 않습니다.
+        store=False면 불러온 값을 저장하지 않습니다 (최신이 아닐 수 있는 읽기 복제본에서 읽은 경우).
+        """
+        value = self.local.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        started_seq = self._write_seq
+
+        if self.backend is not None:
+            raw = await self.backend.get(self._key(key))
+            if raw is not None and not self._written_since(key, started_seq):
+                self.backend_hits += 1
+                value = self._loads(raw)
+                self.local.set(key, value)
+                return value
+
+        self.misses += 1
+        value = await loader()
+        if store and value is not None and not self._written_since(key, started_seq):
+            self.local.set(key, value)
+            if self.backend is not None:
+                await self.backend.set(self._key(key), self._dumps(value), self.local.ttl)
+        return value
+
+    async def set(self, key: str, value: T) -> None:
+        """쓰기 직후 최신 값으로 캐시를 갱신합니다."""
+        self._mark_write(key)
+        self.local.set(key, value)
+        if self.backend is not None:
+            await self.backend.set(self._key(key), self._dumps(value), self.local.ttl)
+
+    async def invalidate(self, key: str) -> None:
+        """쓰기 직후 캐시 항목을 제거합니다."""
+        self._mark_write(key)
+        self.local.delete(key)
+        if self.backend is not None:
+            await self.backend.delete(self._key(key))
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/실패/제거 카운터를 반환합니다."""
+        lookups = self.hits + self.backend_hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self.local),
+            "maxSize": self.local.max_size,
+            "ttlSeconds": self.local.ttl,
+            "hits": self.hits,
+            "backendHits": self.backend_hits,
+            "misses": self.misses,
+            "evictions": self.local.evictions,
+            "expirations": self.local.expirations,
+            "hitRatio": (
+                round((self.hits + self.backend_hits) / lookups, 4) if lookups else 0.0
+            ),
+            "sharedBackend": type(self.backend).__name__ if self.backend else None,
+        }
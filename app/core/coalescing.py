@@ -0,0 +1,212 @@
+# app/core/coalescing.py
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Generic, List, Optional, Tuple, TypeVar
+
+from app.core.metrics import counter, gauge, histogram  # 묶음 크기/대기 시간 메트릭
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# (요청 항목, 결과를 받을 Future, 대기열에 넣은 시각)
+_Pending = Tuple[T, "asyncio.Future[R]", float]
+
+_COALESCERS: List["WriteCoalescer"] = []  # 대기열 길이 메트릭용
+
+BATCH_SIZE = histogram(
+    "write_coalesce_batch_size",
+    "한 번에 모아서 처리한 쓰기 요청 수",
+    ("name",),
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512),
+)
+BATCH_WAIT = histogram(
+    "write_coalesce_wait_seconds",
+    "쓰기 요청이 대기열에 들어간 뒤 묶음 처리를 시작할 때까지 기다린 시간 (초)",
+    ("name",),
+    buckets=(0.0005, 0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+REJECTED = counter(
+    "write_coalesce_rejected_total",
+    "대기열이 가득 찼거나 종료 중이라 거절한 쓰기 요청 수",
+    ("name", "reason"),
+)
+FALLBACKS = counter(
+    "write_coalesce_fallbacks_total",
+    "묶음 처리가 실패해 항목별로 다시 처리한 횟수",
+    ("name",),
+)
+gauge(
+    "write_coalesce_queue_depth",
+    "묶음 처리를 기다리는 쓰기 요청 수",
+    ("name",),
+    callback=lambda: [((c.name,), c.queued) for c in _COALESCERS],
+)
+
+
+class CoalescerFull(Exception):
+    """대기열이 가득 찼거나 종료 중이라 요청을 받을 수 없을 때 발생하는 예외 (잠시 후 재시도)"""
+
+
+class WriteCoalescer(Generic[T, R]):
+    """
+    짧은 시간(max_wait초) 안에 들어온 쓰기 요청을 최대 max_batch개씩 모아 flush 한 번으로 처리하고,
+    각 요청에 자기 결과(또는 예외)를 돌려줍니다.
+    - flush(items)는 items와 같은 순서·개수의 결과 목록을 반환해야 하며, 자기 트랜잭션을 직접 커밋해야 합니다.
+    - 묶음 처리가 실패하면 항목별로 다시 처리해 실패한 요청만 예외를 받습니다.
+    - 대기열(queue_size)이 가득 차면 enqueue_timeout초까지 기다린 뒤 CoalescerFull로 거절합니다 (backpressure).
+    - start() 전이나 flushers가 없으면 요청마다 바로 flush합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        flush: Callable[[List[T]], Awaitable[List[R]]],
+        max_batch: int = 100,
+        max_wait: float = 0.002,
+        queue_size: int = 1000,
+        enqueue_timeout: float = 0.5,
+        flushers: int = 1,
+    ) -> None:
+        self.name = name
+        self.flush = flush
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait
+        self.enqueue_timeout = enqueue_timeout
+        self.flushers = flushers
+        self._queue: "asyncio.Queue[_Pending]" = asyncio.Queue(maxsize=queue_size)
+        self._tasks: List[asyncio.Task] = []
+        self._closed = False
+        _COALESCERS.append(self)
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._closed = False
+        self._tasks = [
+            asyncio.create_task(self._run(), name=f"{self.name}-coalescer-{i}")
+            for i in range(self.flushers)
+        ]
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """새 요청을 막고 대기 중인 요청을 timeout초까지 처리한 뒤 멈춥니다 (남은 요청은 CoalescerFull)."""
+        self._closed = True
+        if not self._tasks:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("%s: 대기 중인 쓰기 요청 %d건을 처리하지 못하고 종료합니다", self.name, self.queued)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        while not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(CoalescerFull(f"{self.name}: 종료 중"))
+
+    async def submit(self, item: T) -> R:
+        """
+        요청 하나를 대기열에 넣고 묶음 처리 결과를 기다립니다.
+
+        :param item: 처리할 항목
+        :return: 이 항목의 처리 결과
+        :raises CoalescerFull: 대기열이 가득 찼거나 종료 중인 경우
+        """
+        if self._closed:
+            REJECTED.inc(self.name, "closed")
+            raise CoalescerFull(f"{self.name}: 종료 중")
+        if not self._tasks:
+            return (await self.flush([item]))[0]
+
+        future: "asyncio.Future[R]" = asyncio.get_running_loop().create_future()
+        pending = (item, future, time.perf_counter())
+        try:
+            self._queue.put_nowait(pending)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(self._queue.put(pending), self.enqueue_timeout)
+            except asyncio.TimeoutError:
+                REJECTED.inc(self.name, "queue_full")
+                raise CoalescerFull(f"{self.name}: 대기열이 가득 찼습니다") from None
+        return await future  # 호출한 쪽이 취소되면 future도 취소되어 처리 대상에서 빠짐
+
+    async def _collect(self) -> List[_Pending]:
+        """첫 요청이 들어온 뒤 max_wait초가 지나거나 max_batch개가 모일 때까지 모읍니다."""
+        batch = [await self._queue.get()]
+        deadline = batch[0][2] + self.max_wait
+        while len(batch) < self.max_batch:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            try:
+                await self._flush(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # 처리 작업이 죽으면 이후 요청이 영원히 대기하므로 기록만 하고 계속 처리
+                logger.exception("%s: 묶음 처리 중 예외가 발생했습니다", self.name)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: List[_Pending]) -> None:
+        # 기다리다 취소된 요청(클라이언트 연결 종료 등)은 처리하지 않음
+        live = [pending for pending in batch if not pending[1].done()]
+        if not live:
+            return
+        started = time.perf_counter()
+        for _, _, enqueued_at in live:
+            BATCH_WAIT.observe(started - enqueued_at, self.name)
+        BATCH_SIZE.observe(len(live), self.name)
+
+        try:
+            try:
+                results = await self.flush([item for item, _, _ in live])
+            except Exception as e:
+                if len(live) == 1:
+                    if not live[0][1].done():
+                        live[0][1].set_exception(e)
+                    return
+                # 한 항목 때문에 묶음 전체가 실패했을 수 있으므로 항목별로 다시 처리
+                logger.warning("%s: %d건 묶음 처리 실패, 항목별로 다시 처리합니다: %s", self.name, len(live), e)
+                FALLBACKS.inc(self.name)
+                for item, future, _ in live:
+                    try:
+                        result = (await self.flush([item]))[0]
+                    except Exception as item_error:
+                        if not future.done():
+                            future.set_exception(item_error)
+                    else:
+                        if not future.done():
+                            future.set_result(result)
+                return
+            for (_, future, _), result in zip(live, results):
+                if not future.done():
+                    future.set_result(result)
+        except BaseException:
+            # 처리 중 종료(취소)되면 결과를 받지 못한 요청에 알림
+            for _, future, _ in live:
+                if not future.done():
+                    future.set_exception(CoalescerFull(f"{self.name}: 종료 중"))
+            raise
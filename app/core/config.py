@@ -1,4 +1,6 @@
 # app/core/config.py
+from typing import Dict, List, Literal, Optional
+
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
 
@@ -9,6 +11,134 @@ class Settings(BaseSettings):
     ASYNC_DATABASE_URL: str
     SYNC_DATABASE_URL: str
 
+    # ✅ 커넥션 풀 설정
+    # - "queue": 워커 프로세스마다 커넥션을 재사용하는 풀 (기본값)
+    # - "null": 매 요청마다 새 연결 (pgbouncer 같은 외부 풀러를 쓸 때만 사용)
+    DB_POOL_MODE: Literal["queue", "null"] = "queue"
+    DB_POOL_SIZE: int = 5  # 항상 유지하는 커넥션 수
+    DB_POOL_MAX_OVERFLOW: int = 10  # pool_size를 넘어 추가로 열 수 있는 커넥션 수
+    DB_POOL_TIMEOUT: float = 30.0  # 커넥션 대기 최대 시간 (초)
+    DB_POOL_RECYCLE: int = 1800  # 커넥션 재생성 주기 (초, -1이면 비활성화)
+    DB_POOL_PRE_PING: bool = True  # 체크아웃 시 ping으로 끊어진 연결 감지
+    DB_POOL_USE_LIFO: bool = True  # 최근 반환된 커넥션부터 재사용 (유휴 연결 정리에 유리)
+    DB_POOL_WARMUP: int = 1  # 시작 시 백그라운드로 미리 열어 둘 커넥션 수
+
+    # ✅ prepared statement 캐시 (연결마다 한 번 PREPARE한 쿼리를 재사용해 파싱/계획 생략)
+    # 캐시는 연결 단위이므로 연결을 재사용하는 "queue" 풀에서만 효과가 있음 ("null"이면 연결마다 새로 준비)
+    DB_STATEMENT_CACHE_SIZE: int = 100  # 연결당 캐시할 문 수 (0이면 캐시하지 않음)
+    # pgbouncer(transaction/statement 풀링) 경유 시 True: asyncpg 자체 캐시를 끄고 문 이름을 UUID로 만들어
+    # 서버 연결이 바뀌어도 이름이 겹치지 않게 함 (풀러 앞에서도 DB_POOL_MODE="queue"로 클라이언트 연결 재사용 가능)
+    DB_PGBOUNCER: bool = False
+    # pgbouncer 1.21+에서 max_prepared_statements > 0이면 True (pgbouncer 모드에서도 DB_STATEMENT_CACHE_SIZE 사용)
+    DB_PGBOUNCER_PREPARED_STATEMENTS: bool = False
+
+    # ✅ SQL 실행 시간 한도 (밀리초, 0이면 무제한, None이면 서버/역할 기본값)
+    # 한도를 넘은 문은 DB가 취소하고 503 + Retry-After로 응답 (오래 걸리는 쿼리가 커넥션을 계속 점유하지 않도록)
+    # 기본값은 연결할 때 한 번 설정하고(asyncpg server_settings, 추가 왕복 없음), 조회/쓰기/라우트별 한도가
+    # 기본값과 다를 때만 트랜잭션 시작 시 SET LOCAL (왕복 1회, DB_READ_TRANSACTION="autocommit"이면 적용되지 않음)
+    # pgbouncer 모드(DB_PGBOUNCER)에서는 연결 설정이 전달되지 않으므로 매 트랜잭션 SET LOCAL
+    DB_STATEMENT_TIMEOUT_MS: Optional[int] = 5000  # 연결 기본값 (요청 밖의 주기 작업에도 적용)
+    DB_LOCK_TIMEOUT_MS: Optional[int] = 2000  # 행/테이블 잠금 대기 (연결 기본값)
+    DB_READ_STATEMENT_TIMEOUT_MS: Optional[int] = None  # 조회(GET) 요청 (None이면 DB_STATEMENT_TIMEOUT_MS)
+    DB_WRITE_STATEMENT_TIMEOUT_MS: Optional[int] = None  # 쓰기 요청 (None이면 DB_STATEMENT_TIMEOUT_MS)
+    # 라우트별 한도 ("METHOD 경로 템플릿" → 밀리초), 예: {"GET /api/v1/todos/export": 60000}
+    DB_ROUTE_STATEMENT_TIMEOUT_MS: Dict[str, int] = {}
+    DB_ROUTE_LOCK_TIMEOUT_MS: Dict[str, int] = {}
+
+    # ✅ 시작 시 DB 스키마 처리
+    # - "create_all": 없는 테이블 생성 (기존 동작, 여러 워커가 동시에 실행하면 충돌할 수 있음) (기본값)
+    # - "check": alembic_version이 코드의 head와 같은지만 확인 (DDL 없음, 다르면 시작 실패)
+    #   배포 전에 `alembic upgrade head`를 실행하는 환경에서만 사용 (이미지에는 마이그레이션 단계가 없음)
+    # - "skip": 아무것도 하지 않음
+    DB_SCHEMA_STARTUP: Literal["check", "create_all", "skip"] = "create_all"
+    DB_SCHEMA_CHECK_CACHE: Optional[str] = None  # 확인 결과 캐시 파일 (같은 호스트의 워커가 공유)
+    DB_SCHEMA_CHECK_CACHE_SECONDS: float = 300.0  # 캐시 유효 시간 (초)
+
+    # ✅ 조회 전용 세션(get_read_db)의 트랜잭션 방식
+    # - "read_only": BEGIN READ ONLY (기본값)
+    # - "deferrable": SERIALIZABLE READ ONLY DEFERRABLE (여러 쿼리가 직렬화 실패 없이 같은 스냅샷을 봄,
+    #   시작 시 잠시 대기할 수 있음, 복제본은 SERIALIZABLE을 지원하지 않으므로 read_only로 동작)
+    # - "autocommit": 트랜잭션 없이 문마다 실행 (BEGIN/ROLLBACK 왕복 없음, 문마다 스냅샷이 다르고 쓰기를 막지 않음)
+    DB_READ_TRANSACTION: Literal["read_only", "deferrable", "autocommit"] = "read_only"
+
+    # ✅ 읽기 복제본 설정 (비어 있으면 모든 조회도 주 DB 사용)
+    # 예: DB_REPLICA_URLS='["postgresql+asyncpg://user:pw@replica-1/db", "..."]'
+    DB_REPLICA_URLS: List[str] = []
+    DB_REPLICA_HEALTH_INTERVAL: float = 5.0  # 복제본 상태/지연 확인 주기 (초)
+    DB_REPLICA_MAX_LAG_SECONDS: float = 10.0  # 이보다 뒤처진 복제본은 조회에서 제외
+    DB_READ_YOUR_WRITES_SECONDS: float = 5.0  # 쓰기 후 이 시간 동안 그 클라이언트의 조회는 주 DB로 (0이면 비활성화)
+
+    # ✅ 동시 처리 한도 (admission control, 조회/쓰기 각각)
+    # 한도를 넘은 요청은 대기열에서 MAX_WAIT_SECONDS까지만 기다리고, 그 안에 처리될 수 없으면 503 + Retry-After
+    # 조회+쓰기 한도의 합을 커넥션 풀 크기(DB_POOL_SIZE + DB_POOL_MAX_OVERFLOW) 근처로 두면 풀 대기가 쌓이지 않음
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_READ_CONCURRENCY: int = 10  # 동시에 처리하는 최대 조회 요청 수 (워커당)
+    ADMISSION_READ_QUEUE_SIZE: int = 200  # 대기 최대 조회 요청 수
+    ADMISSION_READ_MAX_WAIT_SECONDS: float = 0.5  # 조회 요청의 최대 대기 시간
+    ADMISSION_WRITE_CONCURRENCY: int = 5  # 동시에 처리하는 최대 쓰기 요청 수 (워커당)
+    ADMISSION_WRITE_QUEUE_SIZE: int = 100  # 대기 최대 쓰기 요청 수
+    ADMISSION_WRITE_MAX_WAIT_SECONDS: float = 2.0  # 쓰기 요청의 최대 대기 시간
+    # TODO_CREATE_COALESCE_ENABLED면 단건 생성(POST /api/v1/todos/)은 쓰기 한도 대신
+    # TODO_CREATE_COALESCE_QUEUE_SIZE 크기의 자체 한도("todo_create")를 사용 (묶음 크기가 쓰기 한도로 제한되지 않도록)
+    # 라우트별 동시 처리 한도 (초과 시 429), 예: {"GET /api/v1/todos/export": 2}
+    ADMISSION_ROUTE_LIMITS: Dict[str, int] = {}
+    # 제한하지 않는 경로 (접두사, 모니터링/장시간 연결)
+    ADMISSION_EXCLUDE_PATHS: List[str] = ["/metrics", "/api/v1/system/", "/api/v1/todos/events"]
+
+    # ✅ 목록 조회 페이지 크기
+    TODO_PAGE_SIZE_DEFAULT: int = 50  # limit 미지정 시 기본 페이지 크기
+    TODO_PAGE_SIZE_MAX: int = 500  # 한 번에 조회할 수 있는 최대 개수
+
+    # ✅ 상태별 통계 (GET /todos/stats)
+    TODO_STATS_DUE_TODAY_CACHE_SECONDS: float = 10.0  # 오늘 마감 중 지난 수를 재사용하는 시간 (초, 0이면 매번 조회)
+
+    # ✅ 일괄 생성 설정
+    TODO_BULK_MAX_ITEMS: int = 5000  # 요청 1건에 포함할 수 있는 최대 항목 수
+    TODO_BULK_CHUNK_SIZE: int = 1000  # INSERT 문 하나에 넣을 최대 행 수
+
+    # ✅ 단건 생성 묶음 처리 (동시에 들어온 POST /todos/를 다중 행 INSERT 한 번으로 처리)
+    TODO_CREATE_COALESCE_ENABLED: bool = False  # True면 사용 (요청마다 최대 WAIT_SECONDS만큼 지연될 수 있음)
+    TODO_CREATE_COALESCE_WAIT_SECONDS: float = 0.002  # 첫 요청 이후 더 모으는 최대 시간 (초)
+    TODO_CREATE_COALESCE_MAX_BATCH: int = 100  # 한 번에 처리할 최대 요청 수
+    TODO_CREATE_COALESCE_QUEUE_SIZE: int = 1000  # 워커당 대기 최대 요청 수
+    TODO_CREATE_COALESCE_ENQUEUE_TIMEOUT: float = 0.5  # 대기열이 가득 찼을 때 기다리는 시간 (초과 시 503)
+    TODO_CREATE_COALESCE_FLUSHERS: int = 2  # 동시에 처리하는 묶음 수 (묶음마다 커넥션 1개 사용)
+    TODO_CREATE_COALESCE_DRAIN_SECONDS: float = 10.0  # 종료 시 대기 중인 요청을 처리하는 최대 시간
+
+    # ✅ 단건 조회 캐시 설정
+    TODO_CACHE_ENABLED: bool = True  # False면 항상 DB에서 조회
+    TODO_CACHE_MAX_SIZE: int = 10000  # 프로세스 내 LRU 최대 항목 수
+    TODO_CACHE_TTL_SECONDS: float = 30.0  # 캐시 항목 유효 시간 (초)
+    TODO_CACHE_SHARED_BACKEND: Literal["none", "memory"] = "none"  # 공유 캐시 백엔드
+
+    # ✅ 실시간 변경 이벤트 (SSE) 설정
+    TODO_EVENTS_ENABLED: bool = True  # False면 CRUD에서 NOTIFY 하지 않음
+    TODO_EVENTS_QUEUE_SIZE: int = 1000  # 구독자별 전송 대기 최대 이벤트 수 (초과 시 연결 종료)
+    TODO_EVENTS_BUFFER_SIZE: int = 10000  # 재연결 시 이어 받을 수 있는 최근 이벤트 수
+    TODO_EVENTS_MAX_SUBSCRIBERS: int = 10000  # 워커당 최대 구독자 수
+    TODO_EVENTS_HEARTBEAT_SECONDS: float = 15.0  # 이벤트가 없을 때 연결 유지용 주석 전송 간격
+
+    # ✅ 변경 동기화 (GET /todos/changes) 설정
+    TODO_TOMBSTONE_RETENTION_DAYS: int = 30  # 삭제 기록 보관 기간 (이보다 오래된 토큰은 전체 재동기화)
+    TODO_TOMBSTONE_COMPACT_INTERVAL: float = 3600.0  # 보관 기간이 지난 삭제 기록 정리 주기 (초, 0이면 비활성화)
+    TODO_TOMBSTONE_COMPACT_BATCH_SIZE: int = 1000  # 정리 트랜잭션 하나에서 지울 최대 행 수
+
+    # ✅ 완료된 할 일 보관 (todo → todo_archive, 목록은 기본적으로 todo만 조회)
+    TODO_ARCHIVE_AFTER_DAYS: int = 90  # 완료(DONE) 후 이 기간 동안 수정이 없으면 보관
+    TODO_ARCHIVE_INTERVAL: float = 3600.0  # 보관 작업 주기 (초, 0이면 비활성화)
+    TODO_ARCHIVE_BATCH_SIZE: int = 1000  # 보관 트랜잭션 하나에서 옮길 최대 행 수
+
+    # ✅ 로깅 설정
+    LOG_ASYNC: bool = True  # 백그라운드 스레드에서 묶어서 출력 (이벤트 루프 블로킹 방지)
+    LOG_JSON: bool = False  # JSON Lines 형식으로 출력
+    LOG_QUEUE_MAX_SIZE: int = 10000  # 출력 대기 최대 레코드 수 (초과 시 버림)
+    LOG_BATCH_SIZE: int = 500  # 한 번에 기록할 최대 레코드 수
+    LOG_FLUSH_INTERVAL: float = 0.2  # 대기 중인 레코드를 기록하는 최대 간격 (초)
+    # 로거 이름(접두사)별 샘플링 비율, 예: {"sqlalchemy.engine": 0.01}
+    LOG_SAMPLING: Dict[str, float] = {}
+    # 로거 이름(접두사)별 초당 최대 레코드 수, 예: {"uvicorn.access": 100}
+    LOG_RATE_LIMITS: Dict[str, float] = {}
+
     model_config = ConfigDict(env_file=".env", extra="allow")
 
 
@@ -0,0 +1,204 @@
+# app/core/events.py
+
+import asyncio
+import logging
+from collections import deque  # 구독자 큐 / 최근 이벤트 버퍼
+from typing import Awaitable, Callable, Deque, Dict, Optional, Set, Tuple
+
+import asyncpg  # LISTEN 전용 연결 (SQLAlchemy 풀과 별도)
+
+logger = logging.getLogger(__name__)
+
+
+def sse_frame(event: str, data: str, event_id: Optional[str] = None) -> bytes:
+    """Server-Sent Events 메시지 하나를 만듭니다 (data는 한 줄 JSON)."""
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{head}event: {event}\ndata: {data}\n\n".encode()
+
+
+class Subscriber:
+    """
+    구독자 한 명의 전송 대기열 (최대 max_size개).
+    대기열이 가득 찰 만큼 느린 구독자는 퇴출(evicted)되어 스트림이 종료됩니다.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.evicted = False
+        self._frames: Deque[bytes] = deque()
+        self._ready = asyncio.Event()
+
+    def push(self, frame: bytes) -> bool:
+        if self.evicted:
+            return False
+        if len(self._frames) >= self.max_size:
+            self.evicted = True  # 더 이상 쌓지 않고 스트림을 끝내도록 알림
+            self._frames.clear()
+            self._ready.set()
+            return False
+        self._frames.append(frame)
+        self._ready.set()
+        return True
+
+    async def get(self, timeout: float) -> Optional[bytes]:
+        """
+        다음 메시지를 기다립니다.
+        :return: 메시지 bytes, timeout 동안 없으면 b"" (하트비트용), 퇴출되었으면 None
+        """
+        if not self._frames and not self.evicted:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return b""
+        if self.evicted:
+            return None
+        return self._frames.popleft()
+
+
+class EventBroker:
+    """
+    워커 하나 안에서 이벤트를 모든 구독자에게 나눠주는 브로커.
+    최근 buffer_size개 이벤트를 보관하여 재연결한 구독자가 마지막으로 받은 이벤트 이후부터 이어 받을 수 있습니다.
+    이벤트는 모든 워커에 같은 순서(커밋 순서)로 도착하므로, 다른 워커에 재연결해도 이어 받을 수 있습니다.
+    """
+
+    def __init__(self, name: str, queue_size: int, buffer_size: int, max_subscribers: int) -> None:
+        self.name = name
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self._subscribers: Set[Subscriber] = set()
+        self._buffer: Deque[Tuple[str, bytes]] = deque(maxlen=buffer_size)  # (이벤트 ID, 메시지)
+        self.published = 0  # 받은 이벤트 수
+        self.evictions = 0  # 느려서 퇴출된 구독자 수
+        self.resets = 0  # 이벤트 유실 가능성으로 재동기화를 요청한 횟수
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> Optional[Subscriber]:
+        """
+        구독자를 등록합니다. last_event_id가 있으면 그 이후 이벤트를 먼저 채워 넣고,
+        버퍼에서 찾을 수 없거나 놓친 이벤트가 대기열 크기 이상이면 전체 재조회가 필요하다는 reset 이벤트를 넣습니다.
+        :return: 구독자 또는 None (구독자 수 초과)
+        """
+        if len(self._subscribers) >= self.max_subscribers:
+            return None
+        subscriber = Subscriber(self.queue_size)
+        if last_event_id is not None:
+            missed = self._events_after(last_event_id)
+            if missed is None:
+                subscriber.push(sse_frame("reset", '{"reason":"unknown_last_event_id"}'))
+            elif len(missed) >= self.queue_size:
+                # 대기열에 다 담을 수 없으면 일부만 보내지 않고 전체 재조회 요청 (가득 찬 채로 시작하면 바로 퇴출됨)
+                subscriber.push(sse_frame("reset", '{"reason":"too_far_behind"}'))
+            else:
+                for frame in missed:
+                    subscriber.push(frame)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        self._subscribers.discard(subscriber)
+
+    def _events_after(self, last_event_id: str) -> Optional[list]:
+        frames = []
+        for event_id, frame in reversed(self._buffer):
+            if event_id == last_event_id:
+                frames.reverse()
+                return frames
+            frames.append(frame)
+        return None
+
+    def publish(self, event_id: str, frame: bytes) -> None:
+        """이벤트를 버퍼에 저장하고 모든 구독자 대기열에 넣습니다."""
+        self.published += 1
+        self._buffer.append((event_id, frame))
+        for subscriber in list(self._subscribers):
+            if not subscriber.push(frame) and subscriber.evicted:
+                self._subscribers.discard(subscriber)
+                self.evictions += 1
+
+    def reset(self, reason: str) -> None:
+        """이벤트가 유실되었을 수 있을 때 버퍼를 비우고 구독자에게 reset 이벤트를 보냅니다."""
+        self.resets += 1
+        self._buffer.clear()
+        frame = sse_frame("reset", f'{{"reason":"{reason}"}}')
+        for subscriber in list(self._subscribers):
+            subscriber.push(frame)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "subscribers": len(self._subscribers),
+            "buffered": len(self._buffer),
+            "published": self.published,
+            "evictions": self.evictions,
+            "resets": self.resets,
+        }
+
+
+class PostgresListener:
+    """
+    LISTEN 전용 asyncpg 연결 하나로 채널 알림을 받아 on_message로 전달합니다.
+    연결이 끊기면 재연결하고, 그 사이 알림이 유실되었을 수 있으므로 on_reconnect를 호출합니다.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str,
+        on_message: Callable[[str], None],
+        on_reconnect: Callable[[], None],
+        max_backoff: float = 30.0,
+    ) -> None:
+        self.dsn = dsn
+        self.channel = channel
+        self.on_message = on_message
+        self.on_reconnect = on_reconnect
+        self.max_backoff = max_backoff
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=f"listen-{self.channel}")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _notify(self, connection, pid, channel, payload) -> None:
+        try:
+            self.on_message(payload)
+        except Exception:
+            logger.exception("알림 처리 실패: %s", payload[:200])
+
+    async def _run(self) -> None:
+        backoff = 0.5
+        connected_before = False
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                closed: asyncio.Future = asyncio.get_running_loop().create_future()
+                connection.add_termination_listener(
+                    lambda _: closed.done() or closed.set_result(None)
+                )
+                await connection.add_listener(self.channel, self._notify)
+                if connected_before:
+                    self.on_reconnect()  # 끊긴 동안의 알림은 받을 수 없음
+                connected_before = True
+                backoff = 0.5
+                logger.info("LISTEN %s 시작", self.channel)
+                await closed
+                logger.warning("LISTEN %s 연결이 끊어졌습니다", self.channel)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("LISTEN %s 연결 실패: %s (%.1f초 후 재시도)", self.channel, e, backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
@@ -1,36 +1,329 @@
 # app/core/logging.py
+import atexit  # 종료 시 남은 로그 기록
+import json  # JSON Lines 출력
 import logging  # 기본 Python 로깅 모듈
+import os
+import queue  # 백그라운드 기록 스레드로 레코드 전달
+import random  # 로그 샘플링
 import sys
-from typing import List
+import threading
+import time
+import traceback
+import zipfile  # 회전된 로그 파일 압축
+from contextlib import contextmanager
+from contextvars import ContextVar  # 요청 단위 컨텍스트 (요청 ID)
+from datetime import date
+from typing import Callable, Dict, List, Optional, Tuple
 from loguru import logger  # loguru 라이브러리
 
+try:
+    import fcntl  # 워커 프로세스 간 로그 회전 잠금 (POSIX)
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+from app.core.config import settings
+from app.core.metrics import counter, request_db_stats
+
+# ✅ 요청 ID (미들웨어가 요청마다 설정, 로그 레코드에 자동으로 추가)
+request_id: ContextVar[str] = ContextVar("request_id", default="-")
+
+CONSOLE_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
+    "<level>{level: <8}</level> | "
+    "{extra[request_id]} | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level>"
+)
+FILE_FORMAT = (
+    "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {extra[request_id]} | "
+    "{name}:{function}:{line} - {message}"
+)
+LOG_FILE = "logs/app.log"
+LOG_RETENTION_DAYS = 30
+
 
 # 📌 기존 Python logging 모듈과 loguru를 연결하는 핸들러
 class InterceptHandler(logging.Handler):
     """기존 logging 모듈을 loguru로 라우팅하는 핸들러"""
 
     def emit(self, record):
+        # 📌 샘플링/개수 제한은 메시지 포맷(getMessage)과 loguru 레코드 생성 전에 판단
+        if not _sampler.allow(record.name, record.levelno):
+            return
         try:
             # 기존 logging 레벨을 loguru의 레벨로 변환
             level = logger.level(record.levelname).name
         except ValueError:
             level = record.levelno  # 변환이 불가능하면 기본 logging 레벨 사용
 
-        # 📌 로그를 호출한 코드 위치를 추적하여 loguru에서 정확한 위치를 출력할 수 있도록 설정
-        frame, depth = logging.currentframe(), 2
-        while frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back  # 한 단계 위의 프레임을 가져옴
-            depth += 1
-
-        # 📌 loguru의 logger를 사용하여 로그 출력
-        logger.opt(depth=depth, exception=record.exc_info).log(
+        # 📌 호출 위치는 LogRecord에 이미 있으므로 스택 프레임을 거슬러 올라가지 않고
+        # 레코드를 함께 넘겨 patcher(_patch_record)에서 이름/함수/줄 번호를 덮어씀
+        logger.opt(exception=record.exc_info).bind(_stdlib=record).log(
             level, record.getMessage()
         )
 
 
+# 📌 로거별 샘플링 / 초당 최대 개수 제한
+class LogSampler:
+    """
+    로거 이름의 가장 긴 접두사로 규칙을 찾아 레코드를 샘플링하거나 초당 개수를 제한합니다.
+    WARNING 이상 레코드는 항상 통과시킵니다.
+    """
+
+    def __init__(self, sampling: Dict[str, float], rate_limits: Dict[str, float]) -> None:
+        self.sampling = sampling
+        self.rate_limits = rate_limits
+        self._rules: Dict[str, Tuple[Optional[float], Optional[str]]] = {}  # 로거 이름별 캐시
+        self._buckets: Dict[str, List[float]] = {}  # 접두사 → [남은 토큰, 마지막 갱신 시각]
+        self.suppressed = {"sampled": 0, "rate_limited": 0}
+
+    @staticmethod
+    def _match(name: str, rules: Dict[str, float]) -> Optional[str]:
+        best = None
+        for prefix in rules:
+            if (name == prefix or name.startswith(prefix + ".")) and (
+                best is None or len(prefix) > len(best)
+            ):
+                best = prefix
+        return best
+
+    def _rule(self, name: str) -> Tuple[Optional[float], Optional[str]]:
+        rule = self._rules.get(name)
+        if rule is None:
+            prefix = self._match(name, self.sampling)
+            rule = self._rules[name] = (
+                self.sampling[prefix] if prefix is not None else None,
+                self._match(name, self.rate_limits),
+            )
+        return rule
+
+    def allow(self, name: str, levelno: int) -> bool:
+        if levelno >= logging.WARNING:
+            return True
+        rate, limited = self._rule(name)
+        if rate is not None and random.random() >= rate:
+            self.suppressed["sampled"] += 1
+            return False
+        if limited is not None:
+            per_second = self.rate_limits[limited]
+            now = time.monotonic()
+            bucket = self._buckets.setdefault(limited, [per_second, now])
+            bucket[0] = min(per_second, bucket[0] + (now - bucket[1]) * per_second)
+            bucket[1] = now
+            if bucket[0] < 1:
+                self.suppressed["rate_limited"] += 1
+                return False
+            bucket[0] -= 1
+        return True
+
+
+# 📌 매일 자정에 회전하고 zip으로 압축하는 로그 파일 (백그라운드 스레드 전용)
+# 여러 워커 프로세스가 같은 파일에 쓰므로 회전은 파일 잠금을 잡은 한 워커만 수행하고,
+# 나머지 워커는 이미 회전된 것을 확인한 뒤 새 파일을 다시 엶
+class DailyRotatingFile:
+    def __init__(self, path: str, retention_days: int) -> None:
+        self.path = path
+        self.retention_days = retention_days
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._open()
+
+    def _open(self) -> None:
+        self._file = open(self.path, "a", encoding="utf-8", buffering=1 << 16)
+        stat = os.fstat(self._file.fileno())
+        self._identity = (stat.st_dev, stat.st_ino)  # 다른 워커가 회전했는지 판단
+        self._day = date.fromtimestamp(stat.st_mtime) if stat.st_size else date.today()
+
+    def write(self, text: str) -> None:
+        if date.today() != self._day:
+            self._rotate()
+        self._file.write(text)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    @contextmanager
+    def _rotation_lock(self):
+        if fcntl is None:  # 잠금을 지원하지 않는 플랫폼 (로컬 개발, 단일 프로세스)
+            yield
+            return
+        with open(self.path + ".lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _is_current(self) -> bool:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        return (stat.st_dev, stat.st_ino) == self._identity
+
+    def _rotate(self) -> None:
+        self._file.close()
+        with self._rotation_lock():
+            if self._is_current():  # 아직 아무 워커도 회전하지 않음
+                stem, ext = os.path.splitext(self.path)
+                rotated = f"{stem}.{self._day.isoformat()}{ext}"
+                # 경로에서 떼어 낸 뒤 압축 (다른 워커는 다음 write에서 날짜가 바뀐 것을 보고 새 파일을 엶)
+                os.replace(self.path, rotated)
+                with zipfile.ZipFile(rotated + ".zip", "a", zipfile.ZIP_DEFLATED) as archive:
+                    archive.write(rotated, os.path.basename(rotated))
+                os.remove(rotated)
+                self._remove_expired(stem, ext)
+            self._open()
+
+    def _remove_expired(self, stem: str, ext: str) -> None:
+        # retention 기간이 지난 압축 파일 삭제
+        directory = os.path.dirname(self.path) or "."
+        expire_before = time.time() - self.retention_days * 86400
+        prefix = os.path.basename(stem) + "."
+        for name in os.listdir(directory):
+            candidate = os.path.join(directory, name)
+            if (
+                name.startswith(prefix)
+                and name.endswith(ext + ".zip")
+                and os.path.getmtime(candidate) < expire_before
+            ):
+                os.remove(candidate)
+
+
+# 📌 큐에 쌓인 레코드를 백그라운드 스레드에서 묶어서 기록하는 loguru sink
+class BatchingSink:
+    """
+    이벤트 루프 스레드에서는 큐에 넣기만 하고, 기록 스레드가 최대 batch_size개씩
+    모아 write 한 번 + flush 한 번으로 출력합니다. 큐가 가득 차면 레코드를 버립니다.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        name: str,
+        stream,
+        render: Callable,
+        max_size: int,
+        batch_size: int,
+        flush_interval: float,
+    ) -> None:
+        self.name = name
+        self.stream = stream
+        self.render = render  # loguru 메시지 → 출력할 문자열 (기록 스레드에서 실행)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_size)
+        self._thread = threading.Thread(target=self._run, name=f"log-writer-{name}", daemon=True)
+        self._thread.start()
+
+    def __call__(self, message) -> None:
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.batch_size and batch[-1] is not self._STOP:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is self._STOP:
+                batch.pop()
+                stopping = True
+            if batch:
+                try:
+                    self.stream.write("".join(self.render(m) for m in batch))
+                    self.stream.flush()
+                except Exception:  # 로그 기록 실패가 애플리케이션을 멈추지 않도록
+                    traceback.print_exc(file=sys.stderr)
+
+    def stop(self) -> None:
+        """남은 레코드를 모두 기록하고 스레드를 종료합니다."""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+        if hasattr(self.stream, "close") and self.stream not in (sys.stdout, sys.stderr):
+            self.stream.close()
+
+
+# 📌 레코드 → 출력 문자열 변환 (BatchingSink의 기록 스레드에서 실행)
+def _render_text(message) -> str:
+    return str(message)
+
+
+def _render_json(message) -> str:
+    record = message.record
+    extra = record["extra"]
+    data = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "logger": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "message": record["message"],
+        "requestId": extra.get("request_id"),
+    }
+    if "db_statements" in extra:
+        data["dbStatements"] = extra["db_statements"]
+        data["dbMs"] = extra["db_ms"]
+    if record["exception"] is not None:
+        data["exception"] = "".join(traceback.format_exception(*record["exception"]))
+    return json.dumps(data, ensure_ascii=False, default=str) + "\n"
+
+
+_sampler = LogSampler({}, {})
+_sinks: List[BatchingSink] = []
+
+LOG_RECORDS_SUPPRESSED = counter(
+    "log_records_suppressed_total",
+    "샘플링/개수 제한/큐 초과로 기록하지 않은 로그 레코드 수",
+    ("reason",),
+    callback=lambda: [
+        *(((reason,), count) for reason, count in _sampler.suppressed.items()),
+        (("queue_full",), sum(sink.dropped for sink in _sinks)),
+    ],
+)
+
+
+# 📌 모든 레코드에 요청 컨텍스트를 붙이고 loguru로 직접 남긴 레코드의 샘플링 여부를 결정 (레코드당 1회 실행)
+def _patch_record(record) -> None:
+    extra = record["extra"]
+    origin = extra.pop("_stdlib", None)
+    if origin is not None:
+        record["name"] = origin.name
+        record["function"] = origin.funcName
+        record["line"] = origin.lineno
+
+    extra["request_id"] = request_id.get()
+    stats = request_db_stats.get()
+    if stats is not None:
+        extra["db_statements"] = stats.statements
+        extra["db_ms"] = round(stats.seconds * 1000, 3)
+
+    # logging 모듈 레코드는 InterceptHandler에서 이미 샘플링됨
+    if origin is None and not _sampler.allow(record["name"] or "", record["level"].no):
+        extra["_drop"] = True
+
+
+def _keep_record(record) -> bool:
+    return "_drop" not in record["extra"]
+
+
 # 📌 로깅 시스템을 설정하는 함수
 def setup_logging():
     """Python 기본 logging을 loguru 기반으로 설정"""
+    global _sampler
 
     # 1️⃣ 기본 logging 핸들러를 InterceptHandler()로 교체하여 loguru로 로그를 전송
     logging.root.handlers = [InterceptHandler()]
@@ -41,25 +334,71 @@ def setup_logging():
         logging.getLogger(name).handlers = []  # 기존 핸들러 제거
         logging.getLogger(name).propagate = True  # 상위 로거로 전파 활성화
 
-    # 3️⃣ loguru 설정 적용 (콘솔 출력 + 파일 로깅)
-    logger.configure(
-        handlers=[
+    # 3️⃣ 샘플링 / 초당 개수 제한 규칙 적용
+    _sampler = LogSampler(settings.LOG_SAMPLING, settings.LOG_RATE_LIMITS)
+    previous = _sinks[:]  # 다시 설정하는 경우 교체 후 이전 기록 스레드 정리
+    _sinks.clear()
+
+    # 4️⃣ loguru 설정 적용 (콘솔 출력 + 파일 로깅)
+    if settings.LOG_ASYNC:
+        # ✅ 이벤트 루프에서는 큐에 넣기만 하고 백그라운드 스레드가 묶어서 기록
+        render = _render_json if settings.LOG_JSON else _render_text
+        options = {
+            "max_size": settings.LOG_QUEUE_MAX_SIZE,
+            "batch_size": settings.LOG_BATCH_SIZE,
+            "flush_interval": settings.LOG_FLUSH_INTERVAL,
+        }
+        console = BatchingSink("console", sys.stdout, render, **options)
+        logfile = BatchingSink(
+            "file", DailyRotatingFile(LOG_FILE, LOG_RETENTION_DAYS), render, **options
+        )
+        _sinks.extend([console, logfile])
+        # JSON은 기록 스레드에서 레코드로 직접 만들므로 루프에서는 메시지만 포맷
+        handlers = [
+            {
+                "sink": console,
+                "format": "{message}" if settings.LOG_JSON else CONSOLE_FORMAT,
+                "colorize": not settings.LOG_JSON and sys.stdout.isatty(),
+                "filter": _keep_record,
+            },
+            {
+                "sink": logfile,
+                "format": "{message}" if settings.LOG_JSON else FILE_FORMAT,
+                "filter": _keep_record,
+            },
+        ]
+    else:
+        handlers = [
             {
                 # ✅ 터미널에 컬러 포맷으로 로그 출력
                 "sink": sys.stdout,
-                "format": "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
-                "<level>{level: <8}</level> | "
-                "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-                "<level>{message}</level>",
+                "format": CONSOLE_FORMAT,
+                "serialize": settings.LOG_JSON,
+                "filter": _keep_record,
             },
             {
                 # ✅ 로그를 파일(`logs/app.log`)에 저장
-                "sink": "logs/app.log",
+                "sink": LOG_FILE,
                 "rotation": "00:00",  # 매일 자정에 새로운 로그 파일 생성
                 "compression": "zip",  # 이전 로그 파일을 zip으로 압축
-                "retention": "30 days",  # 30일 동안 로그 보관 후 자동 삭제
-                "format": "{time:YYYY-MM-DD HH:mm:ss.SSS} | "
-                "{level: <8} | {name}:{function}:{line} - {message}",
+                "retention": f"{LOG_RETENTION_DAYS} days",  # 30일 동안 로그 보관 후 자동 삭제
+                "format": FILE_FORMAT,
+                "serialize": settings.LOG_JSON,
+                "filter": _keep_record,
             },
         ]
+
+    logger.configure(
+        handlers=handlers, extra={"request_id": "-"}, patcher=_patch_record
     )
+    for sink in previous:
+        sink.stop()
+
+
+def shutdown_logging() -> None:
+    """백그라운드 기록 스레드에 남은 로그를 모두 기록하고 종료합니다."""
+    while _sinks:
+        _sinks.pop().stop()
+
+
+atexit.register(shutdown_logging)
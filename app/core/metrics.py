@@ -0,0 +1,236 @@
+# app/core/metrics.py
+
+import bisect  # 히스토그램 버킷 탐색
+from contextvars import ContextVar  # 요청 단위 DB 통계 저장
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# ✅ Prometheus 텍스트 형식(exposition format)을 직접 출력하는 최소 구현
+# 외부 의존성 없이 요청 경로에서 dict 조회/덧셈만 수행하도록 단순하게 유지합니다.
+
+LabelValues = Tuple[str, ...]
+Sample = Tuple[str, Dict[str, str], float]  # (이름, 라벨, 값)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    """모든 메트릭의 공통 속성 (이름, 설명, 라벨 이름)"""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def samples(self) -> Iterable[Sample]:
+        raise NotImplementedError
+
+    def _labels(self, values: LabelValues) -> Dict[str, str]:
+        return dict(zip(self.labelnames, values))
+
+
+class Counter(Metric):
+    """
+    단조 증가 카운터 (직접 증가시키거나, 다른 곳에서 누적한 값을 callback으로 수집)
+    이름은 Prometheus 관례에 따라 _total로 끝나야 합니다.
+    """
+
+    type_name = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], Iterable[Tuple[LabelValues, float]]]] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._callback = callback
+        if not self.labelnames:
+            self._values[()] = 0.0  # 라벨 없는 카운터는 0부터 노출
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def samples(self) -> Iterable[Sample]:
+        items = self._callback() if self._callback else list(self._values.items())
+        for values, total in items:
+            yield self.name, self._labels(values), total
+
+
+class Gauge(Metric):
+    """현재 값을 나타내는 게이지 (직접 설정하거나, 수집 시점에 callback으로 계산)"""
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], Iterable[Tuple[LabelValues, float]]]] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._callback = callback
+
+    def set(self, value: float, *labelvalues: str) -> None:
+        self._values[labelvalues] = value
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def dec(self, *labelvalues: str, amount: float = 1.0) -> None:
+        self.inc(*labelvalues, amount=-amount)
+
+    def samples(self) -> Iterable[Sample]:
+        items = self._callback() if self._callback else list(self._values.items())
+        for values, value in items:
+            yield self.name, self._labels(values), value
+
+
+class Histogram(Metric):
+    """누적 버킷 히스토그램"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 값 → [버킷별 개수..., +Inf 개수], 합계
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        counts = self._counts.get(labelvalues)
+        if counts is None:
+            counts = self._counts[labelvalues] = [0] * (len(self.buckets) + 1)
+            self._sums[labelvalues] = 0.0
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self._sums[labelvalues] += value
+
+    def samples(self) -> Iterable[Sample]:
+        for values, counts in list(self._counts.items()):
+            labels = self._labels(values)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield f"{self.name}_count", labels, cumulative
+            yield f"{self.name}_sum", labels, self._sums[values]
+
+
+class Registry:
+    """메트릭 목록을 보관하고 Prometheus 텍스트 형식으로 출력합니다."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def counter(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str] = (),
+    callback: Optional[Callable[[], Iterable[Tuple[LabelValues, float]]]] = None,
+) -> Counter:
+    return REGISTRY.register(Counter(name, documentation, labelnames, callback))
+
+
+def gauge(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str] = (),
+    callback: Optional[Callable[[], Iterable[Tuple[LabelValues, float]]]] = None,
+) -> Gauge:
+    return REGISTRY.register(Gauge(name, documentation, labelnames, callback))
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str] = (),
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> Histogram:
+    return REGISTRY.register(Histogram(name, documentation, labelnames, buckets))
+
+
+# ✅ 요청 단위 DB 사용량 (미들웨어가 요청마다 새로 설정, 엔진 이벤트 훅이 누적)
+class RequestDBStats:
+    __slots__ = ("statements", "seconds")
+
+    def __init__(self) -> None:
+        self.statements = 0  # 실행한 SQL 문 수
+        self.seconds = 0.0  # DB에서 보낸 시간 (초)
+
+
+request_db_stats: ContextVar[Optional[RequestDBStats]] = ContextVar(
+    "request_db_stats", default=None
+)
+
+
+# ✅ 애플리케이션 공통 메트릭
+HTTP_REQUESTS = counter(
+    "http_requests_total", "처리한 HTTP 요청 수", ("method", "route", "status")
+)
+HTTP_REQUEST_DURATION = histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (초)", ("method", "route")
+)
+HTTP_REQUEST_DB_STATEMENTS = histogram(
+    "http_request_db_statements",
+    "HTTP 요청 하나가 실행한 SQL 문 수",
+    ("method", "route"),
+    buckets=(0, 1, 2, 3, 4, 5, 8, 13, 21, 50, 100),
+)
+HTTP_REQUEST_DB_DURATION = histogram(
+    "http_request_db_duration_seconds",
+    "HTTP 요청 하나가 DB에서 보낸 시간 (초)",
+    ("method", "route"),
+)
+DB_STATEMENTS = counter("db_statements_total", "실행한 SQL 문 수")
+DB_STATEMENT_DURATION = histogram(
+    "db_statement_duration_seconds", "SQL 문 하나의 실행 시간 (초)"
+)
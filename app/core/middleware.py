@@ -0,0 +1,228 @@
+# app/core/middleware.py
+
+import time  # 요청 처리 시간 측정
+import uuid  # 요청 ID 생성
+from typing import Dict, List, Optional, Sequence
+
+from starlette.datastructures import MutableHeaders
+from starlette.responses import JSONResponse  # 과부하 거절 응답
+from starlette.routing import Match  # 라우트별 한도 적용 시 라우트 찾기
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.admission import AdmissionRejected, ConcurrencyLimiter
+
+from app.core.logging import request_id
+from app.core.startup import startup  # 첫 요청 완료 시각 기록
+
+from app.core.metrics import (
+    HTTP_REQUEST_DB_DURATION,
+    HTTP_REQUEST_DB_STATEMENTS,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    RequestDBStats,
+    request_db_stats,
+)
+
+
+def route_label(scope: Scope) -> str:
+    """
+    메트릭 라벨로 사용할 경로 템플릿을 반환합니다 (예: /api/v1/todos/{todo_id}).
+    매칭된 라우트가 없으면 라벨 종류가 무한히 늘지 않도록 "unmatched"로 묶습니다.
+    """
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or getattr(route, "path", "unmatched")
+
+
+class MetricsMiddleware:
+    """
+    라우트별 요청 수/처리 시간과 요청 하나당 SQL 문 수/DB 시간을 기록하는 ASGI 미들웨어.
+    BaseHTTPMiddleware를 쓰지 않고 ASGI 수준에서 동작하여 요청당 오버헤드를 최소화합니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500  # 응답 시작 전에 예외가 나면 500으로 기록
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestDBStats()
+        token = request_db_stats.set(stats)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            request_db_stats.reset(token)
+
+            method = scope["method"]
+            route = route_label(scope)
+            HTTP_REQUESTS.inc(method, route, str(status_code))
+            HTTP_REQUEST_DURATION.observe(elapsed, method, route)
+            HTTP_REQUEST_DB_STATEMENTS.observe(stats.statements, method, route)
+            HTTP_REQUEST_DB_DURATION.observe(stats.seconds, method, route)
+            startup.request_finished()
+
+
+class RequestIdMiddleware:
+    """
+    요청마다 요청 ID를 정해 로그 컨텍스트(request_id)에 설정하고 X-Request-ID 응답 헤더로 돌려줍니다.
+    클라이언트가 X-Request-ID를 보내면 그대로 사용합니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        value = None
+        for key, raw in scope["headers"]:
+            if key == b"x-request-id":
+                value = raw.decode("latin-1")[:128]
+                break
+        value = value or uuid.uuid4().hex
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Request-ID", value)
+            await send(message)
+
+        token = request_id.set(value)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_id.reset(token)
+
+
+# 쓰기 직후 조회를 주 DB로 보내기 위한 쿠키 (값: 이 시각(Unix 초)까지 주 DB에서 조회)
+READ_PRIMARY_COOKIE = "read_primary_until"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ReadYourWritesMiddleware:
+    """
+    쓰기 요청(POST/PUT/PATCH/DELETE)이 성공하면 window초 동안 유효한 쿠키를 응답에 추가합니다.
+    조회 세션 의존성(get_read_db)은 이 쿠키가 유효한 동안 복제본 대신 주 DB를 사용하므로,
+    클라이언트는 복제 지연과 관계없이 자신이 방금 쓴 내용을 바로 읽을 수 있습니다.
+    """
+
+    def __init__(self, app: ASGIApp, window: float) -> None:
+        self.app = app
+        self.window = window
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = time.time() + self.window
+                MutableHeaders(scope=message).append(
+                    "Set-Cookie",
+                    f"{READ_PRIMARY_COOKIE}={until:.3f}; Max-Age={int(self.window) + 1}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class AdmissionControlMiddleware:
+    """
+    조회(GET/HEAD/OPTIONS)와 쓰기 요청을 각각의 동시 처리 한도(ConcurrencyLimiter)로 받아들이는 ASGI 미들웨어.
+    DB가 느려져도 요청이 커넥션 풀 대기(get_db)로 무한히 쌓이지 않도록, 한도를 넘은 요청은 제한된 대기열에서
+    기한(max_wait)까지만 기다리게 하고 그 안에 처리될 수 없으면 Retry-After와 함께 바로 503으로 거절합니다.
+    route_limiters에 지정한 라우트("GET /api/v1/todos/export" 형식)는 라우트별 한도를 먼저 적용하며,
+    라우트 한도를 넘으면 429로 거절합니다. exclude_paths로 시작하는 경로(모니터링, SSE 등)는 제한하지 않습니다.
+    own_limiters에 지정한 라우트는 조회/쓰기 한도 대신 자기 한도를 사용합니다 (자체 대기열이 있는 묶음 처리 등).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        read: ConcurrencyLimiter,
+        write: ConcurrencyLimiter,
+        route_limiters: Optional[Dict[str, ConcurrencyLimiter]] = None,
+        exclude_paths: Sequence[str] = (),
+        own_limiters: Optional[Dict[str, ConcurrencyLimiter]] = None,
+    ) -> None:
+        self.app = app
+        self.read = read
+        self.write = write
+        self.route_limiters = route_limiters or {}
+        self.exclude_paths = tuple(exclude_paths)
+        self.own_limiters = own_limiters or {}
+
+    @staticmethod
+    def _route_key(scope: Scope) -> Optional[str]:
+        # 라우팅 전이므로 라우트 템플릿을 직접 찾음 (라우트별 한도가 있을 때만)
+        for route in scope["app"].router.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return f"{scope['method']} {route.path}"
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+
+        limiter = self.read if scope["method"] in SAFE_METHODS else self.write
+        route_limiter = None
+        if self.route_limiters or self.own_limiters:
+            key = self._route_key(scope)
+            limiter = self.own_limiters.get(key, limiter)
+            route_limiter = self.route_limiters.get(key)
+        deadline = time.perf_counter() + limiter.max_wait
+        acquired: List[ConcurrencyLimiter] = []
+        try:
+            if route_limiter is not None:
+                try:
+                    await route_limiter.acquire(deadline)
+                except AdmissionRejected as e:
+                    await self._reject(scope, receive, send, 429, e)
+                    return
+                acquired.append(route_limiter)
+            try:
+                await limiter.acquire(deadline)
+            except AdmissionRejected as e:
+                await self._reject(scope, receive, send, 503, e)
+                return
+            acquired.append(limiter)
+
+            started = time.perf_counter()
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                elapsed = time.perf_counter() - started
+                for each in reversed(acquired):
+                    each.release(elapsed)
+                acquired = []
+        finally:
+            # 거절/취소되면 이미 받은 라우트 순서를 반납 (처리하지 않았으므로 처리 시간은 갱신하지 않음)
+            for each in acquired:
+                each.release()
+
+    @staticmethod
+    async def _reject(
+        scope: Scope, receive: Receive, send: Send, status_code: int, error: AdmissionRejected
+    ) -> None:
+        response = JSONResponse(
+            {"detail": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요"},
+            status_code=status_code,
+            headers={"Retry-After": error.retry_after_header},
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,78 @@
+# app/core/startup.py
+
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+from app.core.metrics import gauge
+
+logger = logging.getLogger(__name__)
+
+
+def _process_started_at() -> Optional[float]:
+    """현재 프로세스의 시작 시각 (Unix 초, Linux /proc 기준, 확인할 수 없으면 None)"""
+    try:
+        with open("/proc/self/stat") as f:
+            # comm(2번째 필드)에 공백이 있을 수 있으므로 마지막 ')' 뒤부터 나눔
+            fields = f.read().rsplit(")", 1)[1].split()
+        start_ticks = int(fields[19])  # 22번째 필드: 부팅 후 시작까지의 clock tick
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        # /proc/stat의 btime은 초 단위로 잘리므로 uptime 기준으로 계산
+        return time.time() - (uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class StartupTimer:
+    """
+    워커 프로세스의 시작 단계별 경과 시간을 기록합니다 (프로세스 시작 기준, 초).
+    첫 요청이 끝나면 전체 보고를 한 번 로그로 남깁니다.
+    """
+
+    def __init__(self) -> None:
+        now = time.time()
+        started = _process_started_at()
+        # /proc을 읽을 수 없으면 이 모듈을 처음 임포트한 시각 기준
+        self.started_at = started if started is not None and started <= now else now
+        self.phases: Dict[str, float] = {}
+        self.first_request: Optional[float] = None
+
+    def elapsed(self) -> float:
+        return time.time() - self.started_at
+
+    def mark(self, phase: str) -> None:
+        """phase 단계가 끝난 시점을 기록합니다."""
+        self.phases[phase] = round(self.elapsed(), 4)
+
+    def request_finished(self) -> None:
+        """요청이 끝날 때마다 호출 (첫 요청만 기록)"""
+        if self.first_request is not None:
+            return
+        self.first_request = round(self.elapsed(), 4)
+        logger.info(
+            "워커 %d 시작 시간: %s, 첫 요청 완료 %.3fs",
+            os.getpid(),
+            ", ".join(f"{name} {seconds:.3f}s" for name, seconds in self.phases.items()),
+            self.first_request,
+        )
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "startedAt": self.started_at,
+            "phases": self.phases,
+            "firstRequest": self.first_request,
+        }
+
+
+startup = StartupTimer()
+
+gauge(
+    "app_startup_seconds",
+    "워커 프로세스 시작부터 각 단계가 끝날 때까지 걸린 시간 (초)",
+    ("phase",),
+    callback=lambda: [((phase,), seconds) for phase, seconds in startup.phases.items()]
+    + ([(("first_request",), startup.first_request)] if startup.first_request else []),
+)
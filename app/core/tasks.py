@@ -0,0 +1,45 @@
+# app/core/tasks.py
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """
+    워커 안에서 interval초마다 job을 실행하는 백그라운드 작업.
+    실패해도 다음 주기에 다시 실행하며, 여러 워커에서 동시에 실행될 수 있으므로 job은 멱등이어야 합니다.
+    """
+
+    def __init__(
+        self, name: str, interval: float, job: Callable[[], Awaitable[None]]
+    ) -> None:
+        self.name = name
+        self.interval = interval
+        self.job = job
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.job()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("%s 작업 실패", self.name)
@@ -1,19 +1,109 @@
 # app/db/base.py
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy import event  # 엔진 이벤트 훅
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from app.core.config import settings  # 환경 변수에서 DB 설정을 불러옴
+from app.core.metrics import (  # SQL 실행 메트릭
+    DB_STATEMENT_DURATION,
+    DB_STATEMENTS,
+    gauge,
+    request_db_stats,
+)
+from app.db.pool import (  # 커넥션 풀 옵션 생성 및 상태 조회
+    pool_options,
+    pool_status,
+    track_connection_hold,
+)
+from app.db.statements import (  # prepared statement 캐시/기본 실행 시간 한도 옵션, 적중 기록
+    connect_args,
+    track_statements,
+)
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
-# ✅ 비동기 SQLAlchemy 엔진 생성 (Azure PostgreSQL 연결)
-engine = create_async_engine(
-    settings.ASYNC_DATABASE_URL,  # 환경 변수에서 DB URL 가져오기
-    echo=settings.DB_ECHO_LOG,  # SQL 쿼리 로그 출력 여부
-    future=True,  # SQLAlchemy 2.x 스타일 사용
-    pool_pre_ping=True,  # 연결 풀에서 비정상 연결을 감지하여 복구
-    poolclass=NullPool,  # 연결 풀 비활성화 (Azure에서는 개별 연결 관리가 일반적)
+
+# ✅ SQL 문 실행 시간 측정 (요청 단위 SQL 문 수/DB 시간 집계 → N+1, 불필요한 왕복 탐지)
+# 시작 시각은 문 단위 실행 컨텍스트에 저장 (실패한 문도 커넥션에 기록이 남지 않음)
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_started
+    DB_STATEMENTS.inc()
+    DB_STATEMENT_DURATION.observe(elapsed)
+
+    stats = request_db_stats.get()  # HTTP 요청 밖(시작/백그라운드 작업)에서는 None
+    if stats is not None:
+        stats.statements += 1
+        stats.seconds += elapsed
+
+
+def make_engine(url: str) -> AsyncEngine:
+    """
+    DB_POOL_*/prepared statement 캐시/기본 실행 시간 한도 설정과 SQL 실행 메트릭을 적용한 비동기 엔진을 만듭니다 (주 DB/읽기 복제본 공통).
+    :param url: 비동기 DB URL (postgresql+asyncpg://...)
+    """
+    new_engine = create_async_engine(
+        url,
+        echo=settings.DB_ECHO_LOG,  # SQL 쿼리 로그 출력 여부
+        future=True,  # SQLAlchemy 2.x 스타일 사용
+        connect_args=connect_args(settings),  # prepared statement 캐시/pgbouncer 모드/기본 실행 시간 한도
+        **pool_options(settings),  # 풀 종류/크기/재활용 주기 등 (DB_POOL_* 설정)
+    )
+    event.listen(new_engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(new_engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    track_connection_hold(new_engine.sync_engine)
+    track_statements(new_engine.sync_engine)
+    return new_engine
+
+
+def read_only_engine(source: AsyncEngine, standby: bool = False) -> AsyncEngine:
+    """
+    source와 풀을 공유하면서 DB_READ_TRANSACTION 방식으로 트랜잭션을 시작하는 조회 전용 엔진을 만듭니다.
+    READ ONLY/DEFERRABLE은 BEGIN 문에 함께 실리므로 추가 왕복이 없습니다.
+    :param source: 주 DB 또는 복제본 엔진
+    :param standby: 복제본이면 True (SERIALIZABLE 불가)
+    """
+    mode = settings.DB_READ_TRANSACTION
+    if mode == "autocommit":
+        return source.execution_options(isolation_level="AUTOCOMMIT")
+    if mode == "deferrable" and not standby:
+        return source.execution_options(
+            isolation_level="SERIALIZABLE",
+            postgresql_readonly=True,
+            postgresql_deferrable=True,
+        )
+    return source.execution_options(postgresql_readonly=True)
+
+
+# ✅ 비동기 SQLAlchemy 엔진 생성 (Azure PostgreSQL 연결, 모든 쓰기는 이 주 DB로)
+engine = make_engine(settings.ASYNC_DATABASE_URL)
+
+
+def _pool_connection_samples():
+    status = pool_status(engine.pool)
+    if status["mode"] != "queue":
+        return []
+    return [
+        (("in_use",), status["inUse"]),
+        (("idle",), status["checkedIn"]),
+        (("overflow",), status["overflow"]),
+    ]
+
+
+gauge(
+    "db_pool_connections",
+    "커넥션 풀 상태별 커넥션 수",
+    ("state",),
+    callback=_pool_connection_samples,
 )
 
 # ✅ 비동기 세션 팩토리 생성 (세션 관리를 위한 Factory)
@@ -0,0 +1,135 @@
+# app/db/pool.py
+
+import time  # 체크아웃 대기 시간 측정
+from typing import Any, Dict
+
+from sqlalchemy import event  # 체크아웃/체크인 훅
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError  # 풀 대기 시간 초과 예외
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool
+
+from app.core.metrics import counter, histogram
+
+POOL_CHECKOUT_WAIT = histogram(
+    "db_pool_checkout_wait_seconds",
+    "커넥션 풀 체크아웃 대기 시간 (초)",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+POOL_CHECKOUT_TIMEOUTS = counter(
+    "db_pool_checkout_timeouts_total", "pool_timeout 초과로 실패한 체크아웃 수"
+)
+POOL_CONNECTION_HOLD = histogram(
+    "db_pool_connection_hold_seconds",
+    "커넥션을 체크아웃해서 반환할 때까지 사용한 시간 (초)",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+
+
+class PoolStats:
+    """커넥션 체크아웃 대기 시간을 누적하는 통계 객체"""
+
+    def __init__(self) -> None:
+        self.checkouts = 0  # 체크아웃 성공 횟수
+        self.timeouts = 0  # pool_timeout 초과로 실패한 횟수
+        self.wait_total = 0.0  # 누적 대기 시간 (초)
+        self.wait_max = 0.0  # 최대 대기 시간 (초)
+
+    def observe(self, elapsed: float) -> None:
+        """체크아웃 1회의 대기 시간을 기록합니다."""
+        self.checkouts += 1
+        self.wait_total += elapsed
+        if elapsed > self.wait_max:
+            self.wait_max = elapsed
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    체크아웃 대기 시간을 기록하는 AsyncAdaptedQueuePool.
+    대기 시간에는 overflow로 새 연결을 여는 시간도 포함됩니다.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except PoolTimeoutError:
+            self.stats.timeouts += 1
+            POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        elapsed = time.perf_counter() - started
+        self.stats.observe(elapsed)
+        POOL_CHECKOUT_WAIT.observe(elapsed)
+        return entry
+
+    def recreate(self) -> "TimedAsyncAdaptedQueuePool":
+        # ✅ 풀을 재생성해도(dispose 등) 누적 통계는 유지
+        new_pool = super().recreate()
+        new_pool.stats = self.stats
+        return new_pool
+
+
+def track_connection_hold(sync_engine: Engine) -> None:
+    """엔진의 커넥션 사용 시간(체크아웃 ~ 체크인)을 db_pool_connection_hold_seconds에 기록합니다."""
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    def on_checkin(dbapi_connection, connection_record) -> None:
+        started = connection_record.info.pop("checked_out_at", None)
+        if started is not None:
+            POOL_CONNECTION_HOLD.observe(time.perf_counter() - started)
+
+    event.listen(sync_engine, "checkout", on_checkout)
+    event.listen(sync_engine, "checkin", on_checkin)
+
+
+def pool_options(settings) -> Dict[str, Any]:
+    """
+    Settings 값으로 create_async_engine에 전달할 풀 옵션을 만듭니다.
+    :param settings: 애플리케이션 설정
+    :return: 엔진 생성 인자 딕셔너리
+    """
+    if settings.DB_POOL_MODE == "null":
+        # pgbouncer 등 외부 풀러가 연결을 관리하는 환경에서만 사용
+        return {"poolclass": NullPool, "pool_pre_ping": settings.DB_POOL_PRE_PING}
+
+    return {
+        "poolclass": TimedAsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_POOL_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_use_lifo": settings.DB_POOL_USE_LIFO,
+    }
+
+
+def pool_status(pool: Pool) -> Dict[str, Any]:
+    """
+    현재 풀 상태(사용 중/overflow 커넥션 수, 체크아웃 대기 시간)를 반환합니다.
+    :param pool: 엔진의 커넥션 풀 (engine.pool)
+    :return: 풀 상태 딕셔너리
+    """
+    if not isinstance(pool, TimedAsyncAdaptedQueuePool):
+        return {"mode": "null"}
+
+    stats = pool.stats
+    return {
+        "mode": "queue",
+        "size": pool.size(),  # 설정된 pool_size
+        "checkedIn": pool.checkedin(),  # 풀에서 대기 중인 유휴 커넥션
+        "inUse": pool.checkedout(),  # 현재 요청이 사용 중인 커넥션
+        "overflow": max(pool.overflow(), 0),  # pool_size를 초과해 열린 커넥션
+        "maxOverflow": pool._max_overflow,
+        "checkouts": stats.checkouts,
+        "timeouts": stats.timeouts,
+        "waitSecondsTotal": round(stats.wait_total, 6),
+        "waitSecondsMax": round(stats.wait_max, 6),
+        "waitSecondsAvg": (
+            round(stats.wait_total / stats.checkouts, 6) if stats.checkouts else 0.0
+        ),
+    }
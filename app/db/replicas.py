@@ -0,0 +1,155 @@
+# app/db/replicas.py
+
+import asyncio
+import itertools  # 라운드 로빈
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings  # 복제본 URL/지연 허용치 설정
+from app.core.metrics import counter, gauge
+from app.core.tasks import PeriodicTask  # 주기적인 상태 확인
+from app.db.base import engine, make_engine, read_only_engine  # 주 DB 엔진
+from app.db.pool import pool_status
+
+logger = logging.getLogger(__name__)
+
+# 복제 지연 (초): 받은 WAL을 모두 재생했으면 0, 주 DB(복제본이 아닌 서버)면 NULL
+_LAG_QUERY = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() "
+    "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+DB_READ_ROUTED = counter(
+    "db_read_routed_total",
+    "조회 세션을 연결한 대상 수 (replica: 복제본, primary: 주 DB, sticky: 쓰기 직후라 주 DB)",
+    ("target",),
+)
+
+
+class Replica:
+    """읽기 복제본 하나의 엔진과 최근 상태 확인 결과"""
+
+    def __init__(self, url: str) -> None:
+        parsed = make_url(url)
+        host = parsed.host or parsed.query.get("host", "localhost")  # 유닉스 소켓이면 ?host=
+        self.name = f"{host}:{parsed.port or 5432}"  # 메트릭/상태 조회용 (비밀번호 제외)
+        self.engine: AsyncEngine = make_engine(url)
+        self.read_engine = read_only_engine(self.engine, standby=True)  # 조회 세션용 (풀 공유)
+        self.healthy = True  # 첫 상태 확인 전에는 사용 가능한 것으로 간주
+        self.lag_seconds: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self.error: Optional[str] = None
+
+    async def check(self, max_lag: float) -> None:
+        """연결 가능 여부와 복제 지연을 확인해 healthy를 갱신합니다."""
+        try:
+            async with self.engine.connect() as conn:
+                lag = await asyncio.wait_for(conn.scalar(_LAG_QUERY), timeout=max_lag)
+            self.lag_seconds = float(lag or 0)
+            self.error = None
+            healthy = self.lag_seconds <= max_lag
+        except Exception as e:
+            self.error = str(e)[:200]
+            healthy = False
+        if healthy != self.healthy:
+            logger.warning(
+                "읽기 복제본 %s %s (지연 %s초, %s)",
+                self.name,
+                "복구" if healthy else "제외",
+                self.lag_seconds,
+                self.error,
+            )
+        self.healthy = healthy
+        self.checked_at = time.time()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "healthy": self.healthy,
+            "lagSeconds": self.lag_seconds,
+            "checkedAt": self.checked_at,
+            "error": self.error,
+            "pool": pool_status(self.engine.pool),
+        }
+
+
+class ReplicaSet:
+    """
+    읽기 복제본 목록. 정상인 복제본을 라운드 로빈으로 고르고,
+    정상인 복제본이 없거나 설정되지 않았으면 주 DB 엔진을 반환합니다.
+    """
+
+    def __init__(self, urls: List[str], max_lag: float) -> None:
+        self.replicas = [Replica(url) for url in urls]
+        self.max_lag = max_lag
+        self._next = itertools.count()
+        self.primary = read_only_engine(engine)  # 복제본이 없거나 쓰기 직후일 때의 조회 엔진
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def pick(self) -> Optional[Replica]:
+        """다음 정상 복제본 (없으면 None)"""
+        count = len(self.replicas)
+        start = next(self._next)
+        for offset in range(count):
+            replica = self.replicas[(start + offset) % count]
+            if replica.healthy:
+                return replica
+        return None
+
+    def read_engine(self, sticky: bool = False) -> AsyncEngine:
+        """
+        조회에 사용할 엔진(DB_READ_TRANSACTION 방식의 조회 전용)을 고릅니다.
+        :param sticky: True면 방금 쓴 클라이언트의 조회이므로 복제 지연을 피해 주 DB 사용
+        """
+        if sticky:
+            DB_READ_ROUTED.inc("sticky")
+            return self.primary
+        replica = self.pick()
+        if replica is None:
+            DB_READ_ROUTED.inc("primary")
+            return self.primary
+        DB_READ_ROUTED.inc("replica")
+        return replica.read_engine
+
+    async def check(self) -> None:
+        await asyncio.gather(*(replica.check(self.max_lag) for replica in self.replicas))
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def status(self) -> List[Dict[str, Any]]:
+        return [replica.status() for replica in self.replicas]
+
+
+replicas = ReplicaSet(settings.DB_REPLICA_URLS, settings.DB_REPLICA_MAX_LAG_SECONDS)
+
+# ✅ 복제본 상태 확인 (워커마다 실행, 실패/지연 초과 시 조회 대상에서 제외)
+replica_health_checker = PeriodicTask(
+    name="db-replica-health",
+    interval=settings.DB_REPLICA_HEALTH_INTERVAL if replicas else 0,
+    job=replicas.check,
+)
+
+gauge(
+    "db_replica_healthy",
+    "읽기 복제본 상태 (1: 조회 대상, 0: 제외)",
+    ("replica",),
+    callback=lambda: [((r.name,), int(r.healthy)) for r in replicas.replicas],
+)
+gauge(
+    "db_replica_lag_seconds",
+    "읽기 복제본의 마지막 확인 시점 복제 지연 (초)",
+    ("replica",),
+    callback=lambda: [
+        ((r.name,), r.lag_seconds) for r in replicas.replicas if r.lag_seconds is not None
+    ],
+)
@@ -0,0 +1,133 @@
+# app/db/schema.py
+
+import hashlib  # 캐시 키 (DB 주소 + 기대 리비전)
+import json
+import logging
+import os
+import re  # 마이그레이션 파일에서 리비전 ID 추출
+import time
+from pathlib import Path
+from typing import Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations" / "versions"
+
+_REVISION = re.compile(r"^revision(?:\s*:[^=]+)?\s*=\s*['\"](\w+)['\"]", re.M)
+_DOWN_REVISION = re.compile(r"^down_revision(?:\s*:[^=]+)?\s*=\s*(.+)$", re.M)
+_REVISION_ID = re.compile(r"['\"](\w+)['\"]")
+
+
+class SchemaMismatchError(RuntimeError):
+    """DB 스키마 리비전이 코드의 Alembic head와 다를 때 발생하는 예외"""
+
+
+def script_heads(versions_dir: Path = MIGRATIONS_DIR) -> Set[str]:
+    """
+    마이그레이션 파일들의 revision/down_revision 선언만 읽어 head 리비전을 구합니다.
+    alembic 패키지(임포트에 수백 ms)를 불러오지 않으며, 선언을 읽지 못한 파일이 있으면 alembic으로 계산합니다.
+    """
+    revisions: Set[str] = set()
+    parents: Set[str] = set()
+    for path in versions_dir.glob("*.py"):
+        source = path.read_text(encoding="utf-8")
+        revision = _REVISION.search(source)
+        down_revision = _DOWN_REVISION.search(source)
+        if revision is None or down_revision is None:
+            return _alembic_heads()
+        revisions.add(revision.group(1))
+        parents.update(_REVISION_ID.findall(down_revision.group(1)))
+    return revisions - parents
+
+
+def _alembic_heads() -> Set[str]:
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR.parent))
+    return set(ScriptDirectory.from_config(config).get_heads())
+
+
+def _cache_key(url: str, heads: Set[str]) -> str:
+    # 비밀번호는 키에 넣지 않음 (같은 DB면 같은 키)
+    address = make_url(url).render_as_string(hide_password=True)
+    return hashlib.sha256(f"{address}|{','.join(sorted(heads))}".encode()).hexdigest()
+
+
+def _read_cache(path: str, key: str, ttl: float) -> bool:
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+        return cached.get("key") == key and time.time() - cached.get("checkedAt", 0) < ttl
+    except (OSError, ValueError, AttributeError):
+        return False
+
+
+def _write_cache(path: str, key: str) -> None:
+    # 여러 워커가 동시에 써도 깨진 파일을 읽지 않도록 임시 파일 → rename
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "checkedAt": time.time()}, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning("스키마 확인 결과를 캐시하지 못했습니다: %s", e)
+
+
+async def check_schema_revision(
+    engine: AsyncEngine,
+    cache_path: Optional[str] = None,
+    cache_ttl: float = 300.0,
+) -> bool:
+    """
+    DB의 alembic_version이 코드의 head 리비전과 같은지 확인합니다 (DDL은 실행하지 않음).
+    cache_path가 있으면 같은 DB/리비전을 cache_ttl초 안에 확인한 기록이 있을 때 DB 조회를 생략합니다.
+
+    :param engine: 확인할 DB 엔진
+    :param cache_path: 확인 결과 캐시 파일 경로 (같은 호스트의 워커끼리 공유)
+    :param cache_ttl: 캐시 유효 시간 (초)
+    :return: 캐시로 확인했으면 True, DB를 조회했으면 False
+    :raises SchemaMismatchError: 리비전이 다르거나 마이그레이션이 적용되지 않은 경우
+    """
+    heads = script_heads()
+    key = _cache_key(str(engine.url), heads)
+    if cache_path and _read_cache(cache_path, key, cache_ttl):
+        return True
+
+    try:
+        async with engine.connect() as conn:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+            current = set(result.scalars())
+    except Exception as e:
+        raise SchemaMismatchError(
+            f"DB 스키마 리비전을 확인할 수 없습니다 ({e}). 'alembic upgrade head'를 실행하세요"
+        ) from e
+
+    if current != heads:
+        raise SchemaMismatchError(
+            f"DB 스키마 리비전 {sorted(current)}이(가) 코드의 head {sorted(heads)}와 다릅니다. "
+            "'alembic upgrade head'를 실행하세요"
+        )
+    if cache_path:
+        _write_cache(cache_path, key)
+    return False
+
+
+async def warm_pool(engine: AsyncEngine, connections: int) -> None:
+    """풀에 커넥션을 미리 열어 둡니다 (첫 요청이 연결 수립을 기다리지 않도록, 실패는 무시)."""
+    if connections <= 0:
+        return
+    conns = []
+    try:
+        for _ in range(connections):
+            conns.append(await engine.connect())
+    except Exception as e:
+        logger.warning("커넥션 미리 열기 실패: %s", e)
+    finally:
+        for conn in conns:
+            await conn.close()  # 풀로 반환 (연결은 유지)
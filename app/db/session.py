@@ -1,22 +1,137 @@
 # app/db/session.py
 
-from typing import AsyncGenerator
+import logging
+import time  # 쓰기 직후 여부 판단
+from typing import AsyncGenerator, Awaitable, Callable, Optional
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings  # 요청별 SQL 실행 시간 한도
+from app.core.middleware import READ_PRIMARY_COOKIE, route_label  # 쓰기 직후 주 DB 조회 쿠키
 from app.db.base import async_session_maker  # DB 세션 팩토리 가져오기
+from app.db.replicas import replicas  # 읽기 복제본 목록
+from app.db.statements import connection_timeouts, set_statement_budget  # 연결 기본값과 다르면 SET LOCAL
 
+logger = logging.getLogger(__name__)
 
-# ✅ 비동기 DB 세션을 제공하는 FastAPI의 Dependency
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+_AFTER_COMMIT = "after_commit"  # session.info 키: 커밋 후 실행할 작업 목록
+_READ_TARGET = "read_target"  # session.info 키: 조회 세션이 연결된 대상
+
+
+def after_commit(session: AsyncSession, hook: Callable[[], Awaitable[None]]) -> None:
+    """
+    현재 트랜잭션이 커밋된 뒤 실행할 작업(캐시 갱신 등)을 등록합니다.
+    롤백되면 실행하지 않습니다. 커밋은 세션을 만든 쪽(get_db 등)이 한 번만 수행합니다.
+    """
+    session.info.setdefault(_AFTER_COMMIT, []).append(hook)
+
+
+async def commit(session: AsyncSession) -> None:
+    """트랜잭션을 커밋하고 after_commit으로 등록된 작업을 차례로 실행합니다."""
+    if session.in_transaction():
+        await session.commit()
+    for hook in session.info.pop(_AFTER_COMMIT, []):
+        try:
+            await hook()
+        except Exception:
+            # 이미 커밋되었으므로 요청은 실패시키지 않음 (캐시는 TTL로 복구)
+            logger.exception("커밋 후 작업 실패")
+
+
+def _apply_route_budget(session: AsyncSession, request: Request, write: bool) -> None:
+    """
+    요청 라우트의 statement_timeout/lock_timeout(DB_*_TIMEOUT_MS, 라우트별 설정 우선) 중
+    연결 기본값(connection_timeouts)과 다른 값만 세션에 지정합니다 (같으면 SET LOCAL 왕복 없음).
+    """
+    route = f"{request.method} {route_label(request.scope)}"
+    default = (
+        settings.DB_WRITE_STATEMENT_TIMEOUT_MS if write else settings.DB_READ_STATEMENT_TIMEOUT_MS
+    )
+    if default is None:
+        default = settings.DB_STATEMENT_TIMEOUT_MS
+    statement_timeout = settings.DB_ROUTE_STATEMENT_TIMEOUT_MS.get(route, default)
+    lock_timeout = settings.DB_ROUTE_LOCK_TIMEOUT_MS.get(route, settings.DB_LOCK_TIMEOUT_MS)
+    connection_statement_timeout, connection_lock_timeout = connection_timeouts(settings)
+    set_statement_budget(
+        session,
+        None if statement_timeout == connection_statement_timeout else statement_timeout,
+        None if lock_timeout == connection_lock_timeout else lock_timeout,
+    )
+
+
+# ✅ 비동기 DB 세션을 제공하는 FastAPI의 Dependency (쓰기용, 요청 단위 트랜잭션)
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
     FastAPI의 Dependency Injection 방식으로 비동기 DB 세션을 제공합니다.
-    요청이 끝나면 자동으로 세션을 정리합니다.
+    요청 하나의 모든 변경을 하나의 트랜잭션으로 묶어(unit of work) 엔드포인트가 끝난 뒤 한 번만 커밋하고,
+    커밋 후 after_commit 작업을 실행합니다. 커밋은 응답을 보내기 전에 끝나므로 실패하면 500이 됩니다.
+    트랜잭션에는 라우트별 SQL 실행 시간 한도(DB_WRITE_STATEMENT_TIMEOUT_MS 등)가 적용됩니다.
     """
     async with async_session_maker() as session:  # 세션 생성
+        _apply_route_budget(session, request, write=True)
         try:
             yield session  # 세션을 요청하는 엔드포인트에 전달
-            await session.commit()  # 정상 실행 시 트랜잭션 커밋
+            await commit(session)  # 정상 실행 시 트랜잭션 커밋 (변경이 없으면 생략)
         except Exception:
+            session.info.pop(_AFTER_COMMIT, None)
             await session.rollback()  # 예외 발생 시 롤백
             raise
         finally:
             await session.close()  # 세션 종료
+
+
+def _is_sticky(cookie: Optional[str]) -> bool:
+    """쓰기 직후 주 DB 조회 쿠키가 아직 유효한지 확인합니다."""
+    try:
+        return cookie is not None and float(cookie) > time.time()
+    except ValueError:
+        return False
+
+
+def read_session(request: Request) -> AsyncSession:
+    """
+    요청에 맞는 조회용 세션을 만듭니다 (쓰기 직후면 주 DB, 아니면 정상인 읽기 복제본).
+    스트리밍 응답처럼 의존성 수명보다 오래 쓰는 세션에 사용합니다.
+    """
+    sticky = _is_sticky(request.cookies.get(READ_PRIMARY_COOKIE))
+    read_engine = replicas.read_engine(sticky)
+    session = async_session_maker(bind=read_engine)
+    if sticky:
+        session.info[_READ_TARGET] = "sticky"
+    elif read_engine is not replicas.primary:
+        session.info[_READ_TARGET] = "replica"
+    _apply_route_budget(session, request, write=False)
+    return session
+
+
+def read_target(session: AsyncSession) -> str:
+    """
+    세션이 읽는 대상을 반환합니다.
+    - "primary": 주 DB (쓰기 세션, 또는 복제본이 없거나 모두 비정상일 때의 조회 세션)
+    - "replica": 읽기 복제본 (복제 지연만큼 오래된 값일 수 있음)
+    - "sticky": 쓰기 직후 클라이언트의 조회라 주 DB로 보낸 세션
+    """
+    return session.info.get(_READ_TARGET, "primary")
+
+
+async def release(session: AsyncSession) -> None:
+    """
+    조회 세션의 트랜잭션을 끝내고 커넥션을 바로 풀에 반환합니다.
+    조회 결과를 모두 읽은 뒤 직렬화 전에 호출하면 커넥션 점유 시간이 줄어듭니다 (이후 다시 쿼리하면 새로 연결).
+    """
+    await session.close()
+
+
+# ✅ 조회 전용 엔드포인트용 DB 세션 (읽기 복제본 라운드 로빈)
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    조회(GET) 엔드포인트에 읽기 복제본 세션을 제공합니다.
+    - 정상인 복제본이 없거나 설정되지 않았으면 주 DB를 사용합니다.
+    - 이 클라이언트가 방금 쓰기를 했다면(ReadYourWritesMiddleware 쿠키) 주 DB를 사용합니다.
+    - 트랜잭션은 READ ONLY로 시작하며(DB_READ_TRANSACTION) 커밋하지 않고 닫습니다.
+    - 트랜잭션에는 라우트별 SQL 실행 시간 한도(DB_READ_STATEMENT_TIMEOUT_MS 등)가 적용됩니다.
+    """
+    async with read_session(request) as session:
+        try:
+            yield session
+        finally:
+            await session.close()  # 아직 열려 있으면 롤백 후 커넥션 반환 (release 후에는 생략)
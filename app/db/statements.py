@@ -0,0 +1,204 @@
+# app/db/statements.py
+
+import uuid  # pgbouncer 모드의 prepared statement 이름
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import event, text  # 연결/트랜잭션/오류 훅
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.util import LRUCache  # asyncpg 드라이버가 쓰는 prepared statement 캐시
+
+from app.core.metrics import counter
+
+_BUDGET = "statement_budget"  # session.info 키: (statement_timeout, lock_timeout) 밀리초
+
+# DB가 문 실행을 취소한 이유 (SQLSTATE → 종류)
+_TIMEOUT_SQLSTATES = {"57014": "statement", "55P03": "lock"}
+
+
+class StatementCacheStats:
+    """prepared statement 캐시 적중/준비 횟수를 누적하는 통계 객체 (워커의 모든 엔진 공통)"""
+
+    def __init__(self) -> None:
+        self.prepares = 0  # 서버에 PREPARE한 횟수 (캐시 실패 + 캐시를 쓰지 않는 경우)
+        self.found = 0  # 캐시에서 찾은 횟수
+        self.stale = 0  # 찾았지만 DDL 이후라 다시 준비한 횟수
+        self.evictions = 0  # 용량 초과로 캐시에서 밀려난 문 수
+
+    @property
+    def hits(self) -> int:
+        return self.found - self.stale
+
+    def name_func(self, unique: bool):
+        """문을 준비할 때마다 호출되는 이름 생성 함수 (unique=False면 asyncpg 기본 이름)"""
+
+        def prepared_statement_name() -> Optional[str]:
+            self.prepares += 1
+            return f"__asyncpg_{uuid.uuid4()}__" if unique else None
+
+        return prepared_statement_name
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.prepares
+        return {
+            "hits": self.hits,
+            "prepares": self.prepares,
+            "evictions": self.evictions,
+            "hitRatio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+statement_cache = StatementCacheStats()
+
+counter(
+    "db_statement_cache_total",
+    "prepared statement 조회 수 (hit: 캐시 재사용, miss: 서버에 새로 PREPARE)",
+    ("result",),
+    callback=lambda: [
+        (("hit",), statement_cache.hits),
+        (("miss",), statement_cache.prepares),
+    ],
+)
+counter(
+    "db_statement_cache_evictions_total",
+    "용량 초과로 prepared statement 캐시에서 밀려난 문 수",
+    callback=lambda: [((), statement_cache.evictions)],
+)
+DB_STATEMENT_TIMEOUTS = counter(
+    "db_statement_timeouts_total",
+    "statement_timeout/lock_timeout 초과로 DB가 취소한 문 수",
+    ("kind",),
+)
+
+
+class StatementTimeout(Exception):
+    """statement_timeout(kind="statement") 또는 lock_timeout(kind="lock")을 넘어 DB가 문 실행을 취소함"""
+
+    def __init__(self, kind: str, message: str) -> None:
+        super().__init__(message)
+        self.kind = kind
+
+
+class _CountingLRUCache(LRUCache):
+    """asyncpg 드라이버의 prepared statement 캐시에 적중 횟수/밀려난 문 수 기록을 더한 LRUCache"""
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        statement_cache.found += 1
+        return value
+
+    def __setitem__(self, key, value) -> None:
+        if key in self._data:
+            statement_cache.stale += 1  # 찾았지만 오래되어 다시 준비함
+        super().__setitem__(key, value)
+
+    def _manage_size(self) -> None:
+        # 용량을 넘으면 한 번에 여러 문을 정리하므로 정리 전후 크기 차이로 셈
+        size = len(self._data)
+        super()._manage_size()
+        statement_cache.evictions += size - len(self._data)
+
+
+def connection_timeouts(settings) -> Tuple[Optional[int], Optional[int]]:
+    """
+    연결할 때 한 번 설정하는 기본 (statement_timeout, lock_timeout)을 반환합니다 (DB_STATEMENT_TIMEOUT_MS, DB_LOCK_TIMEOUT_MS).
+    pgbouncer 모드에서는 시작 파라미터가 서버 연결에 전달되지 않으므로 (None, None)입니다.
+    """
+    if settings.DB_PGBOUNCER:
+        return None, None
+    return settings.DB_STATEMENT_TIMEOUT_MS, settings.DB_LOCK_TIMEOUT_MS
+
+
+def _server_settings(settings) -> Dict[str, str]:
+    names = ("statement_timeout", "lock_timeout")
+    return {
+        name: str(value)
+        for name, value in zip(names, connection_timeouts(settings))
+        if value is not None
+    }
+
+
+def connect_args(settings) -> Dict[str, Any]:
+    """
+    Settings 값으로 create_async_engine의 connect_args(asyncpg 연결 옵션)를 만듭니다.
+    - prepared_statement_cache_size: 연결마다 재사용할 prepared statement 수 (DB_STATEMENT_CACHE_SIZE)
+    - server_settings: 기본 statement_timeout/lock_timeout (connection_timeouts, 연결 시 시작 파라미터로 전달)
+    - pgbouncer 모드(DB_PGBOUNCER): asyncpg 자체 캐시를 끄고, 문 이름을 UUID로 만들어
+      풀러가 서버 연결을 바꿔 써도 이름이 겹치지 않게 합니다. 캐시는 pgbouncer가 prepared statement를
+      지원할 때(DB_PGBOUNCER_PREPARED_STATEMENTS)만 사용합니다.
+    :param settings: 애플리케이션 설정
+    :return: connect_args 딕셔너리
+    """
+    if not settings.DB_PGBOUNCER:
+        return {
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_name_func": statement_cache.name_func(unique=False),
+            "server_settings": _server_settings(settings),  # 기본 실행 시간 한도 (추가 왕복 없음)
+        }
+    return {
+        "statement_cache_size": 0,  # asyncpg가 내부적으로 이름 붙여 캐시하는 문 비활성화
+        "prepared_statement_cache_size": (
+            settings.DB_STATEMENT_CACHE_SIZE if settings.DB_PGBOUNCER_PREPARED_STATEMENTS else 0
+        ),
+        "prepared_statement_name_func": statement_cache.name_func(unique=True),
+    }
+
+
+def _handle_error(context) -> Optional[StatementTimeout]:
+    sqlstate = getattr(context.original_exception, "sqlstate", None)
+    kind = _TIMEOUT_SQLSTATES.get(sqlstate)
+    if kind is None:
+        return None
+    DB_STATEMENT_TIMEOUTS.inc(kind)
+    return StatementTimeout(kind, str(context.original_exception))
+
+
+def track_statements(sync_engine: Engine) -> None:
+    """
+    엔진의 prepared statement 캐시 적중 횟수를 기록하고,
+    statement_timeout/lock_timeout으로 취소된 문은 StatementTimeout으로 바꿔 발생시킵니다.
+    """
+
+    def on_connect(dbapi_connection, connection_record) -> None:
+        cache = getattr(dbapi_connection, "_prepared_statement_cache", None)
+        if cache is not None:
+            dbapi_connection._prepared_statement_cache = _CountingLRUCache(cache.capacity)
+
+    event.listen(sync_engine, "connect", on_connect)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+def set_statement_budget(
+    session, statement_timeout: Optional[int], lock_timeout: Optional[int]
+) -> None:
+    """
+    세션이 시작하는 트랜잭션마다 적용할 statement_timeout/lock_timeout(밀리초, 0이면 무제한)을 지정합니다.
+    None인 값은 설정하지 않습니다(연결 기본값 사용). 값이 있으면 트랜잭션 시작 시 왕복이 한 번 늘어납니다.
+    SET LOCAL이라 트랜잭션이 끝나면 원래대로 돌아가며 pgbouncer transaction 풀링에서도 다른 클라이언트에 새지 않습니다.
+    """
+    session.info[_BUDGET] = (statement_timeout, lock_timeout)
+
+
+def _budget_query(statement_timeout: Optional[int], lock_timeout: Optional[int]):
+    parts = []
+    params: Dict[str, str] = {}
+    if statement_timeout is not None:
+        parts.append("set_config('statement_timeout', :statement_timeout, true)")
+        params["statement_timeout"] = str(statement_timeout)
+    if lock_timeout is not None:
+        parts.append("set_config('lock_timeout', :lock_timeout, true)")
+        params["lock_timeout"] = str(lock_timeout)
+    return text(f"SELECT {', '.join(parts)}"), params
+
+
+def _apply_statement_budget(session: Session, transaction, connection) -> None:
+    budget: Optional[Tuple[Optional[int], Optional[int]]] = session.info.get(_BUDGET)
+    if budget is None or budget == (None, None):
+        return
+    if connection.get_execution_options().get("isolation_level") == "AUTOCOMMIT":
+        return  # 트랜잭션이 없으면 SET LOCAL이 적용되지 않음 (DB_READ_TRANSACTION="autocommit")
+    query, params = _budget_query(*budget)
+    connection.execute(query, params)  # 두 값을 왕복 한 번으로 설정
+
+
+event.listen(Session, "after_begin", _apply_statement_budget)
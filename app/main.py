@@ -1,28 +1,82 @@
 # app/main.py
 
+from app.core.startup import startup  # 시작 단계별 시간 기록 (가장 먼저 임포트)
 from fastapi import FastAPI, Request
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
-from app.db.base import init_db
+from app.db.base import engine, init_db
+from app.db.schema import check_schema_revision, warm_pool
 from loguru import logger
-from app.core.logging import setup_logging
+from app.core.logging import setup_logging, shutdown_logging
 import asyncio
 from app.core.config import settings
 from app.shared.router import router
+from app.core.admission import ConcurrencyLimiter  # 조회/쓰기별 동시 처리 한도
+from app.core.middleware import (
+    SAFE_METHODS,
+    AdmissionControlMiddleware,
+    MetricsMiddleware,
+    ReadYourWritesMiddleware,
+    RequestIdMiddleware,
+)
+from app.db.replicas import replica_health_checker, replicas
+from app.system.endpoints import metrics_router
+from app.todo.events import todo_listener
+from app.todo.tasks import todo_archiver, todo_tombstone_compactor
+from app.todo.coalescing import todo_create_coalescer
+
+startup.mark("imports")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     setup_logging()
     logger.info("Application starting up...")
+    startup.mark("logging")
+    warmup = None
     try:
-        # init_db 실행
-        await init_db()
+        # ✅ DB 스키마 처리 (기본: 없는 테이블 생성, DB_SCHEMA_STARTUP="check"면 리비전 확인만)
+        if settings.DB_SCHEMA_STARTUP == "create_all":
+            await init_db()
+        elif settings.DB_SCHEMA_STARTUP == "check":
+            cached = await check_schema_revision(
+                engine,
+                cache_path=settings.DB_SCHEMA_CHECK_CACHE,
+                cache_ttl=settings.DB_SCHEMA_CHECK_CACHE_SECONDS,
+            )
+            logger.info(f"DB 스키마 리비전 확인 완료{' (캐시)' if cached else ''}")
+        startup.mark("schema")
+        # ✅ 첫 요청이 연결 수립을 기다리지 않도록 커넥션을 미리 열기 (시작을 막지 않음)
+        warmup = asyncio.create_task(warm_pool(engine, settings.DB_POOL_WARMUP))
+        # ✅ 변경 이벤트 LISTEN 연결 (워커당 하나, 백그라운드에서 재연결)
+        if settings.TODO_EVENTS_ENABLED:
+            todo_listener.start()
+        # ✅ 읽기 복제본 상태/지연 확인 (복제본이 설정된 경우에만)
+        replica_health_checker.start()
+        # ✅ 보관 기간이 지난 삭제 기록 정리 (주기 작업)
+        todo_tombstone_compactor.start()
+        # ✅ 오래된 완료 할 일을 보관 테이블로 이동 (주기 작업)
+        todo_archiver.start()
+        # ✅ 단건 생성 묶음 처리
+        if settings.TODO_CREATE_COALESCE_ENABLED:
+            todo_create_coalescer.start()
+        startup.mark("ready")
         yield
     except asyncio.CancelledError:
         logger.warning("Lifespan tasks cancelled")
     finally:
         logger.info("Application shutting down....")
+        if warmup is not None:
+            warmup.cancel()
+        # 대기 중인 생성 요청을 먼저 처리 (DB 연결을 닫기 전에)
+        await todo_create_coalescer.stop(settings.TODO_CREATE_COALESCE_DRAIN_SECONDS)
+        await todo_listener.stop()
+        await todo_tombstone_compactor.stop()
+        await todo_archiver.stop()
+        await replica_health_checker.stop()
+        await replicas.dispose()
+        await engine.dispose()  # 풀에 남아 있는 커넥션 정리
+        shutdown_logging()  # 대기 중인 로그를 모두 기록
 
 
 app = FastAPI(
@@ -31,6 +85,43 @@ app = FastAPI(
 
 origins = ["http://localhost:3000", "http://40.82.133.249:3000"]
 
+# ✅ 조회/쓰기별 동시 처리 한도 (과부하 시 커넥션 대기 대신 빠르게 503/429, CORS 헤더가 붙도록 CORS 안쪽에 둠)
+if settings.ADMISSION_ENABLED:
+    read_limiter = ConcurrencyLimiter(
+        "read",
+        settings.ADMISSION_READ_CONCURRENCY,
+        settings.ADMISSION_READ_QUEUE_SIZE,
+        settings.ADMISSION_READ_MAX_WAIT_SECONDS,
+    )
+    write_limiter = ConcurrencyLimiter(
+        "write",
+        settings.ADMISSION_WRITE_CONCURRENCY,
+        settings.ADMISSION_WRITE_QUEUE_SIZE,
+        settings.ADMISSION_WRITE_MAX_WAIT_SECONDS,
+    )
+    route_limiters = {}
+    for route, limit in settings.ADMISSION_ROUTE_LIMITS.items():  # "METHOD 경로 템플릿" → 한도
+        budget = read_limiter if route.split(" ", 1)[0] in SAFE_METHODS else write_limiter
+        route_limiters[route] = ConcurrencyLimiter(route, limit, budget.queue_size, budget.max_wait)
+    own_limiters = {}
+    if settings.TODO_CREATE_COALESCE_ENABLED:
+        # 단건 생성은 묶음 처리 대기열(TODO_CREATE_COALESCE_QUEUE_SIZE)이 backpressure를 맡고 묶음마다 커넥션 1개만
+        # 쓰므로 쓰기 한도 대신 대기열 크기만큼의 자체 한도 사용 (쓰기 한도에 묶이면 묶음 크기도 그만큼으로 제한됨)
+        own_limiters["POST /api/v1/todos/"] = ConcurrencyLimiter(
+            "todo_create",
+            settings.TODO_CREATE_COALESCE_QUEUE_SIZE,
+            settings.ADMISSION_WRITE_QUEUE_SIZE,
+            settings.ADMISSION_WRITE_MAX_WAIT_SECONDS,
+        )
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        read=read_limiter,
+        write=write_limiter,
+        route_limiters=route_limiters,
+        exclude_paths=settings.ADMISSION_EXCLUDE_PATHS,
+        own_limiters=own_limiters,
+    )
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -39,4 +130,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ✅ 라우트별 처리 시간/상태 코드/DB 사용량 메트릭 수집
+app.add_middleware(MetricsMiddleware)
+
+# ✅ 쓰기 직후 조회는 주 DB로 (읽기 복제본이 있을 때만, 쿠키로 클라이언트 구분)
+if replicas and settings.DB_READ_YOUR_WRITES_SECONDS > 0:
+    app.add_middleware(
+        ReadYourWritesMiddleware, window=settings.DB_READ_YOUR_WRITES_SECONDS
+    )
+
+# ✅ 요청 ID를 로그 컨텍스트에 설정 (X-Request-ID 헤더)
+app.add_middleware(RequestIdMiddleware)
+
 app.include_router(router, prefix="/api/v1")
+app.include_router(metrics_router)
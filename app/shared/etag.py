@@ -0,0 +1,71 @@
+# app/shared/etag.py
+
+import hashlib  # 목록 ETag 해시
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Optional, Tuple
+from uuid import UUID
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_micros(value: datetime) -> int:
+    """datetime을 epoch 기준 마이크로초 정수로 변환합니다 (float 오차 없음)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)  # naive 값은 UTC로 간주
+    return (value - EPOCH) // ONE_MICROSECOND
+
+
+def version_etag(key: UUID, version: datetime) -> str:
+    """
+    (ID, 수정 시간)으로 강한(strong) ETag를 만듭니다.
+    If-Match 처리 시 parse_version_etag로 수정 시간을 복원할 수 있습니다.
+    """
+    return f'"{key.hex}-{_to_micros(version):x}"'
+
+
+def parse_version_etag(etag: str) -> Optional[Tuple[UUID, datetime]]:
+    """
+    version_etag로 만든 ETag에서 (ID, 수정 시간)을 복원합니다.
+    형식이 다르면 None을 반환합니다.
+    """
+    value = etag.strip()
+    if value.startswith("W/"):
+        return None  # 약한 ETag는 If-Match에 사용할 수 없음
+    try:
+        key, micros = value.strip('"').split("-")
+        return UUID(hex=key), EPOCH + timedelta(microseconds=int(micros, 16))
+    except ValueError:
+        return None
+
+
+def digest_etag(parts: Iterable[Any]) -> str:
+    """여러 값을 해시하여 목록 응답용 ETag를 만듭니다."""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(str(part).encode())
+        digest.update(b"\x1f")  # 값 사이 구분자
+    return f'"{digest.hexdigest()}"'
+
+
+def _header_tags(header: str):
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def none_match(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 현재 ETag와 일치하는지 확인합니다 (약한 비교).
+    True면 304 Not Modified를 반환해도 됩니다.
+    """
+    if not if_none_match:
+        return False
+    tags = _header_tags(if_none_match)
+    if "*" in tags:
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.removeprefix("W/") == bare for tag in tags)
+
+
+def if_match_tags(if_match: str) -> list:
+    """If-Match 헤더의 ETag 목록을 반환합니다 ("*"는 그대로 포함)."""
+    return _header_tags(if_match)
@@ -1,9 +1,17 @@
 # app/models/base.py
 from sqlalchemy.orm import DeclarativeBase
-import pytz
 from sqlalchemy import MetaData
 
-kst = pytz.timezone("Asia/Seoul")
+KST_ZONE = "Asia/Seoul"  # 기본 시간대 이름
+
+
+def __getattr__(name):
+    # ✅ kst(pytz 시간대)는 처음 사용할 때 로드 (pytz 임포트/시간대 파일 읽기를 시작 시점에서 제외)
+    if name == "kst":
+        import pytz
+
+        return pytz.timezone(KST_ZONE)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ✅ SQLAlchemy의 기본 Base 클래스를 정의하는 파일
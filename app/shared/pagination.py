@@ -0,0 +1,82 @@
+# app/shared/pagination.py
+
+import base64  # 커서를 URL-safe 문자열로 인코딩
+import json  # 커서 내부 값 직렬화
+from datetime import datetime  # 정렬 키 타입
+from typing import Any, List, Tuple
+from uuid import UUID  # 정렬 키 타입
+
+
+class InvalidCursorError(ValueError):
+    """클라이언트가 보낸 커서를 해석할 수 없을 때 발생하는 예외"""
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    정렬 키 값들을 불투명한(opaque) 커서 문자열로 인코딩합니다.
+    datetime은 ISO 8601, UUID는 문자열로 변환됩니다.
+    """
+    raw = [
+        v.isoformat() if isinstance(v, datetime) else str(v) if isinstance(v, UUID) else v
+        for v in values
+    ]
+    payload = json.dumps(raw, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """
+    encode_cursor로 만든 커서를 원래 값 목록(JSON 값)으로 복원합니다.
+    :raises InvalidCursorError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("잘못된 커서입니다") from e
+    if not isinstance(values, list):
+        raise InvalidCursorError("잘못된 커서입니다")
+    return values
+
+
+def decode_created_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    (created_at, id) 정렬용 커서를 복원합니다.
+    :raises InvalidCursorError: 커서 형식이 올바르지 않은 경우
+    """
+    values = decode_cursor(cursor)
+    try:
+        created_at, todo_id = values
+        return datetime.fromisoformat(created_at), UUID(todo_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("잘못된 커서입니다") from e
+
+
+def decode_rank_cursor(cursor: str) -> Tuple[float, datetime, UUID]:
+    """
+    (검색 순위, created_at, id) 정렬용 커서를 복원합니다.
+    :raises InvalidCursorError: 커서 형식이 올바르지 않은 경우
+    """
+    values = decode_cursor(cursor)
+    try:
+        rank, created_at, todo_id = values
+        if not isinstance(rank, (int, float)) or isinstance(rank, bool):
+            raise TypeError("rank")
+        return float(rank), datetime.fromisoformat(created_at), UUID(todo_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("잘못된 커서입니다") from e
+
+
+def decode_change_token(token: str) -> Tuple[int, UUID]:
+    """
+    (change_xid, id) 정렬용 변경 토큰을 복원합니다.
+    :raises InvalidCursorError: 토큰 형식이 올바르지 않은 경우
+    """
+    values = decode_cursor(token)
+    try:
+        change_xid, todo_id = values
+        if not isinstance(change_xid, int) or isinstance(change_xid, bool):
+            raise TypeError("change_xid")
+        return change_xid, UUID(todo_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("잘못된 변경 토큰입니다") from e
@@ -1,7 +1,9 @@
 from fastapi import APIRouter
 from app.todo.endpoints import router as todo_router
+from app.system.endpoints import router as system_router
 
 router = APIRouter()
 
 
 router.include_router(todo_router, prefix="/todos", tags=["todos"])
+router.include_router(system_router, prefix="/system", tags=["system"])
@@ -0,0 +1,97 @@
+# app/system/endpoints.py
+
+from fastapi import APIRouter, Response  # FastAPI 라우터
+
+from app.core.admission import admission_status  # 동시 처리 한도 상태
+from app.core.metrics import PROMETHEUS_CONTENT_TYPE, REGISTRY  # 메트릭 레지스트리
+from app.core.startup import startup  # 워커 시작 시간
+from app.db.base import engine  # 애플리케이션 DB 엔진
+from app.db.pool import pool_status  # 커넥션 풀 상태 조회
+from app.db.replicas import replicas  # 읽기 복제본 목록
+from app.db.statements import statement_cache  # prepared statement 캐시 통계
+from app.todo.cache import todo_cache  # 단건 조회 캐시
+from app.todo.events import todo_events  # 실시간 변경 이벤트 브로커
+
+router = APIRouter()  # 운영/모니터링용 라우터
+metrics_router = APIRouter()  # Prometheus 수집용 라우터 (/metrics, prefix 없이 등록)
+
+
+@router.get("/pool")
+async def read_pool_status():
+    """
+    현재 워커의 DB 커넥션 풀 상태를 조회합니다.
+    - **inUse**: 사용 중인 커넥션 수
+    - **overflow**: pool_size를 초과해 열린 커넥션 수
+    - **waitSecondsAvg / waitSecondsMax**: 커넥션 체크아웃 대기 시간 통계
+    """
+    return pool_status(engine.pool)
+
+
+@router.get("/statements")
+async def read_statement_cache_stats():
+    """
+    현재 워커의 prepared statement 캐시 통계를 조회합니다 (주 DB/복제본 공통).
+    - **hits**: 캐시한 문을 재사용해 파싱/계획을 생략한 횟수
+    - **prepares**: 서버에 새로 PREPARE한 횟수 (캐시 실패, 새 연결, 캐시를 쓰지 않는 pgbouncer 모드)
+    - **evictions**: 용량(DB_STATEMENT_CACHE_SIZE) 초과로 캐시에서 밀려난 문 수
+    """
+    return statement_cache.stats()
+
+
+@router.get("/admission")
+async def read_admission_status():
+    """
+    현재 워커의 동시 처리 한도(조회/쓰기/라우트별) 상태를 조회합니다 (비활성화되어 있으면 빈 객체).
+    - **inFlight / limit**: 처리 중인 요청 수 / 한도
+    - **queued / queueSize**: 대기 중인 요청 수 / 대기열 크기
+    - **serviceSecondsAvg**: 요청 처리 시간 이동 평균 (예상 대기 시간 계산에 사용)
+    """
+    return admission_status()
+
+
+@router.get("/replicas")
+async def read_replica_status():
+    """
+    현재 워커가 보는 읽기 복제본 상태를 조회합니다 (설정되지 않았으면 빈 목록).
+    - **healthy**: 조회 대상 여부 (연결 실패 또는 지연 초과 시 false)
+    - **lagSeconds**: 마지막 확인 시점의 복제 지연 (초)
+    - **pool**: 복제본 커넥션 풀 상태
+    """
+    return replicas.status()
+
+
+@router.get("/startup")
+async def read_startup_report():
+    """
+    현재 워커의 시작 단계별 경과 시간을 조회합니다 (프로세스 시작 기준, 초).
+    - **phases**: imports(모듈 로드), logging, schema(스키마 확인), ready(요청 받을 준비)
+    - **firstRequest**: 첫 요청 처리가 끝난 시점 (이 요청이 첫 요청이면 아직 null)
+    """
+    return startup.report()
+
+
+@router.get("/cache")
+async def read_cache_stats():
+    """
+    현재 워커의 Todo 단건 조회 캐시 통계를 조회합니다.
+    - **hits / misses**: 캐시 적중/실패 횟수
+    - **evictions / expirations**: 용량 초과/TTL 만료로 제거된 항목 수
+    """
+    return todo_cache.stats()
+
+
+@router.get("/events")
+async def read_event_stats():
+    """
+    현재 워커의 Todo 변경 이벤트 브로커 상태를 조회합니다.
+    - **subscribers**: 연결된 SSE 구독자 수
+    - **evictions**: 이벤트를 늦게 읽어 연결이 종료된 구독자 수
+    - **resets**: LISTEN 재연결 등으로 재동기화를 요청한 횟수
+    """
+    return todo_events.stats()
+
+
+@metrics_router.get("/metrics", include_in_schema=False)
+async def read_metrics():
+    """현재 워커의 메트릭을 Prometheus 텍스트 형식으로 반환합니다."""
+    return Response(content=REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
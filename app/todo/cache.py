@@ -0,0 +1,53 @@
+# app/todo/cache.py
+
+from typing import Optional
+
+from app.core.cache import CacheBackend, InMemoryCacheBackend, ReadThroughCache
+from app.core.config import settings  # 캐시 크기/TTL 설정
+from app.core.metrics import counter, gauge  # 캐시 메트릭
+from app.todo.schemas import Todo as TodoSchema  # 캐시에 저장할 응답 스키마
+
+
+def _build_backend() -> Optional[CacheBackend]:
+    """TODO_CACHE_SHARED_BACKEND 설정에 맞는 공유 캐시 백엔드를 생성합니다."""
+    if settings.TODO_CACHE_SHARED_BACKEND == "memory":
+        return InMemoryCacheBackend()
+    return None
+
+
+# ✅ 단건 조회(GET /todos/{todo_id})용 캐시 - 키는 Todo ID 문자열
+todo_cache: ReadThroughCache[TodoSchema] = ReadThroughCache(
+    name="todo",
+    max_size=settings.TODO_CACHE_MAX_SIZE,
+    ttl=settings.TODO_CACHE_TTL_SECONDS,
+    dumps=lambda todo: todo.model_dump_json(),
+    loads=TodoSchema.model_validate_json,
+    backend=_build_backend(),
+)
+
+
+def _cache_event_samples():
+    stats = todo_cache.stats()
+    return [
+        ((event,), stats[key])
+        for event, key in (
+            ("hit", "hits"),
+            ("backend_hit", "backendHits"),
+            ("miss", "misses"),
+            ("eviction", "evictions"),
+            ("expiration", "expirations"),
+        )
+    ]
+
+
+counter(
+    "todo_cache_events_total",
+    "Todo 단건 조회 캐시 이벤트 수",
+    ("event",),
+    callback=_cache_event_samples,
+)
+gauge(
+    "todo_cache_entries",
+    "Todo 단건 조회 캐시 항목 수",
+    callback=lambda: [((), len(todo_cache.local))],
+)
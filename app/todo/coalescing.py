@@ -0,0 +1,31 @@
+# app/todo/coalescing.py
+
+from typing import List
+
+from app.core.coalescing import WriteCoalescer
+from app.core.config import settings  # 묶음 크기/대기 시간 설정
+from app.db.base import async_session_maker  # 묶음마다 별도 세션
+from app.db.session import commit  # 커밋 + 커밋 후 작업 실행
+from app.todo.crud import create_todos
+from app.todo.schemas import Todo as TodoSchema, TodoCreate
+
+
+async def _flush_creates(todos: List[TodoCreate]) -> List[TodoSchema]:
+    """모인 생성 요청을 다중 행 INSERT ... RETURNING 한 번으로 넣고 커밋합니다 (결과는 입력 순서)."""
+    async with async_session_maker() as session:
+        created = await create_todos(session, todos, chunk_size=settings.TODO_BULK_CHUNK_SIZE)
+        results = [TodoSchema.model_validate(todo) for todo in created]
+        await commit(session)
+    return results
+
+
+# ✅ 단건 생성(POST /todos/) 묶음 처리 (TODO_CREATE_COALESCE_ENABLED일 때 사용)
+todo_create_coalescer: WriteCoalescer[TodoCreate, TodoSchema] = WriteCoalescer(
+    name="todo_create",
+    flush=_flush_creates,
+    max_batch=settings.TODO_CREATE_COALESCE_MAX_BATCH,
+    max_wait=settings.TODO_CREATE_COALESCE_WAIT_SECONDS,
+    queue_size=settings.TODO_CREATE_COALESCE_QUEUE_SIZE,
+    enqueue_timeout=settings.TODO_CREATE_COALESCE_ENQUEUE_TIMEOUT,
+    flushers=settings.TODO_CREATE_COALESCE_FLUSHERS,
+)
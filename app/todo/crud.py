@@ -1,55 +1,608 @@
 # app/crud/todo.py
 from sqlalchemy.ext.asyncio import AsyncSession  # 비동기 세션 지원
-from sqlalchemy import select  # SELECT 쿼리 지원
+from sqlalchemy import (  # INSERT/SELECT/UPDATE/DELETE 쿼리 및 row-value 비교 지원
+    Date,
+    Select,
+    and_,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    table,
+    text,
+    tuple_,
+    union_all,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import REAL, REGCLASS, REGCONFIG  # 검색 순위/설정 타입
+from sqlalchemy.dialects.postgresql import TIMESTAMP  # 달력 날짜 경계 타입
 from sqlalchemy.future import select  # SQLAlchemy 2.x 호환성
 from uuid import UUID  # UUID 타입 지원
-from datetime import datetime, timezone  # 날짜 및 시간 관련 모듈
-from typing import Optional, List  # 선택적 값 및 리스트 지원
+from datetime import date, datetime, timezone  # 날짜 및 시간 관련 모듈
+import re  # 검색어 토큰 분리
+from typing import Any, AsyncIterator, Dict, Optional, List, Tuple, Union  # 선택적 값 및 리스트 지원
 
-from app.todo.models import Todo, TodoStatus  # 할 일(Todo) 모델 및 상태 Enum
+from app.core.cache import LRUCache  # 오늘 마감 집계 캐시
+from app.core.config import settings  # 캐시 사용 여부
+from app.db.session import after_commit, read_target  # 커밋 후 캐시 갱신, 조회 대상 확인
+from app.todo.models import (  # 할 일(Todo) 모델 및 상태 Enum
+    TODO_ARCHIVE_COLUMNS,
+    TODO_SEARCH_CONFIG,
+    Todo,
+    TodoArchive,
+    TodoStatus,
+    TodoStatusCount,
+    TodoSyncHorizon,
+    TodoTombstone,
+    todo_has_period,
+    todo_period,
+    utc_now,
+)
+from app.todo.cache import todo_cache  # 단건 조회 캐시
+from app.todo.events import publish_todo_events  # 실시간 변경 이벤트 (NOTIFY)
+from app.todo.serializers import todo_row_columns  # 빠른 경로용 컬럼 목록
 from app.todo.schemas import (
+    Todo as TodoSchema,
+    TodoArchiveScope,
     TodoCreate,
+    TodoDateFilter,
     TodoUpdate,
 )  # Pydantic 스키마 (입력 및 업데이트용)
 
+# 목록 조회에서 항상 SELECT하는 응답 키 (다음 페이지 커서와 ETag 계산에 사용)
+TODO_ROW_KEYS = ("id", "createdAt", "updatedAt")
+
+# 오늘 마감 중 이미 지난 상태별 수 (날짜별, 워커 안에서 TODO_STATS_DUE_TODAY_CACHE_SECONDS 동안 재사용)
+_due_today_cache: LRUCache[Dict[TodoStatus, int]] = LRUCache(
+    max_size=2, ttl=settings.TODO_STATS_DUE_TODAY_CACHE_SECONDS
+)
+
 
 # ✅ 특정 ID의 Todo 가져오기
-async def get_todo(db: AsyncSession, todo_id: UUID) -> Optional[Todo]:
+async def get_todo(db: AsyncSession, todo_id: UUID) -> Optional[Union[Todo, TodoArchive]]:
     """
     주어진 todo_id에 해당하는 할 일(Todo)을 데이터베이스에서 조회합니다.
+    todo 테이블에 없으면 보관 테이블(todo_archive)에서 찾습니다.
 
     :param db: 데이터베이스 세션
     :param todo_id: 조회할 할 일의 ID
-    :return: Todo 객체 또는 None (존재하지 않는 경우)
+    :return: Todo 또는 TodoArchive 객체, 존재하지 않으면 None
     """
     result = await db.execute(select(Todo).where(Todo.id == todo_id))
-    return result.scalars().one_or_none()  # 존재하지 않으면 None 반환
+    db_todo = result.scalars().one_or_none()
+    if db_todo is None:
+        result = await db.execute(select(TodoArchive).where(TodoArchive.id == todo_id))
+        db_todo = result.scalars().one_or_none()
+    return db_todo  # 존재하지 않으면 None 반환
+
+
+# ✅ 특정 ID의 Todo를 필요한 컬럼만 행(dict)으로 가져오기
+async def get_todo_row(
+    db: AsyncSession, todo_id: UUID, fields: Optional[List[str]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    get_todo와 같이 조회하되(보관 테이블 포함), fields 컬럼만 SELECT해 camelCase 키의 dict로 반환합니다.
+
+    :param db: 데이터베이스 세션
+    :param todo_id: 조회할 할 일의 ID
+    :param fields: 조회할 응답 키 (ETag에 필요한 id, updatedAt은 항상 포함, None이면 전체)
+    :return: 행 dict 또는 None (존재하지 않는 경우)
+    """
+    columns = None if fields is None else {*fields, "id", "updatedAt"}
+    for source in (Todo, TodoArchive):
+        result = await db.execute(
+            select(*todo_row_columns(source, columns)).where(source.id == todo_id)
+        )
+        row = result.mappings().one_or_none()
+        if row is not None:
+            return dict(row)
+    return None
+
+
+# ✅ 특정 ID의 Todo 가져오기 (캐시 우선)
+async def get_todo_cached(db: AsyncSession, todo_id: UUID) -> Optional[TodoSchema]:
+    """
+    주어진 todo_id의 할 일(Todo)을 캐시에서 먼저 찾고, 없으면 데이터베이스에서 조회해 캐시합니다.
+    이 프로세스의 쓰기(create/update/delete)는 즉시 캐시에 반영됩니다.
+    - 캐시는 주 DB에서 읽은 값으로만 채웁니다 (지연된 복제본의 오래된/삭제된 행이 캐시되지 않도록).
+    - 쓰기 직후 클라이언트의 조회(sticky)는 캐시를 거치지 않고 주 DB에서 읽습니다.
+
+    :param db: 데이터베이스 세션
+    :param todo_id: 조회할 할 일의 ID
+    :return: Todo 스키마 또는 None (존재하지 않는 경우)
+    """
+
+    async def load() -> Optional[TodoSchema]:
+        db_todo = await get_todo(db, todo_id)
+        return TodoSchema.model_validate(db_todo) if db_todo else None
+
+    target = read_target(db)
+    if not settings.TODO_CACHE_ENABLED or target == "sticky":
+        return await load()
+    return await todo_cache.get_or_load(str(todo_id), load, store=target == "primary")
 
 
-# ✅ 모든 Todo 가져오기 (필요시 상태별 필터링 가능)
+def _period_overlaps(
+    lower: Optional[datetime], upper: Optional[datetime], source: Any = Todo
+):
+    """일정 기간이 [lower, upper)와 겹치는 조건 (todo는 ix_todo_period GiST 인덱스 사용)"""
+    return and_(
+        todo_has_period(source.start_date, source.end_date),  # 부분 인덱스 조건과 동일
+        todo_period(source.start_date, source.end_date).op("&&")(
+            func.tstzrange(lower, upper, "[)")
+        ),
+    )
+
+
+def _todo_date_filter(
+    query: Select, dates: Optional[TodoDateFilter], source: Any = Todo
+) -> Select:
+    """시작일/종료일 조건을 적용합니다."""
+    if dates is None:
+        return query
+    if dates.overlaps_from or dates.overlaps_to:
+        query = query.where(
+            _period_overlaps(dates.overlaps_from, dates.overlaps_to, source)
+        )
+    if dates.due_before:
+        query = query.where(source.end_date < dates.due_before)  # ix_todo_end_date
+    if dates.starts_after:
+        query = query.where(source.start_date >= dates.starts_after)  # ix_todo_start_date_end_date
+    return query
+
+
+def _todo_list_query(
+    query: Select,
+    status: Optional[TodoStatus] = None,
+    after: Optional[Tuple[datetime, UUID]] = None,
+    dates: Optional[TodoDateFilter] = None,
+    source: Any = Todo,  # Todo 또는 TodoArchive
+) -> Select:
+    """목록 조회 쿼리에 (created_at, id) 정렬과 상태/기간/커서 조건을 적용합니다."""
+    query = query.order_by(source.created_at, source.id)
+
+    if status:
+        query = query.where(source.status == status)  # 특정 상태만 필터링
+
+    query = _todo_date_filter(query, dates, source)
+
+    if after:
+        # (created_at, id) > (:created_at, :id) → 인덱스 범위 검색으로 처리됨
+        query = query.where(tuple_(source.created_at, source.id) > tuple_(*after))
+
+    return query
+
+
+def _todo_sources(archived: TodoArchiveScope, status: Optional[TodoStatus]) -> List[Any]:
+    """보관 범위(archived)와 상태 조건에 따라 읽을 테이블(Todo, TodoArchive) 목록을 반환합니다."""
+    sources = []
+    if archived != "only":
+        sources.append(Todo)
+    # 보관 테이블에는 완료(DONE)된 할 일만 있으므로 다른 상태를 찾을 때는 읽지 않음
+    if archived != "exclude" and status in (None, TodoStatus.DONE):
+        sources.append(TodoArchive)
+    return sources
+
+
+# ✅ Todo 목록 가져오기 (커서 페이지네이션, 필요시 상태별 필터링 가능)
 async def get_todos(
-    db: AsyncSession, status: Optional[TodoStatus] = None  # 특정 상태 필터링 (선택적)
+    db: AsyncSession,
+    status: Optional[TodoStatus] = None,  # 특정 상태 필터링 (선택적)
+    limit: int = 50,  # 최대 조회 개수
+    after: Optional[Tuple[datetime, UUID]] = None,  # 이 (created_at, id) 이후부터 조회
+    dates: Optional[TodoDateFilter] = None,  # 시작일/종료일 필터 (선택적)
 ) -> List[Todo]:
     """
-    모든 할 일(Todo) 목록을 가져오거나, 특정 상태에 따라 필터링하여 조회합니다.
+    할 일(Todo) 목록을 (created_at, id) 순서로 키셋(커서) 페이지네이션하여 조회합니다.
+    OFFSET 대신 마지막 행의 정렬 키 이후를 조회하므로 페이지 깊이와 무관하게 일정한 속도를 유지합니다.
 
     :param db: 데이터베이스 세션
     :param status: 필터링할 상태 (선택적)
+    :param limit: 최대 조회 개수
+    :param after: 이전 페이지 마지막 행의 (created_at, id) (선택적)
+    :param dates: 시작일/종료일 필터 (선택적)
     :return: Todo 객체 리스트
     """
-    query = select(Todo)  # 기본적으로 모든 Todo를 조회
+    query = _todo_list_query(
+        select(Todo), status=status, after=after, dates=dates
+    ).limit(limit)
+
+    result = await db.execute(query)
+    return result.scalars().all()  # 리스트 반환
+
+
+# ✅ Todo 목록을 ORM 객체 없이 행(dict)으로 가져오기 (목록 API 빠른 경로)
+async def get_todo_rows(
+    db: AsyncSession,
+    status: Optional[TodoStatus] = None,  # 특정 상태 필터링 (선택적)
+    limit: int = 50,  # 최대 조회 개수
+    after: Optional[Tuple[datetime, UUID]] = None,  # 이 (created_at, id) 이후부터 조회
+    dates: Optional[TodoDateFilter] = None,  # 시작일/종료일 필터 (선택적)
+    archived: TodoArchiveScope = "exclude",  # 보관된 할 일 포함 여부
+    fields: Optional[List[str]] = None,  # 조회할 응답 키 (None이면 전체)
+) -> List[Dict[str, Any]]:
+    """
+    get_todos와 같은 조건으로 조회하되, ORM 객체를 만들지 않고 camelCase 키의 dict로 반환합니다.
+    결과는 app.todo.serializers.dump_todo_page로 바로 직렬화할 수 있습니다.
+    보관된 할 일을 포함하면 두 테이블을 각각 (created_at, id) 인덱스로 limit개까지 읽어 합칩니다.
+
+    :param db: 데이터베이스 세션
+    :param status: 필터링할 상태 (선택적)
+    :param limit: 최대 조회 개수
+    :param after: 이전 페이지 마지막 행의 (created_at, id) (선택적)
+    :param dates: 시작일/종료일 필터 (선택적)
+    :param archived: exclude(todo만) / include(보관 포함) / only(보관만)
+    :param fields: 조회할 응답 키 (커서/ETag에 필요한 id, createdAt, updatedAt은 항상 포함)
+    :return: 행 dict 리스트
+    """
+    columns = None if fields is None else {*fields, *TODO_ROW_KEYS}
+    sources = _todo_sources(archived, status)
+    if not sources:
+        return []
+
+    queries = [
+        _todo_list_query(
+            select(*todo_row_columns(source, columns)),
+            status=status,
+            after=after,
+            dates=dates,
+            source=source,
+        ).limit(limit)
+        for source in sources
+    ]
+    if len(queries) == 1:
+        query = queries[0]
+    else:
+        merged = union_all(*queries).subquery("merged")
+        query = select(merged).order_by(merged.c.createdAt, merged.c.id).limit(limit)
+
+    result = await db.execute(query)
+    return [dict(row) for row in result.mappings()]
+
+
+# ✅ 검색어 → tsquery 문자열
+def build_search_query(text: str, max_terms: int = 16) -> Optional[str]:
+    """
+    검색어를 단어 단위로 나눠 모든 단어를 접두사로 포함하는 tsquery 문자열을 만듭니다.
+    예: "회의 준비" → "회의:* & 준비:*" (tsquery 연산자는 제거되므로 사용자 입력을 그대로 받아도 안전)
+
+    :param text: 사용자 검색어
+    :param max_terms: 사용할 최대 단어 수
+    :return: tsquery 문자열 또는 None (단어가 없는 경우)
+    """
+    terms = re.findall(r"[^\W_]+", text)[:max_terms]
+    return " & ".join(f"{term}:*" for term in terms) or None
+
+
+# ✅ 제목/내용 전문 검색 (GIN 인덱스, 커서 페이지네이션)
+async def search_todo_rows(
+    db: AsyncSession,
+    query: str,  # build_search_query로 만든 tsquery 문자열
+    status: Optional[TodoStatus] = None,  # 특정 상태 필터링 (선택적)
+    limit: int = 50,  # 최대 조회 개수
+    order: str = "rank",  # "rank": 관련도 순, "created": 생성 순
+    after: Optional[Tuple] = None,  # 이전 페이지 마지막 행의 정렬 키
+) -> List[Dict[str, Any]]:
+    """
+    search_vector(제목 가중치 A, 내용 가중치 B)에서 검색어와 일치하는 할 일을 조회합니다.
+    ix_todo_search_vector(GIN) 인덱스로 일치하는 행만 찾으므로 테이블 크기와 무관하게 빠릅니다.
+    각 행은 get_todo_rows와 같은 camelCase 키의 dict에 관련도 "rank" 키가 추가됩니다.
+
+    :param db: 데이터베이스 세션
+    :param query: tsquery 문자열
+    :param status: 필터링할 상태 (선택적)
+    :param limit: 최대 조회 개수
+    :param order: 정렬 순서 ("rank" 또는 "created")
+    :param after: rank 순이면 (rank, created_at, id), created 순이면 (created_at, id)
+    :return: 행 dict 리스트
+    """
+    tsquery = func.to_tsquery(cast(TODO_SEARCH_CONFIG, REGCONFIG), query)
+    rank = func.ts_rank_cd(Todo.search_vector, tsquery)
+
+    base = select(*todo_row_columns(), rank.label("rank")).where(
+        Todo.search_vector.op("@@")(tsquery)
+    )
+
+    if order == "created":
+        stmt = _todo_list_query(base, status=status, after=after)
+    else:
+        stmt = base.order_by(rank.desc(), Todo.created_at, Todo.id)
+        if status:
+            stmt = stmt.where(Todo.status == status)
+        if after:
+            # 관련도 내림차순 → 같은 관련도 안에서는 (created_at, id) 오름차순
+            after_rank = literal(after[0], REAL)
+            stmt = stmt.where(
+                or_(
+                    rank < after_rank,
+                    and_(
+                        rank == after_rank,
+                        tuple_(Todo.created_at, Todo.id) > tuple_(*after[1:]),
+                    ),
+                )
+            )
+
+    result = await db.execute(stmt.limit(limit))
+    return [dict(row) for row in result.mappings()]
+
+
+# ✅ Todo 전체를 서버 사이드 커서로 스트리밍 (대용량 내보내기용)
+async def stream_todos(
+    db: AsyncSession,
+    status: Optional[TodoStatus] = None,  # 특정 상태 필터링 (선택적)
+    batch_size: int = 500,  # 커서에서 한 번에 가져올 행 수
+    archived: TodoArchiveScope = "exclude",  # 보관된 할 일 포함 여부
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    할 일(Todo) 목록을 서버 사이드 커서로 읽어 batch_size개씩 묶어 반환합니다.
+    전체 결과를 메모리에 올리지 않으므로 테이블 크기와 무관하게 메모리 사용량이 일정합니다.
+    각 행은 get_todo_rows와 같은 camelCase 키의 dict입니다.
+
+    :param db: 데이터베이스 세션 (스트리밍이 끝날 때까지 열려 있어야 함)
+    :param status: 필터링할 상태 (선택적)
+    :param batch_size: 한 묶음의 크기
+    :param archived: exclude(todo만) / include(보관 포함) / only(보관만)
+    :return: 행 dict 리스트를 차례로 반환하는 비동기 이터레이터
+    """
+    queries = [
+        _todo_list_query(select(*todo_row_columns(source)), status=status, source=source)
+        for source in _todo_sources(archived, status)
+    ]
+    if not queries:
+        return
+    if len(queries) == 1:
+        query = queries[0]
+    else:
+        # 두 테이블을 각각 (created_at, id) 인덱스 순서로 읽어 합침 (Merge Append)
+        merged = union_all(*queries).subquery("merged")
+        query = select(merged).order_by(merged.c.createdAt, merged.c.id)
+    query = query.execution_options(yield_per=batch_size)  # asyncpg 서버 사이드 커서 사용
+
+    result = await db.stream(query)
+    async for partition in result.mappings().partitions():
+        yield [dict(row) for row in partition]
+
+
+# ✅ 날짜별 할 일 수 (달력 보기)
+async def count_todos_by_day(
+    db: AsyncSession,
+    days: List[Tuple[date, datetime, datetime]],  # (날짜, 하루 시작, 다음 날 시작)
+    status: Optional[TodoStatus] = None,  # 특정 상태 필터링 (선택적)
+) -> List[Tuple[date, int]]:
+    """
+    각 날짜의 [시작, 다음 날 시작) 구간과 기간이 겹치는 할 일 수를 쿼리 한 번으로 집계합니다.
+    날짜마다 ix_todo_period 인덱스를 한 번씩 탐색하므로 한 달 집계도 가볍습니다.
 
+    :param db: 데이터베이스 세션
+    :param days: 날짜와 그 날의 경계 시각 목록 (시간대는 호출하는 쪽에서 계산)
+    :param status: 필터링할 상태 (선택적)
+    :return: (날짜, 할 일 수) 리스트 (날짜 오름차순, 할 일이 없는 날은 0)
+    """
+    if not days:
+        return []
+
+    bounds = values(
+        column("day", Date),
+        column("lower", TIMESTAMP(timezone=True)),
+        column("upper", TIMESTAMP(timezone=True)),
+        name="days",
+    ).data(days)
+
+    on = _period_overlaps(bounds.c.lower, bounds.c.upper)
     if status:
-        query = query.where(Todo.status == status)  # 특정 상태만 필터링
+        on = and_(on, Todo.status == status)
 
+    query = (
+        select(bounds.c.day, func.count(Todo.id))
+        .select_from(bounds)
+        .outerjoin(Todo, on)
+        .group_by(bounds.c.day)
+        .order_by(bounds.c.day)
+    )
     result = await db.execute(query)
-    return result.scalars().all()  # 리스트 반환
+    return [(day, count) for day, count in result.all()]
+
+
+# ✅ 상태별 할 일 수 요약
+async def get_todo_stats(db: AsyncSession, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    트리거가 관리하는 todo_status_count 요약 테이블에서 상태별/마감 초과 할 일 수를 읽습니다 (보관된 할 일 포함).
+    todo 테이블 전체를 COUNT(*) 하지 않습니다. 요약 테이블은 날짜 단위라 오늘(UTC) 마감 중 이미 지난 수만
+    인덱스로 직접 세며, 그 결과는 TODO_STATS_DUE_TODAY_CACHE_SECONDS 동안 재사용합니다(그만큼 늦게 반영될 수 있음).
+
+    :param db: 데이터베이스 세션
+    :param now: 마감 초과 판단 기준 시각 (기본값: 현재 UTC 시각, 지정하면 캐시를 쓰지 않음)
+    :return: total, by_status, overdue, overdue_by_status, approximate_total, as_of
+    """
+    cacheable = now is None
+    now = now or utc_now()
+    today = now.astimezone(timezone.utc).date()
+    day_start = datetime.combine(today, datetime.min.time(), tzinfo=timezone.utc)
+
+    # 1️⃣ 상태별 전체 수 + 어제까지 마감인 수 (요약 테이블, 상태 × 마감일 × 샤드 행만 읽음)
+    summary = await db.execute(
+        select(
+            TodoStatusCount.status,
+            func.sum(TodoStatusCount.count),
+            func.coalesce(
+                func.sum(TodoStatusCount.count).filter(TodoStatusCount.due_day < today), 0
+            ),
+        ).group_by(TodoStatusCount.status)
+    )
+
+    # 2️⃣ 오늘 마감 중 이미 지난 수 (ix_todo_end_date로 오늘 마감인 행만 확인, 짧게 캐시)
+    due_today = _due_today_cache.get(today.isoformat()) if cacheable else None
+    if due_today is None:
+        result = await db.execute(
+            select(Todo.status, func.count())
+            .where(Todo.end_date >= day_start, Todo.end_date < now)
+            .group_by(Todo.status)
+        )
+        due_today = {status: count for status, count in result.all()}
+        if cacheable:
+            _due_today_cache.set(today.isoformat(), due_today)
+
+    # 3️⃣ 플래너 통계 기반 추정치 (ANALYZE/autovacuum 이후 갱신, 한 번도 없으면 -1, 보관 테이블 포함)
+    oid, reltuples = column("oid"), column("reltuples")
+    todo_oid = cast(literal("todo"), REGCLASS)
+    hot_tuples, all_tuples = (
+        await db.execute(
+            select(
+                func.max(reltuples).filter(oid == todo_oid),
+                func.sum(func.greatest(reltuples, 0)),
+            )
+            .select_from(table("pg_class"))
+            .where(oid.in_([todo_oid, cast(literal("todo_archive"), REGCLASS)]))
+        )
+    ).one()
+
+    by_status = {status: 0 for status in TodoStatus}
+    overdue_by_status = {status: 0 for status in TodoStatus if status != TodoStatus.DONE}
+    for status, count, overdue in summary.all():
+        by_status[status] = int(count)
+        if status in overdue_by_status:
+            overdue_by_status[status] += int(overdue)
+    for status, count in due_today.items():
+        if status in overdue_by_status:
+            overdue_by_status[status] += count
+
+    return {
+        "total": sum(by_status.values()),
+        "by_status": by_status,
+        "overdue": sum(overdue_by_status.values()),
+        "overdue_by_status": overdue_by_status,
+        "approximate_total": (
+            int(all_tuples) if hot_tuples is not None and hot_tuples >= 0 else None
+        ),
+        "as_of": now,
+    }
+
+
+# ✅ 변경 동기화 범위
+async def get_todo_change_bounds(db: AsyncSession) -> Tuple[int, int]:
+    """
+    변경 동기화에서 읽을 수 있는 트랜잭션 ID 범위를 조회합니다.
+    - upper: 현재 스냅샷의 xmin (이보다 작은 트랜잭션은 모두 커밋/롤백이 끝나 결과가 더 바뀌지 않음)
+    - horizon: 이 값 이하를 가리키는 토큰은 삭제 기록이 정리되었을 수 있어 사용할 수 없음
+
+    :param db: 데이터베이스 세션
+    :return: (upper, horizon)
+    """
+    result = await db.execute(
+        select(
+            text("pg_snapshot_xmin(pg_current_snapshot())::text::bigint"),
+            select(TodoSyncHorizon.change_xid).scalar_subquery(),
+        )
+    )
+    upper, horizon = result.one()
+    return upper, horizon or 0
+
+
+# ✅ 변경 토큰 이후의 생성/수정/삭제 목록
+async def get_todo_changes(
+    db: AsyncSession,
+    after: Tuple[int, UUID],  # 이 (change_xid, id) 이후부터 조회
+    upper: int,  # get_todo_change_bounds의 upper (이 트랜잭션 ID 미만만 조회)
+    limit: int = 50,  # 최대 조회 개수
+) -> List[Tuple[int, UUID, Optional[Dict[str, Any]]]]:
+    """
+    (change_xid, id) 순서로 after 이후, upper 미만인 변경을 조회합니다.
+    todo와 todo_tombstone을 각각 (change_xid, id) 인덱스로 limit개까지만 읽어 합치므로
+    비용은 테이블 크기가 아니라 변경 수에 비례합니다.
+
+    :param db: 데이터베이스 세션
+    :param after: 이전 응답 마지막 변경의 (change_xid, id)
+    :param upper: 읽을 트랜잭션 ID 상한 (미포함)
+    :param limit: 최대 조회 개수
+    :return: (change_xid, id, 행 dict 또는 삭제면 None) 리스트 (변경 순서)
+    """
+    todos = await db.execute(
+        select(Todo.change_xid, *todo_row_columns())
+        .where(
+            tuple_(Todo.change_xid, Todo.id) > tuple_(*after),
+            Todo.change_xid < upper,
+        )
+        .order_by(Todo.change_xid, Todo.id)
+        .limit(limit)
+    )
+    tombstones = await db.execute(
+        select(TodoTombstone.change_xid, TodoTombstone.id)
+        .where(
+            tuple_(TodoTombstone.change_xid, TodoTombstone.id) > tuple_(*after),
+            TodoTombstone.change_xid < upper,
+        )
+        .order_by(TodoTombstone.change_xid, TodoTombstone.id)
+        .limit(limit)
+    )
+
+    changes = []
+    for row in todos.mappings():
+        row = dict(row)
+        changes.append((row.pop("change_xid"), row["id"], row))
+    changes.extend((change_xid, todo_id, None) for change_xid, todo_id in tombstones.all())
+    changes.sort(key=lambda change: (change[0], change[1]))
+    return changes[:limit]
+
+
+# ✅ 보관 기간이 지난 삭제 기록 정리
+async def compact_todo_tombstones(
+    db: AsyncSession,
+    before: datetime,  # 이 시각 이전에 삭제된 기록을 정리
+    batch_size: int = 1000,  # 트랜잭션 하나에서 지울 최대 행 수
+) -> int:
+    """
+    before 이전의 tombstone을 batch_size개씩 지우고, 지운 기록의 최대 change_xid로
+    todo_sync_horizon을 올립니다 (같은 트랜잭션). 여러 워커가 동시에 실행해도
+    SKIP LOCKED로 서로 다른 행을 지웁니다.
+
+    :param db: 데이터베이스 세션
+    :param before: 정리 기준 시각
+    :param batch_size: 한 번에 지울 최대 행 수
+    :return: 지운 행 수
+    """
+    deleted = 0
+    while True:
+        targets = (
+            select(TodoTombstone.id)
+            .where(TodoTombstone.deleted_at < before)
+            .order_by(TodoTombstone.deleted_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        purged = (
+            delete(TodoTombstone)
+            .where(TodoTombstone.id.in_(targets))
+            .returning(TodoTombstone.change_xid)
+            .cte("purged")
+        )
+        result = await db.execute(
+            update(TodoSyncHorizon)
+            .values(
+                change_xid=func.greatest(
+                    TodoSyncHorizon.change_xid,
+                    select(func.max(purged.c.change_xid)).scalar_subquery(),
+                )
+            )
+            .returning(select(func.count()).select_from(purged).scalar_subquery())
+            .execution_options(synchronize_session=False)
+        )
+        count = result.scalar_one()
+        await db.commit()
+        deleted += count
+        if count < batch_size:
+            return deleted
 
 
 # ✅ 새로운 Todo 생성
 async def create_todo(db: AsyncSession, todo: TodoCreate) -> Todo:
     """
     새로운 할 일(Todo)을 데이터베이스에 생성합니다.
+    커밋하지 않으므로 세션을 만든 쪽(get_db)이 커밋해야 반영됩니다.
 
     :param db: 데이터베이스 세션
     :param todo: 생성할 할 일의 데이터 (Pydantic 스키마)
@@ -63,55 +616,214 @@ async def create_todo(db: AsyncSession, todo: TodoCreate) -> Todo:
         end_date=todo.end_date,
     )
     db.add(db_todo)  # 데이터베이스에 추가
-    await db.commit()  # 트랜잭션 커밋
-    await db.refresh(db_todo)  # 최신 상태로 갱신
-    return db_todo  # 생성된 Todo 반환
+    await db.flush()  # INSERT 실행 (ID/생성 시간 확정)
+    await publish_todo_events(
+        db, "created", [TodoSchema.model_validate(db_todo).model_dump_json(by_alias=True)]
+    )
+    todo_key = str(db_todo.id)
+    after_commit(db, lambda: todo_cache.invalidate(todo_key))  # 커밋 후 캐시 무효화
+    return db_todo  # 생성된 Todo 반환 (커밋은 호출한 쪽에서)
+
+
+# ✅ 여러 Todo 일괄 생성
+async def create_todos(
+    db: AsyncSession,
+    todos: List[TodoCreate],
+    chunk_size: int = 1000,  # INSERT 한 번에 넣을 최대 행 수
+) -> List[Todo]:
+    """
+    여러 할 일(Todo)을 하나의 트랜잭션에서 일괄 생성합니다.
+    chunk_size개씩 다중 행 INSERT ... RETURNING 한 번으로 삽입하므로 행마다 왕복하지 않습니다.
+    모든 chunk는 세션을 만든 쪽(get_db)이 한 번에 커밋합니다.
+
+    :param db: 데이터베이스 세션
+    :param todos: 생성할 할 일 데이터 목록 (Pydantic 스키마)
+    :param chunk_size: INSERT 한 번에 넣을 최대 행 수
+    :return: 생성된 Todo 객체 리스트 (입력 순서와 동일)
+    """
+    rows = [todo.model_dump() for todo in todos]
+    created: List[Todo] = []
+
+    for start in range(0, len(rows), chunk_size):
+        result = await db.scalars(
+            # sort_by_parameter_order: RETURNING 결과를 입력 순서대로 정렬
+            insert(Todo).returning(Todo, sort_by_parameter_order=True),
+            rows[start : start + chunk_size],
+        )
+        chunk = result.all()
+        await publish_todo_events(
+            db,
+            "created",
+            [TodoSchema.model_validate(t).model_dump_json(by_alias=True) for t in chunk],
+        )
+        created.extend(chunk)
+
+    return created
 
 
 # ✅ 기존 Todo 업데이트
 async def update_todo(
-    db: AsyncSession, todo_id: UUID, todo_update: TodoUpdate
+    db: AsyncSession,
+    todo_id: UUID,
+    todo_update: TodoUpdate,
+    expected_versions: Optional[List[datetime]] = None,  # If-Match 조건 (선택적)
 ) -> Optional[Todo]:
     """
     주어진 ID의 할 일(Todo)을 업데이트합니다.
+    사전 조회 없이 UPDATE ... RETURNING 한 번으로 변경하고 변경된 행을 돌려받습니다.
+    커밋하지 않으므로 세션을 만든 쪽(get_db)이 커밋해야 반영됩니다.
 
     :param db: 데이터베이스 세션
     :param todo_id: 업데이트할 Todo의 ID
     :param todo_update: 업데이트할 데이터 (Pydantic 스키마)
-    :return: 업데이트된 Todo 객체 또는 None (존재하지 않는 경우)
+    :param expected_versions: 주어지면 updated_at이 이 값 중 하나일 때만 변경 (낙관적 동시성 제어)
+    :return: 업데이트된 Todo 객체 또는 None (존재하지 않거나 버전이 다른 경우)
     """
-    db_todo = await get_todo(db, todo_id)  # 기존 데이터 조회
-    if not db_todo:
-        return None  # 존재하지 않으면 None 반환
-
     # Pydantic 스키마에서 변경된 필드만 가져오기
     update_data = todo_update.model_dump(exclude_unset=True)
 
     # ✅ 업데이트 시간 자동 설정
-    update_data["updated_at"] = datetime.now(timezone.utc).replace(tzinfo=None)
+    update_data["updated_at"] = utc_now()
 
-    # 필드 업데이트
-    for key, value in update_data.items():
-        setattr(db_todo, key, value)
+    query = update(Todo).where(Todo.id == todo_id)
+    if expected_versions is not None:
+        query = query.where(Todo.updated_at.in_(expected_versions))  # 버전 일치 시에만 변경
+    query = (
+        query.values(**update_data)
+        .returning(Todo)
+        .execution_options(synchronize_session=False)  # 세션 내 객체 동기화 생략
+    )
 
-    await db.commit()  # 트랜잭션 커밋
-    await db.refresh(db_todo)  # 최신 상태로 갱신
-    return db_todo  # 업데이트된 Todo 반환
+    result = await db.execute(query)
+    db_todo = result.scalars().one_or_none()  # 존재하지 않으면 None
+    if db_todo is None and await restore_archived_todo(db, todo_id):
+        # 보관된 할 일이면 todo 테이블로 되돌린 뒤 다시 변경 (같은 트랜잭션, 실패하면 함께 롤백)
+        result = await db.execute(query)
+        db_todo = result.scalars().one_or_none()
+    updated = TodoSchema.model_validate(db_todo) if db_todo is not None else None
+    if updated is not None:
+        await publish_todo_events(db, "updated", [updated.model_dump_json(by_alias=True)])
+
+    # ✅ 커밋된 뒤 최신 값으로 캐시 갱신 (존재하지 않으면 무효화)
+    if updated is not None:
+        after_commit(db, lambda: todo_cache.set(str(todo_id), updated))
+    else:
+        after_commit(db, lambda: todo_cache.invalidate(str(todo_id)))
+    return db_todo  # 업데이트된 Todo 반환 (커밋은 호출한 쪽에서)
 
 
 # ✅ Todo 삭제
-async def delete_todo(db: AsyncSession, todo_id: UUID) -> bool:
+async def delete_todo(
+    db: AsyncSession,
+    todo_id: UUID,
+    expected_versions: Optional[List[datetime]] = None,  # If-Match 조건 (선택적)
+) -> bool:
     """
     주어진 ID의 할 일(Todo)을 삭제합니다.
+    사전 조회 없이 DELETE ... RETURNING 한 번으로 삭제 여부를 확인합니다.
+    커밋하지 않으므로 세션을 만든 쪽(get_db)이 커밋해야 반영됩니다.
 
     :param db: 데이터베이스 세션
     :param todo_id: 삭제할 Todo의 ID
-    :return: 삭제 성공 여부 (True: 성공, False: 존재하지 않음)
+    :param expected_versions: 주어지면 updated_at이 이 값 중 하나일 때만 삭제 (낙관적 동시성 제어)
+    :return: 삭제 성공 여부 (True: 성공, False: 존재하지 않거나 버전이 다름)
     """
-    db_todo = await get_todo(db, todo_id)  # 기존 데이터 조회
-    if not db_todo:
-        return False  # 존재하지 않으면 False 반환
+    query = delete(Todo).where(Todo.id == todo_id)
+    if expected_versions is not None:
+        query = query.where(Todo.updated_at.in_(expected_versions))  # 버전 일치 시에만 삭제
+
+    result = await db.execute(
+        query.returning(Todo.id)
+        .execution_options(synchronize_session=False)
+    )
+    deleted = result.scalar_one_or_none() is not None
+    if not deleted:
+        # 보관된 할 일 삭제 (삭제 기록(tombstone)은 todo_archive의 삭제 트리거가 남김)
+        query = delete(TodoArchive).where(TodoArchive.id == todo_id)
+        if expected_versions is not None:
+            query = query.where(TodoArchive.updated_at.in_(expected_versions))
+        result = await db.execute(
+            query.returning(TodoArchive.id).execution_options(synchronize_session=False)
+        )
+        deleted = result.scalar_one_or_none() is not None
+    if deleted:
+        await publish_todo_events(db, "deleted", [f'{{"id":"{todo_id}"}}'])
+
+    after_commit(db, lambda: todo_cache.invalidate(str(todo_id)))  # 커밋 후 캐시 무효화
+    return deleted  # 삭제 성공 여부 (커밋은 호출한 쪽에서)
+
 
-    await db.delete(db_todo)  # 삭제 실행
-    await db.commit()  # 트랜잭션 커밋
-    return True  # 삭제 성공
+# ✅ 보관된 Todo를 todo 테이블로 되돌리기
+async def restore_archived_todo(db: AsyncSession, todo_id: UUID) -> bool:
+    """
+    보관 테이블(todo_archive)의 할 일을 todo 테이블로 옮깁니다 (DELETE ... RETURNING → INSERT 한 문).
+    되돌린 행은 새 change_xid를 받아 변경 동기화에 다시 나타납니다.
+    커밋하지 않으므로 세션을 만든 쪽(get_db)이 커밋해야 반영됩니다.
+
+    :param db: 데이터베이스 세션
+    :param todo_id: 되돌릴 할 일의 ID
+    :return: 되돌렸으면 True, 보관된 할 일이 아니면 False
+    """
+    columns = [getattr(TodoArchive, name) for name in TODO_ARCHIVE_COLUMNS]
+    restored = (
+        delete(TodoArchive)
+        .where(TodoArchive.id == todo_id)
+        .returning(*columns)
+        .cte("restored")
+    )
+    result = await db.execute(
+        insert(Todo)
+        .add_cte(restored)
+        .from_select(TODO_ARCHIVE_COLUMNS, select(*restored.c))
+        .returning(Todo.id)
+    )
+    return result.scalar_one_or_none() is not None
+
+
+# ✅ 오래된 완료 Todo를 보관 테이블로 옮기기
+async def archive_todos(
+    db: AsyncSession,
+    before: datetime,  # 이 시각 이전에 마지막으로 수정된 완료 할 일을 보관
+    batch_size: int = 1000,  # 트랜잭션 하나에서 옮길 최대 행 수
+) -> int:
+    """
+    완료(DONE) 상태로 before 이전부터 수정되지 않은 할 일을 batch_size개씩 todo_archive로 옮깁니다.
+    batch마다 DELETE ... RETURNING → INSERT 한 문으로 옮기고 바로 커밋하므로 잠금은 짧고,
+    중간에 멈춰도 다음 실행이 남은 행부터 이어서 처리합니다. 여러 워커가 동시에 실행해도
+    SKIP LOCKED로 서로 다른 행을 옮깁니다.
+    상태별 요약(todo_status_count)은 트리거가 함께 갱신하며, 옮긴 행은 여전히 ID로 조회/수정할 수 있으므로
+    삭제 기록(todo_tombstone)은 남지 않습니다 (변경 동기화에서 삭제로 전달되지 않음).
+
+    :param db: 데이터베이스 세션
+    :param before: 보관 기준 시각
+    :param batch_size: 한 번에 옮길 최대 행 수
+    :return: 옮긴 행 수
+    """
+    columns = [getattr(Todo, name) for name in TODO_ARCHIVE_COLUMNS]
+    archived = 0
+    while True:
+        targets = (
+            select(Todo.id)
+            .where(Todo.status == TodoStatus.DONE, Todo.updated_at < before)  # ix_todo_done_updated_at
+            .order_by(Todo.updated_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        moved = (
+            delete(Todo)
+            .where(Todo.id.in_(targets))
+            .returning(*columns)
+            .cte("moved")
+        )
+        result = await db.execute(
+            insert(TodoArchive)
+            .add_cte(moved)
+            .from_select(TODO_ARCHIVE_COLUMNS, select(*moved.c))
+            .returning(TodoArchive.id)
+        )
+        ids = result.scalars().all()
+        await publish_todo_events(db, "archived", [f'{{"id":"{todo_id}"}}' for todo_id in ids])
+        await db.commit()
+        archived += len(ids)
+        if len(ids) < batch_size:
+            return archived
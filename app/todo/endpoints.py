@@ -1,35 +1,159 @@
 # app/api/v1/endpoints/todo.py
 from fastapi import (
     APIRouter,
+    Body,
     Depends,
+    Header,
     HTTPException,
     Query,
     Path,
+    Request,
+    Response,
     status,
 )  # FastAPI 관련 모듈
+from fastapi.responses import StreamingResponse  # 스트리밍 응답
 from sqlalchemy.ext.asyncio import AsyncSession  # 비동기 데이터베이스 세션
-from typing import List, Optional  # 리스트 및 선택적 파라미터 지원
+from pydantic import ValidationError  # 항목별 검증 오류
+from datetime import date, datetime, time as dt_time, timedelta  # If-Match 버전 / 달력 날짜
+from typing import Any, Dict, List, Literal, NoReturn, Optional  # 리스트 및 선택적 파라미터 지원
 from uuid import UUID  # UUID 타입 지원
 import logging  # 로깅 설정
+import time  # 일괄 생성 처리량 측정
 
 from app.todo.schemas import (
     Todo as TodoSchema,
     TodoCreate,
     TodoUpdate,
     TodoStatus,
+    TodoPage,
+    TodoBulkError,
+    TodoBulkResult,
+    TodoCalendar,
+    TodoCalendarDay,
+    TodoChange,
+    TodoChanges,
+    TodoArchiveScope,
+    TodoDateFilter,
+    TodoStats,
 )  # Pydantic 스키마
 from app.todo.crud import (  # CRUD 기능 임포트
     get_todo,
-    get_todos,
+    get_todo_cached,
+    get_todo_row,
+    get_todo_rows,
+    count_todos_by_day,
+    get_todo_stats,
+    get_todo_change_bounds,
+    get_todo_changes,
+    build_search_query,
+    search_todo_rows,
+    stream_todos,
     create_todo,
+    create_todos,
     update_todo,
     delete_todo,
 )
-from app.db.session import get_db  # DB 세션 의존성
+from app.todo.serializers import (  # 빠른 직렬화
+    dump_todo_fields,
+    dump_todo_ndjson,
+    dump_todo_page,
+    dump_todo_schema_fields,
+    parse_todo_fields,
+)
+from app.todo.events import todo_events  # 실시간 변경 이벤트 브로커
+from app.core.events import sse_frame  # SSE 메시지 형식
+from app.core.coalescing import CoalescerFull  # 생성 묶음 처리 대기열 초과
+from app.todo.coalescing import todo_create_coalescer  # 단건 생성 묶음 처리
+from app.db.statements import StatementTimeout  # SQL 실행 시간 한도 초과
+from app.db.session import (  # DB 세션 의존성 (쓰기/조회)
+    get_db,
+    get_read_db,
+    read_session,
+    release,
+)
+from app.core.config import settings  # 페이지 크기 설정
+from app.shared.models import KST_ZONE  # 달력 기본 시간대
+from app.shared.pagination import (  # 커서 인코딩/디코딩
+    InvalidCursorError,
+    decode_change_token,
+    decode_created_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+)
+from app.shared.etag import (  # ETag 생성 및 조건부 요청 처리
+    digest_etag,
+    if_match_tags,
+    none_match,
+    parse_version_etag,
+    version_etag,
+)
 
 logger = logging.getLogger(__name__)  # 로깅 설정
 router = APIRouter()  # FastAPI 라우터 생성
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"  # 줄 단위 JSON 스트리밍 형식
+
+
+def _expected_versions(if_match: Optional[str], todo_id: UUID) -> Optional[List[datetime]]:
+    """
+    If-Match 헤더를 updated_at 조건 목록으로 변환합니다.
+    헤더가 없거나 "*"이면 None(조건 없음)을 반환합니다.
+    """
+    if if_match is None:
+        return None
+    tags = if_match_tags(if_match)
+    if "*" in tags:
+        return None
+
+    versions = []
+    for tag in tags:
+        parsed = parse_version_etag(tag)
+        if parsed is not None and parsed[0] == todo_id:
+            versions.append(parsed[1])
+    if not versions:
+        # 이 리소스의 ETag가 아니면 어떤 버전과도 일치할 수 없음
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="If-Match 조건이 현재 할 일과 일치하지 않습니다",
+        )
+    return versions
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """fields 쿼리 값을 응답 키 목록으로 변환합니다 (알 수 없는 키가 있으면 400)."""
+    try:
+        return parse_todo_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+def _statement_timeout(error: StatementTimeout) -> HTTPException:
+    """SQL 실행 시간/잠금 대기 한도 초과를 503으로 변환합니다 (커넥션을 오래 점유하지 않도록 DB가 취소한 경우)."""
+    logger.warning(f"SQL 실행 한도 초과 ({error.kind}): {str(error)}")
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="요청 처리 시간이 초과되었습니다. 잠시 후 다시 시도해주세요",
+        headers={"Retry-After": "1"},
+    )
+
+
+FIELDS_DESCRIPTION = "응답에 포함할 필드 (camelCase, 쉼표로 구분, 예: id,title,status, 생략하면 전체)"
+
+
+async def _raise_not_found_or_precondition_failed(
+    db: AsyncSession, todo_id: UUID, expected_versions: Optional[List[datetime]]
+) -> NoReturn:
+    """변경된 행이 없을 때 404(존재하지 않음)와 412(버전 불일치)를 구분해 예외를 발생시킵니다."""
+    if expected_versions is not None and await get_todo(db=db, todo_id=todo_id):
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"ID가 {todo_id}인 할 일이 그 사이 변경되었습니다",
+        )
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"ID가 {todo_id}인 할 일을 찾을 수 없습니다",
+    )
+
 
 # ✅ 새로운 Todo 생성 (POST 요청)
 @router.post("/", response_model=TodoSchema, status_code=status.HTTP_201_CREATED)
@@ -44,10 +168,21 @@ async def create_new_todo(todo: TodoCreate, db: AsyncSession = Depends(get_db)):
     - **end_date**: 종료 날짜 (선택)
     """
     try:
+        if settings.TODO_CREATE_COALESCE_ENABLED:
+            # 동시에 들어온 생성 요청과 묶어 다중 행 INSERT 한 번으로 생성 (묶음 단위로 커밋)
+            return await todo_create_coalescer.submit(todo)
         db_todo = await create_todo(db=db, todo=todo)  # 새로운 Todo 생성
         return TodoSchema.model_validate(
             db_todo
         )  # SQLAlchemy 모델을 Pydantic 스키마로 변환하여 반환
+    except CoalescerFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="생성 요청이 너무 많습니다. 잠시 후 다시 시도해주세요",
+            headers={"Retry-After": "1"},
+        )
+    except StatementTimeout as e:
+        raise _statement_timeout(e)
     except Exception as e:
         logger.error(f"할 일 생성 중 오류: {str(e)}")  # 오류 로그 기록
         raise HTTPException(
@@ -56,25 +191,434 @@ async def create_new_todo(todo: TodoCreate, db: AsyncSession = Depends(get_db)):
         )
 
 
+# ✅ 여러 Todo 일괄 생성 (POST 요청)
+@router.post(
+    "/bulk", response_model=TodoBulkResult, status_code=status.HTTP_201_CREATED
+)
+async def create_new_todos(
+    items: List[Dict[str, Any]] = Body(
+        ...,
+        max_length=settings.TODO_BULK_MAX_ITEMS,
+        description="생성할 할 일 목록 (각 항목은 단건 생성과 같은 형식)",
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    여러 할 일 항목을 한 번에 생성합니다.
+
+    - 각 항목을 개별 검증하며, 검증에 실패한 항목은 **errors**에 위치(index)와 함께 반환됩니다.
+    - 검증을 통과한 항목은 하나의 트랜잭션에서 다중 행 INSERT로 생성되어 **created**에 반환됩니다.
+    """
+    valid: List[TodoCreate] = []
+    errors: List[TodoBulkError] = []
+    for index, item in enumerate(items):
+        try:
+            valid.append(TodoCreate.model_validate(item))
+        except ValidationError as e:
+            errors.append(
+                TodoBulkError(
+                    index=index,
+                    errors=[
+                        f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}"
+                        if err["loc"]
+                        else err["msg"]
+                        for err in e.errors()
+                    ],
+                )
+            )
+
+    try:
+        started = time.perf_counter()
+        db_todos = await create_todos(
+            db=db, todos=valid, chunk_size=settings.TODO_BULK_CHUNK_SIZE
+        )
+        elapsed = time.perf_counter() - started
+        if db_todos:
+            logger.info(
+                f"할 일 {len(db_todos)}건 일괄 생성: {elapsed:.3f}s "
+                f"({len(db_todos) / elapsed:.0f} rows/s)"
+            )
+        return TodoBulkResult(
+            created=[TodoSchema.model_validate(todo) for todo in db_todos],
+            errors=errors,
+        )
+    except StatementTimeout as e:
+        raise _statement_timeout(e)
+    except Exception as e:
+        logger.error(f"할 일 일괄 생성 중 오류: {str(e)}")  # 오류 로그 기록
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="할 일 일괄 생성 중 오류가 발생했습니다",
+        )
+
+
+# ✅ Todo 전체 내보내기 (GET 요청, NDJSON 스트리밍)
+# 주의: "/{todo_id}" 보다 먼저 선언해야 "export"가 ID로 해석되지 않음
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def export_todos(
+    request: Request,
+    status_filter: Optional[TodoStatus] = Query(
+        None, alias="status", description="할 일 상태로 필터링"
+    ),
+    archived: TodoArchiveScope = Query(
+        "exclude", description="보관된(오래된 완료) 할 일: exclude(제외) / include(포함) / only(보관된 것만)"
+    ),
+):
+    """
+    모든 할 일 항목을 한 줄에 하나씩 JSON(NDJSON)으로 스트리밍합니다.
+    DB 서버 사이드 커서로 읽은 행을 바로 전송하므로 대용량 내보내기에도 메모리 사용량이 일정합니다.
+    - **archived**: 목록 조회와 같이 기본적으로 보관된 할 일은 제외합니다 (include/only로 포함).
+    """
+
+    async def generate():
+        # 응답 스트리밍이 끝날 때까지 커서를 유지해야 하므로 요청 의존성(get_read_db)과 별도의 세션 사용
+        async with read_session(request) as session:
+            async for rows in stream_todos(db=session, status=status_filter, archived=archived):
+                yield dump_todo_ndjson(rows)
+
+    return StreamingResponse(generate(), media_type=NDJSON_MEDIA_TYPE)
+
+
+# ✅ 실시간 변경 이벤트 (GET 요청, Server-Sent Events)
+# 주의: "/{todo_id}" 보다 먼저 선언해야 "events"가 ID로 해석되지 않음
+@router.get(
+    "/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_todo_events(
+    last_event_id: Optional[str] = Header(
+        None, description="재연결 시 마지막으로 받은 이벤트 ID (EventSource가 자동 전송)"
+    ),
+    last_event_id_query: Optional[str] = Query(
+        None, alias="lastEventId", description="Last-Event-ID 헤더를 보낼 수 없을 때 사용"
+    ),
+):
+    """
+    할 일 생성/수정/삭제 이벤트를 Server-Sent Events로 전달합니다.
+    - **created / updated**: data는 변경된 할 일 (조회 응답과 같은 형식)
+    - **deleted**: data는 {"id": ...}
+    - **archived**: 오래된 완료 할 일이 보관됨 (목록에서 빠지며 ID로는 계속 조회 가능), data는 {"id": ...}
+    - **reset**: 이벤트를 이어 받을 수 없으므로 목록을 다시 조회해야 함
+    - **evicted**: 이벤트를 너무 늦게 읽어 연결이 종료됨 (다시 연결하면 이어 받음)
+    - 재연결 시 Last-Event-ID로 마지막 이벤트 이후부터 이어 받습니다.
+    """
+    subscriber = todo_events.subscribe(last_event_id or last_event_id_query)
+    if subscriber is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="구독자 수가 너무 많습니다. 잠시 후 다시 시도해주세요",
+        )
+
+    async def generate():
+        try:
+            yield b"retry: 3000\n\n"  # 연결이 끊기면 3초 후 재연결
+            while True:
+                frame = await subscriber.get(settings.TODO_EVENTS_HEARTBEAT_SECONDS)
+                if frame is None:
+                    yield sse_frame("evicted", '{"reason":"slow_consumer"}')
+                    return
+                yield frame or b": ping\n\n"  # 이벤트가 없으면 연결 유지용 주석
+        finally:
+            todo_events.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# ✅ 변경 동기화 (GET 요청, 변경 토큰 이후의 생성/수정/삭제)
+# 주의: "/{todo_id}" 보다 먼저 선언해야 "changes"가 ID로 해석되지 않음
+@router.get("/changes", response_model=TodoChanges)
+async def read_todo_changes(
+    since: Optional[str] = Query(
+        None, description="이전 응답의 nextToken (처음 동기화할 때는 생략)"
+    ),
+    limit: int = Query(
+        settings.TODO_PAGE_SIZE_DEFAULT,
+        ge=1,
+        le=settings.TODO_PAGE_SIZE_MAX,
+        description="한 번에 조회할 최대 변경 수",
+    ),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    변경 토큰(**since**) 이후에 생성/수정/삭제된 할 일을 변경 순서대로 반환합니다.
+    - 생성/수정은 **op=upsert**와 현재 값, 삭제는 **op=delete**와 ID만 반환합니다.
+      보관 테이블로 옮겨진 할 일은 여전히 ID로 조회할 수 있으므로 delete로 전달하지 않습니다.
+    - 응답의 **nextToken**을 저장해 두고 다음 동기화 때 **since**로 전달합니다.
+      **hasMore**가 true면 바로 이어서 요청합니다.
+    - **since**를 생략하면 전체 목록을 처음부터 반환합니다 (모르는 ID의 delete는 무시).
+    - 삭제 기록 보관 기간보다 오래된 토큰은 **410 Gone**을 반환하며, 이때는 since 없이 다시 동기화합니다.
+    """
+    try:
+        after = decode_change_token(since) if since else None
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    try:
+        upper, horizon = await get_todo_change_bounds(db)
+        if after is not None and after[0] <= horizon:
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail="변경 토큰이 만료되었습니다. since 없이 전체 동기화하세요",
+            )
+
+        start = after or (0, UUID(int=0))
+        # 다음 페이지 존재 여부를 알기 위해 limit + 1개를 조회
+        changes = await get_todo_changes(db=db, after=start, upper=upper, limit=limit + 1)
+        await release(db)  # 직렬화 전에 커넥션 반환
+        has_more = len(changes) > limit
+        if has_more:
+            changes = changes[:limit]
+            next_token = changes[-1][:2]
+        else:
+            # upper 미만은 모두 읽었으므로 다음에는 upper부터 (토큰은 뒤로 가지 않음)
+            next_token = max(start, (upper, UUID(int=0)))
+
+        return TodoChanges(
+            changes=[
+                TodoChange(op="delete", id=todo_id)
+                if row is None
+                else TodoChange(op="upsert", id=todo_id, todo=TodoSchema.model_validate(row))
+                for _, todo_id, row in changes
+            ],
+            next_token=encode_cursor(*next_token),
+            has_more=has_more,
+        )
+    except HTTPException:
+        raise
+    except StatementTimeout as e:
+        raise _statement_timeout(e)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"변경 목록 조회 중 오류가 발생했습니다: {str(e)}",
+        )
+
+
+# ✅ Todo 전문 검색 (GET 요청)
+# 주의: "/{todo_id}" 보다 먼저 선언해야 "search"가 ID로 해석되지 않음
+@router.get("/search", response_model=TodoPage)
+async def search_todos(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (제목/내용)"),
+    status_filter: Optional[TodoStatus] = Query(
+        None, alias="status", description="할 일 상태로 필터링"
+    ),
+    order: Literal["rank", "created"] = Query(
+        "rank", description="정렬 순서 (rank: 관련도 순, created: 생성 순)"
+    ),
+    limit: int = Query(
+        settings.TODO_PAGE_SIZE_DEFAULT,
+        ge=1,
+        le=settings.TODO_PAGE_SIZE_MAX,
+        description="한 페이지에 조회할 최대 개수",
+    ),
+    cursor: Optional[str] = Query(
+        None, description="이전 응답의 nextCursor (첫 페이지는 생략)"
+    ),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    제목과 내용에서 검색어를 찾아 페이지 단위로 반환합니다.
+    - 각 단어는 접두사로 검색됩니다 (예: "회" → "회의", "회식").
+    - 여러 단어는 모두 포함된 항목만 찾습니다.
+    - 기본 정렬은 관련도 순(제목 일치가 내용 일치보다 높음)이며, **order=created**면 생성 순입니다.
+    - 페이지네이션은 목록 조회와 같이 **nextCursor**를 **cursor**로 전달합니다.
+    """
+    query = build_search_query(q)
+    if query is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="검색어에 단어가 없습니다"
+        )
+
+    try:
+        after = None
+        if cursor and order == "created":
+            after = decode_created_cursor(cursor)
+        elif cursor:
+            after = decode_rank_cursor(cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    try:
+        # 다음 페이지 존재 여부를 알기 위해 limit + 1개를 조회
+        rows = await search_todo_rows(
+            db=db,
+            query=query,
+            status=status_filter,
+            limit=limit + 1,
+            order=order,
+            after=after,
+        )
+        await release(db)  # 직렬화 전에 커넥션 반환
+        ranks = [row.pop("rank") for row in rows]  # 응답에는 포함하지 않음
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            keys = (last["createdAt"], last["id"])
+            if order == "rank":
+                keys = (ranks[limit - 1],) + keys
+            next_cursor = encode_cursor(*keys)
+
+        return Response(
+            content=dump_todo_page(rows, next_cursor), media_type="application/json"
+        )
+    except StatementTimeout as e:
+        raise _statement_timeout(e)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"할 일 검색 중 오류가 발생했습니다: {str(e)}",
+        )
+
+
+# ✅ 상태별 할 일 수 요약 (대시보드용)
+# 주의: "/{todo_id}" 보다 먼저 선언해야 "stats"가 ID로 해석되지 않음
+@router.get("/stats", response_model=TodoStats)
+async def read_todo_stats(db: AsyncSession = Depends(get_read_db)):
+    """
+    상태별 할 일 수와 마감이 지난 할 일 수를 반환합니다 (보관된 완료 할 일도 DONE에 포함).
+    - 생성/수정/삭제 시 트리거가 갱신하는 요약 테이블에서 읽으므로 데이터 양과 무관하게 빠릅니다.
+    - **overdue**: 종료일이 지났지만 DONE이 아닌 할 일 수 (오늘 마감분은 최대 TODO_STATS_DUE_TODAY_CACHE_SECONDS초 늦게 반영)
+    - **approximateTotal**: DB 통계 기반 추정 행 수 (매우 큰 테이블에서 참고용)
+    """
+    try:
+        stats = await get_todo_stats(db=db)
+        await release(db)
+        return TodoStats(**stats)
+    except StatementTimeout as e:
+        raise _statement_timeout(e)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"할 일 통계 조회 중 오류가 발생했습니다: {str(e)}",
+        )
+
+
+# ✅ 날짜별 할 일 수 (달력 월 보기용)
+# 주의: "/{todo_id}" 보다 먼저 선언해야 "calendar"가 ID로 해석되지 않음
+@router.get("/calendar", response_model=TodoCalendar)
+async def read_todo_calendar(
+    start: date = Query(..., description="시작 날짜 (포함)"),
+    end: date = Query(..., description="끝 날짜 (제외)"),
+    time_zone: str = Query(KST_ZONE, alias="tz", description="날짜 경계 시간대 (IANA 이름)"),
+    status_filter: Optional[TodoStatus] = Query(
+        None, alias="status", description="할 일 상태로 필터링"
+    ),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    [start, end) 기간의 날짜마다 그날과 일정(시작일~종료일)이 겹치는 할 일 수를 반환합니다.
+    - 날짜 경계는 **tz** 시간대의 자정 기준입니다 (기본: Asia/Seoul).
+    - 여러 날에 걸친 할 일은 해당하는 모든 날에 집계됩니다.
+    - 최대 366일까지 조회할 수 있습니다.
+    """
+    if end <= start or (end - start).days > 366:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end는 start 이후여야 하며 최대 366일까지 조회할 수 있습니다",
+        )
+    import pytz  # 달력 날짜 경계 시간대 (시작 시간 단축을 위해 처음 사용할 때 로드)
+
+    try:
+        tz = pytz.timezone(time_zone)
+    except pytz.UnknownTimeZoneError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="알 수 없는 시간대입니다"
+        )
+
+    # 시간대별 자정 → 절대 시각 (일광 절약 시간 전환일도 정확하게 계산)
+    midnights = [
+        tz.localize(datetime.combine(start + timedelta(days=i), dt_time()))
+        for i in range((end - start).days + 1)
+    ]
+    days = [
+        (start + timedelta(days=i), midnights[i], midnights[i + 1])
+        for i in range(len(midnights) - 1)
+    ]
+
+    try:
+        counts = await count_todos_by_day(db=db, days=days, status=status_filter)
+        await release(db)
+        return TodoCalendar(
+            time_zone=tz.zone,
+            days=[TodoCalendarDay(day=day, count=count) for day, count in counts],
+        )
+    except StatementTimeout as e:
+        raise _statement_timeout(e)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"달력 집계 중 오류가 발생했습니다: {str(e)}",
+        )
+
+
 # ✅ 특정 Todo 조회 (GET 요청)
 @router.get("/{todo_id}", response_model=TodoSchema)
 async def read_todo(
+    response: Response,
     todo_id: UUID = Path(..., description="조회할 할 일의 ID"),
-    db: AsyncSession = Depends(get_db),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag"),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     ID로 특정 할 일 항목을 조회합니다.
+
+    - **fields**를 지정하면 그 필드만 반환합니다 (예: fields=id,title,status).
+    - 응답의 **ETag**를 **If-None-Match**로 보내면 변경이 없을 때 본문 없이 304를 반환합니다.
     """
+    field_names = _parse_fields(fields)
     try:
-        db_todo = await get_todo(db=db, todo_id=todo_id)  # 특정 Todo 조회
-        if db_todo is None:
+        if field_names is not None and not settings.TODO_CACHE_ENABLED:
+            # 캐시를 쓰지 않으면 요청한 컬럼만 SELECT
+            row = await get_todo_row(db=db, todo_id=todo_id, fields=field_names)
+            await release(db)
+            if row is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"ID가 {todo_id}인 할 일을 찾을 수 없습니다",
+                )
+            etag = version_etag(row["id"], row["updatedAt"])
+            if none_match(if_none_match, etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+            return Response(
+                content=dump_todo_fields(row, field_names),
+                media_type="application/json",
+                headers={"ETag": etag},
+            )
+
+        todo = await get_todo_cached(db=db, todo_id=todo_id)  # 캐시 우선 조회 (캐시에는 전체 필드 보관)
+        await release(db)  # 캐시 적중이면 커넥션을 쓰지 않았으므로 아무 일도 없음
+        if todo is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"ID가 {todo_id}인 할 일을 찾을 수 없습니다",
             )
-        return TodoSchema.model_validate(db_todo)  # Pydantic 모델 변환 후 반환
+
+        etag = version_etag(todo.id, todo.updated_at)
+        if none_match(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        if field_names is not None:
+            return Response(
+                content=dump_todo_schema_fields(todo, field_names),
+                media_type="application/json",
+                headers={"ETag": etag},
+            )
+        response.headers["ETag"] = etag
+        return todo
     except HTTPException:
         raise  # 기존 HTTPException 그대로 반환
+    except StatementTimeout as e:
+        raise _statement_timeout(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -82,22 +626,105 @@ async def read_todo(
         )
 
 
-# ✅ 모든 Todo 조회 (GET 요청)
-@router.get("/", response_model=List[TodoSchema])
+# ✅ Todo 목록 조회 (GET 요청, 커서 기반 페이지네이션)
+@router.get("/", response_model=TodoPage)
 async def read_todos(
     status_filter: Optional[TodoStatus] = Query(
         None, alias="status", description="할 일 상태로 필터링"
     ),
-    db: AsyncSession = Depends(get_db),
+    limit: int = Query(
+        settings.TODO_PAGE_SIZE_DEFAULT,
+        ge=1,
+        le=settings.TODO_PAGE_SIZE_MAX,
+        description="한 페이지에 조회할 최대 개수",
+    ),
+    cursor: Optional[str] = Query(
+        None, description="이전 응답의 nextCursor (첫 페이지는 생략)"
+    ),
+    overlaps_from: Optional[datetime] = Query(
+        None, alias="from", description="일정이 [from, to)와 겹치는 항목만 조회"
+    ),
+    overlaps_to: Optional[datetime] = Query(
+        None, alias="to", description="일정이 [from, to)와 겹치는 항목만 조회"
+    ),
+    due_before: Optional[datetime] = Query(
+        None, alias="dueBefore", description="종료일이 이 시각 이전인 항목만 조회"
+    ),
+    starts_after: Optional[datetime] = Query(
+        None, alias="startsAfter", description="시작일이 이 시각 이후(포함)인 항목만 조회"
+    ),
+    archived: TodoArchiveScope = Query(
+        "exclude", description="보관된(오래된 완료) 할 일: exclude(제외) / include(포함) / only(보관된 것만)"
+    ),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag"),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
-    모든 할 일 항목을 조회합니다. 선택적으로 상태별로 필터링할 수 있습니다.
+    할 일 항목을 생성 순서(createdAt, id)대로 페이지 단위로 조회합니다.
+    선택적으로 상태와 일정(시작일/종료일)으로 필터링할 수 있습니다.
+    - 보관된 할 일(완료 후 오래된 항목)은 **archived**를 지정했을 때만 포함됩니다.
+    - **fields**를 지정하면 그 필드만 조회해 반환합니다 (예: fields=id,title,status).
+    - 시간대가 없는 날짜는 UTC로 간주합니다.
+    - 응답의 **nextCursor**를 다음 요청의 **cursor**로 전달하면 다음 페이지를 조회합니다.
+    - **nextCursor**가 null이면 마지막 페이지입니다.
+    - 응답의 **ETag**를 **If-None-Match**로 보내면 페이지에 변경이 없을 때 본문 없이 304를 반환합니다.
     """
     try:
-        db_todos = await get_todos(db=db, status=status_filter)  # 상태별 필터링 가능
-        return [
-            TodoSchema.model_validate(todo) for todo in db_todos
-        ]  # Pydantic 모델 변환 후 반환
+        after = decode_created_cursor(cursor) if cursor else None
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    field_names = _parse_fields(fields)
+
+    try:
+        dates = TodoDateFilter(
+            overlaps_from=overlaps_from,
+            overlaps_to=overlaps_to,
+            due_before=due_before,
+            starts_after=starts_after,
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=[error["msg"] for error in e.errors()],
+        )
+
+    try:
+        # 다음 페이지 존재 여부를 알기 위해 limit + 1개를 조회
+        # ORM 객체/검증을 거치지 않고 행(dict)을 바로 JSON으로 직렬화 (빠른 경로)
+        rows = await get_todo_rows(
+            db=db,
+            status=status_filter,
+            limit=limit + 1,
+            after=after,
+            dates=None if dates.is_empty() else dates,
+            archived=archived,
+            fields=field_names,
+        )
+        await release(db)  # ETag 계산/직렬화 전에 커넥션 반환
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last["createdAt"], last["id"])
+
+        # ✅ 페이지 ETag: 조회 조건 + 페이지에 포함된 행의 (id, updated_at)
+        # 페이지 안의 행이 추가/수정/삭제되면 값이 바뀌며, 직렬화 전에 계산됨
+        etag = digest_etag(
+            [status_filter, limit, cursor, next_cursor, dates.model_dump_json(), archived, field_names]
+            + [f"{row['id']}:{row['updatedAt'].isoformat()}" for row in rows]
+        )
+        if none_match(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        # response_model 재검증을 피하기 위해 직렬화된 bytes를 그대로 반환
+        return Response(
+            content=dump_todo_page(rows, next_cursor, field_names),
+            media_type="application/json",
+            headers={"ETag": etag},
+        )
+    except StatementTimeout as e:
+        raise _statement_timeout(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -108,27 +735,34 @@ async def read_todos(
 # ✅ 기존 Todo 업데이트 (PUT 요청)
 @router.put("/{todo_id}", response_model=TodoSchema)
 async def update_existing_todo(
+    response: Response,
     todo_id: UUID = Path(..., description="업데이트할 할 일의 ID"),
     todo_update: TodoUpdate = ...,
+    if_match: Optional[str] = Header(None, description="조회 시 받은 ETag"),
     db: AsyncSession = Depends(get_db),
 ):
     """
     기존 할 일 항목을 업데이트합니다.
 
     - 모든 필드는 선택적이며, 제공된 필드만 업데이트됩니다.
+    - **If-Match**에 ETag를 보내면 그 사이 다른 변경이 있었을 때 412를 반환합니다.
     """
+    expected_versions = _expected_versions(if_match, todo_id)
     try:
         db_todo = await update_todo(
-            db=db, todo_id=todo_id, todo_update=todo_update
+            db=db,
+            todo_id=todo_id,
+            todo_update=todo_update,
+            expected_versions=expected_versions,
         )  # Todo 업데이트
         if db_todo is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"ID가 {todo_id}인 할 일을 찾을 수 없습니다",
-            )
+            await _raise_not_found_or_precondition_failed(db, todo_id, expected_versions)
+        response.headers["ETag"] = version_etag(db_todo.id, db_todo.updated_at)
         return TodoSchema.model_validate(db_todo)  # Pydantic 모델 변환 후 반환
     except HTTPException:
         raise  # 기존 HTTPException 그대로 반환
+    except StatementTimeout as e:
+        raise _statement_timeout(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -140,21 +774,26 @@ async def update_existing_todo(
 @router.delete("/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_existing_todo(
     todo_id: UUID = Path(..., description="삭제할 할 일의 ID"),
+    if_match: Optional[str] = Header(None, description="조회 시 받은 ETag"),
     db: AsyncSession = Depends(get_db),
 ):
     """
     할 일 항목을 삭제합니다.
+
+    - **If-Match**에 ETag를 보내면 그 사이 다른 변경이 있었을 때 412를 반환합니다.
     """
+    expected_versions = _expected_versions(if_match, todo_id)
     try:
-        success = await delete_todo(db=db, todo_id=todo_id)  # Todo 삭제
+        success = await delete_todo(
+            db=db, todo_id=todo_id, expected_versions=expected_versions
+        )  # Todo 삭제
         if not success:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"ID가 {todo_id}인 할 일을 찾을 수 없습니다",
-            )
+            await _raise_not_found_or_precondition_failed(db, todo_id, expected_versions)
         return None  # 204 No Content 응답에는 본문이 없습니다
     except HTTPException:
         raise  # 기존 HTTPException 그대로 반환
+    except StatementTimeout as e:
+        raise _statement_timeout(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
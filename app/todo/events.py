@@ -0,0 +1,82 @@
+# app/todo/events.py
+
+import logging
+from typing import List
+
+from sqlalchemy import bindparam, text  # pg_notify 호출
+from sqlalchemy.dialects.postgresql import ARRAY, TEXT
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings  # 이벤트 큐/버퍼 크기 설정
+from app.core.events import EventBroker, PostgresListener, sse_frame
+from app.core.metrics import counter, gauge  # 변경 이벤트 메트릭
+
+logger = logging.getLogger(__name__)
+
+# ✅ Todo 변경 이벤트 (생성/수정/삭제)
+# CRUD가 같은 트랜잭션에서 NOTIFY → 커밋 시점에 모든 워커의 LISTEN 연결로 커밋 순서대로 전달
+TODO_EVENTS_CHANNEL = "todo_events"
+
+# 알림 내용: "<이벤트 ID> <이벤트 종류> <JSON>" (이벤트 ID는 todo_event_seq 값)
+_NOTIFY = text(
+    "SELECT pg_notify(:channel, nextval('todo_event_seq') || ' ' || :event || ' ' || data) "
+    "FROM unnest(:items) AS data"
+).bindparams(bindparam("items", type_=ARRAY(TEXT)))
+
+todo_events = EventBroker(
+    name="todo",
+    queue_size=settings.TODO_EVENTS_QUEUE_SIZE,
+    buffer_size=settings.TODO_EVENTS_BUFFER_SIZE,
+    max_subscribers=settings.TODO_EVENTS_MAX_SUBSCRIBERS,
+)
+
+
+async def publish_todo_events(db: AsyncSession, event: str, items: List[str]) -> None:
+    """
+    변경 이벤트를 현재 트랜잭션에 NOTIFY로 등록합니다 (커밋될 때만 전달, 롤백되면 사라짐).
+    :param db: 변경을 수행한 데이터베이스 세션 (커밋 전)
+    :param event: 이벤트 종류 ("created", "updated", "deleted")
+    :param items: 이벤트 데이터 JSON 문자열 목록 (항목마다 이벤트 하나)
+    """
+    if not settings.TODO_EVENTS_ENABLED or not items:
+        return
+    await db.execute(
+        _NOTIFY, {"channel": TODO_EVENTS_CHANNEL, "event": event, "items": items}
+    )
+
+
+def _on_notify(payload: str) -> None:
+    event_id, event, data = payload.split(" ", 2)
+    # SSE 메시지는 한 번만 만들어 모든 구독자가 공유
+    todo_events.publish(event_id, sse_frame(event, data, event_id))
+
+
+todo_listener = PostgresListener(
+    dsn=make_url(settings.ASYNC_DATABASE_URL)
+    .set(drivername="postgresql")
+    .render_as_string(hide_password=False),
+    channel=TODO_EVENTS_CHANNEL,
+    on_message=_on_notify,
+    on_reconnect=lambda: todo_events.reset("listener_reconnected"),
+)
+
+
+def _event_samples():
+    stats = todo_events.stats()
+    return [
+        ((name,), stats[name]) for name in ("published", "evictions", "resets")
+    ]
+
+
+counter(
+    "todo_events_total",
+    "Todo 변경 이벤트 브로커 이벤트 수 (published: 수신, evictions: 느린 구독자 퇴출, resets: 재동기화 요청)",
+    ("kind",),
+    callback=_event_samples,
+)
+gauge(
+    "todo_event_subscribers",
+    "Todo 변경 이벤트 구독자 수 (SSE 연결)",
+    callback=lambda: [((), todo_events.stats()["subscribers"])],
+)
@@ -3,11 +3,27 @@ from sqlalchemy.orm import (
     Mapped,
     mapped_column,
 )  # SQLAlchemy ORM의 타입 어노테이션을 지원하는 모듈
-from sqlalchemy import String, Enum, DateTime  # SQL 타입 지정
+from sqlalchemy import (  # SQL 타입 및 인덱스 지정
+    DDL,
+    BigInteger,
+    Computed,
+    Date,
+    DateTime,
+    Enum,
+    Index,
+    Sequence,
+    SmallInteger,
+    String,
+    func,
+    event,
+    or_,
+    text,
+)
 from sqlalchemy.dialects.postgresql import (
+    TSVECTOR,
     UUID as PgUUID,
-)  # PostgreSQL에서 UUID 타입 사용
-from datetime import datetime, timezone  # 날짜 및 시간 관련 모듈
+)  # PostgreSQL에서 UUID / 전문 검색 타입 사용
+from datetime import date, datetime, timezone  # 날짜 및 시간 관련 모듈
 from uuid import uuid4  # UUID 생성 함수
 from app.shared.models import Base  # 기본 Base 모델 가져오기
 from typing import Optional  # 선택적(Nullable) 필드 지원
@@ -24,11 +40,51 @@ class TodoStatus(str, PyEnum):
     DONE = "DONE"
 
 
+# ✅ 전문 검색용 tsvector 식 (제목 가중치 A, 내용 가중치 B)
+# 한국어 형태소 분석기가 없으므로 어간 추출 없이 공백 단위로 나누는 'simple' 설정 사용
+TODO_SEARCH_CONFIG = "simple"
+TODO_SEARCH_VECTOR = (
+    f"setweight(to_tsvector('{TODO_SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{TODO_SEARCH_CONFIG}', coalesce(content, '')), 'B')"
+)
+
+
+def utc_now() -> datetime:
+    """현재 UTC 시간 (시간대 포함)"""
+    return datetime.now(timezone.utc)
+
+
+# ✅ 변경 토큰: 행을 마지막으로 쓴 트랜잭션 ID (64비트, 재사용/순환 없음)
+# 시퀀스 값은 커밋 순서와 다르게 보일 수 있지만, 트랜잭션 ID는 스냅샷의 xmin과 비교해
+# "이 값 미만의 트랜잭션은 모두 끝났다"는 것을 알 수 있어 동기화 중 누락 없이 이어 읽을 수 있음
+TODO_CHANGE_XID = "pg_current_xact_id()::text::bigint"
+
+
 # ✅ 할 일(Todo) 모델 정의
 class Todo(Base):
     """할 일(Todo) 모델 - PostgreSQL의 todo 테이블에 매핑"""
 
     __tablename__ = "todo"  # 테이블 이름 설정
+    __table_args__ = (
+        # ✅ 목록 조회 정렬/커서 페이지네이션: ORDER BY created_at, id
+        Index("ix_todo_created_at_id", "created_at", "id"),
+        # ✅ 상태 필터 + 정렬: WHERE status = ? ORDER BY created_at, id
+        Index("ix_todo_status_created_at_id", "status", "created_at", "id"),
+        # ✅ 시작일/종료일 범위 조회 (시작일 기준)
+        Index("ix_todo_start_date_end_date", "start_date", "end_date"),
+        # ✅ 마감일 기준 조회: WHERE end_date < ?
+        Index("ix_todo_end_date", "end_date"),
+        # ✅ 전문 검색: WHERE search_vector @@ tsquery
+        Index("ix_todo_search_vector", "search_vector", postgresql_using="gin"),
+        # ✅ 변경 동기화: WHERE (change_xid, id) > ? ORDER BY change_xid, id
+        Index("ix_todo_change_xid_id", "change_xid", "id"),
+        # ✅ 보관 대상 찾기: WHERE status = 'DONE' AND updated_at < ? (완료된 행만 담는 부분 인덱스)
+        Index(
+            "ix_todo_done_updated_at",
+            "updated_at",
+            postgresql_where=text("status = 'DONE'"),
+        ),
+    )
 
     # ✅ UUID 기본키 (PostgreSQL의 UUID 타입 사용)
     id: Mapped[PgUUID] = mapped_column(PgUUID, primary_key=True, default=uuid4)
@@ -51,18 +107,328 @@ class Todo(Base):
     )
 
     # ✅ 생성 시간 (기본값: UTC 현재 시간)
+    # timestamptz 컬럼이므로 시간대가 있는(aware) 값을 사용
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc).replace(
-            tzinfo=None
-        ),  # UTC 시간으로 설정
+        default=utc_now,  # UTC 시간으로 설정
     )
 
     # ✅ 수정 시간 (기본값: UTC 현재 시간, 업데이트 시 자동 변경)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
-        onupdate=lambda: datetime.now(timezone.utc).replace(
-            tzinfo=None
-        ),  # 업데이트 시 현재 시간으로 변경
+        default=utc_now,
+        onupdate=utc_now,  # 업데이트 시 현재 시간으로 변경
+    )
+
+    # ✅ 검색용 tsvector (제목/내용에서 DB가 자동 계산하는 generated column)
+    # 응답에는 쓰지 않으므로 기본 조회 대상에서 제외 (deferred)
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR, Computed(TODO_SEARCH_VECTOR, persisted=True), deferred=True
+    )
+
+    # ✅ 마지막으로 생성/수정한 트랜잭션 ID (생성 시 기본값, 수정 시 todo_change_xid 트리거가 갱신)
+    # 변경 동기화(GET /todos/changes)에서만 사용하므로 기본 조회 대상에서 제외 (deferred)
+    change_xid: Mapped[int] = mapped_column(
+        BigInteger, server_default=text(TODO_CHANGE_XID), deferred=True
+    )
+
+
+# ✅ 일정 기간 식: [min(start, end), max(start, end)]
+# 둘 중 하나만 있으면 그 시점 하나, 둘 다 없으면 기간 없음(인덱스/조회에서 제외)
+# 쿼리 식이 인덱스 식과 똑같아야 인덱스를 사용하므로 경계 문자열은 바인드 파라미터가 아닌 리터럴로 둠
+def todo_period(start_date, end_date):
+    return func.tstzrange(
+        func.least(start_date, end_date),
+        func.greatest(start_date, end_date),
+        text("'[]'"),
+    )
+
+
+def todo_has_period(start_date, end_date):
+    return or_(start_date.isnot(None), end_date.isnot(None))
+
+
+# ✅ 기간 겹침 조회 (period && tstzrange): 일정이 있는 행만 담는 GiST 부분 인덱스
+Index(
+    "ix_todo_period",
+    todo_period(Todo.__table__.c.start_date, Todo.__table__.c.end_date),
+    postgresql_using="gist",
+    postgresql_where=todo_has_period(
+        Todo.__table__.c.start_date, Todo.__table__.c.end_date
+    ),
+)
+
+# ✅ 기간 식의 통계 (없으면 && 조건의 행 수를 1%로 추정해 GiST 대신 정렬 인덱스를 고르는 경우가 있음)
+event.listen(
+    Todo.__table__,
+    "after_create",
+    DDL(
+        "CREATE STATISTICS IF NOT EXISTS st_todo_period ON "
+        "(tstzrange(least(start_date, end_date), greatest(start_date, end_date), '[]')) "
+        "FROM todo"
+    ),
+)
+
+
+# ✅ 상태/마감일별 할 일 수 (todo/todo_archive 테이블 트리거가 같은 트랜잭션에서 갱신)
+class TodoStatusCount(Base):
+    """
+    (상태, 마감일, 샤드)별 할 일 수 - GET /todos/stats가 COUNT(*) 없이 읽는 요약 테이블
+    보관된 할 일(todo_archive)도 포함하므로 보관/복원으로 옮겨도 합계가 바뀌지 않습니다.
+    동시에 쓰는 연결끼리 같은 행을 잠그지 않도록 연결(backend pid)마다 다른 샤드 행을 갱신합니다.
+    """
+
+    __tablename__ = "todo_status_count"
+
+    status: Mapped[TodoStatus] = mapped_column(Enum(TodoStatus), primary_key=True)
+    # 마감일(UTC 날짜), 마감일이 없으면 'infinity'
+    due_day: Mapped[date] = mapped_column(Date, primary_key=True)
+    shard: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger, default=0)
+
+
+TODO_STATUS_COUNT_SHARDS = 8
+
+_DUE_DAY = "coalesce((end_date AT TIME ZONE 'UTC')::date, 'infinity')"
+_UPSERT = f"""
+        INSERT INTO todo_status_count (status, due_day, shard, count)
+        SELECT status, due_day, pg_backend_pid() % {TODO_STATUS_COUNT_SHARDS}, sum(delta)
+        FROM ({{changes}}) AS changes
+        GROUP BY status, due_day
+        HAVING sum(delta) <> 0
+        ON CONFLICT (status, due_day, shard)
+        DO UPDATE SET count = todo_status_count.count + EXCLUDED.count;"""
+_ADDED = f"SELECT status, {_DUE_DAY} AS due_day, 1 AS delta FROM new_rows"
+_REMOVED = f"SELECT status, {_DUE_DAY} AS due_day, -1 AS delta FROM old_rows"
+
+# INSERT/UPDATE/DELETE 문 하나에 한 번 실행되는 트리거 함수
+# (전이 테이블을 그룹별로 합쳐 UPSERT 하므로 일괄 생성도 그룹 수만큼만 갱신)
+TODO_STATUS_COUNT_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION todo_status_count_apply() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN{_UPSERT.format(changes=_ADDED)}
+    ELSIF TG_OP = 'DELETE' THEN{_UPSERT.format(changes=_REMOVED)}
+    ELSE{_UPSERT.format(changes=_ADDED + " UNION ALL " + _REMOVED)}
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+# 이미 있는 데이터로 요약 테이블 채우기 (트리거 생성과 같은 트랜잭션에서 실행, 보관된 할 일 포함)
+TODO_STATUS_COUNT_BACKFILL = f"""
+INSERT INTO todo_status_count (status, due_day, shard, count)
+SELECT status, {_DUE_DAY}, 0, count(*) FROM (
+    SELECT status, end_date FROM todo UNION ALL SELECT status, end_date FROM todo_archive
+) AS todos GROUP BY 1, 2"""
+
+# TRUNCATE는 행 트리거/전이 테이블이 없으므로 요약 테이블을 남은 테이블 기준으로 다시 채우는 별도 함수 사용
+TODO_STATUS_COUNT_RESET_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION todo_status_count_reset() RETURNS trigger AS $$
+BEGIN
+    DELETE FROM todo_status_count;{TODO_STATUS_COUNT_BACKFILL};
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+# todo와 todo_archive에 같은 트리거 (보관/복원은 한 테이블에서 빠지고 다른 테이블에 들어가므로 합계 유지)
+TODO_STATUS_COUNT_TRIGGERS = [
+    statement
+    for source in ("todo", "todo_archive")
+    for statement in (
+        f"CREATE TRIGGER todo_status_count_insert AFTER INSERT ON {source} "
+        "REFERENCING NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION todo_status_count_apply()",
+        f"CREATE TRIGGER todo_status_count_update AFTER UPDATE ON {source} "
+        "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION todo_status_count_apply()",
+        f"CREATE TRIGGER todo_status_count_delete AFTER DELETE ON {source} "
+        "REFERENCING OLD TABLE AS old_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION todo_status_count_apply()",
+        f"CREATE TRIGGER todo_status_count_truncate AFTER TRUNCATE ON {source} "
+        "FOR EACH STATEMENT EXECUTE FUNCTION todo_status_count_reset()",
+    )
+]
+
+# init_db(create_all)로 요약 테이블을 만들 때 트리거/초기 데이터도 함께 생성 (todo, todo_archive 생성 이후)
+for _statement in [
+    TODO_STATUS_COUNT_FUNCTION,
+    TODO_STATUS_COUNT_RESET_FUNCTION,
+    *TODO_STATUS_COUNT_TRIGGERS,
+    TODO_STATUS_COUNT_BACKFILL,
+]:
+    # DDL 문자열은 %(table)s 치환을 거치므로 % 연산자는 이스케이프
+    event.listen(
+        TodoStatusCount.__table__, "after_create", DDL(_statement.replace("%", "%%"))
+    )
+
+
+# ✅ 실시간 변경 이벤트 ID (app/todo/events.py의 NOTIFY에서 nextval)
+todo_event_seq = Sequence("todo_event_seq", metadata=Base.metadata)
+
+
+# ✅ 수정 시 change_xid 갱신 (ORM 외의 UPDATE도 빠짐없이 반영되도록 트리거 사용)
+TODO_CHANGE_XID_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION todo_change_xid_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.change_xid := {TODO_CHANGE_XID};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+TODO_CHANGE_XID_TRIGGER = (
+    "CREATE TRIGGER todo_change_xid BEFORE UPDATE ON todo "
+    "FOR EACH ROW EXECUTE FUNCTION todo_change_xid_touch()"
+)
+
+for _statement in [TODO_CHANGE_XID_FUNCTION, TODO_CHANGE_XID_TRIGGER]:
+    event.listen(Todo.__table__, "after_create", DDL(_statement))
+
+
+# ✅ 삭제된 할 일 기록 (변경 동기화에서 삭제를 전달하기 위한 tombstone)
+class TodoTombstone(Base):
+    """
+    삭제된 할 일의 ID와 삭제한 트랜잭션 ID - todo/todo_archive 테이블의 삭제 트리거가 같은 트랜잭션에서 기록
+    보관 기간(TODO_TOMBSTONE_RETENTION_DAYS)이 지나면 정리 작업이 지우고 todo_sync_horizon을 올립니다.
+    """
+
+    __tablename__ = "todo_tombstone"
+    __table_args__ = (
+        # ✅ 변경 동기화: WHERE (change_xid, id) > ? ORDER BY change_xid, id
+        Index("ix_todo_tombstone_change_xid_id", "change_xid", "id"),
+        # ✅ 보관 기간 정리: WHERE deleted_at < ?
+        Index("ix_todo_tombstone_deleted_at", "deleted_at"),
     )
+
+    id: Mapped[PgUUID] = mapped_column(PgUUID, primary_key=True)
+    change_xid: Mapped[int] = mapped_column(
+        BigInteger, server_default=text(TODO_CHANGE_XID)
+    )
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+
+# ✅ 변경 동기화 기준선: 이 트랜잭션 ID 이하의 삭제 기록은 정리되었을 수 있음
+class TodoSyncHorizon(Base):
+    """
+    변경 토큰의 유효 하한 (행 하나)
+    토큰이 이 값 이하이면 그 사이의 tombstone이 지워졌을 수 있으므로 전체 재동기화가 필요합니다.
+    """
+
+    __tablename__ = "todo_sync_horizon"
+
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    change_xid: Mapped[int] = mapped_column(BigInteger, default=0)
+
+
+# 삭제된 행마다 tombstone 기록 (문 단위 트리거, 같은 ID가 다시 삭제될 일은 없지만 충돌 시 갱신)
+# todo ↔ todo_archive 사이의 이동(보관/복원)은 같은 문에서 다른 테이블에 행이 생기므로 삭제로 기록하지 않음
+# (AFTER 트리거는 문이 끝난 뒤 실행되어 CTE의 INSERT 결과가 보임)
+TODO_TOMBSTONE_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION todo_tombstone_record() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO todo_tombstone (id, change_xid, deleted_at)
+    SELECT id, {TODO_CHANGE_XID}, now() FROM old_rows
+    WHERE NOT EXISTS (SELECT 1 FROM todo WHERE todo.id = old_rows.id)
+      AND NOT EXISTS (SELECT 1 FROM todo_archive WHERE todo_archive.id = old_rows.id)
+    ON CONFLICT (id) DO UPDATE
+    SET change_xid = EXCLUDED.change_xid, deleted_at = EXCLUDED.deleted_at;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+# TRUNCATE는 삭제된 ID를 알 수 없으므로 기준선을 올려 모든 클라이언트가 전체 재동기화하도록 함
+TODO_SYNC_HORIZON_RESET_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION todo_sync_horizon_reset() RETURNS trigger AS $$
+BEGIN
+    UPDATE todo_sync_horizon SET change_xid = {TODO_CHANGE_XID};
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+TODO_TOMBSTONE_TRIGGERS = [
+    "CREATE TRIGGER todo_tombstone_delete AFTER DELETE ON todo "
+    "REFERENCING OLD TABLE AS old_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION todo_tombstone_record()",
+    "CREATE TRIGGER todo_sync_horizon_truncate AFTER TRUNCATE ON todo "
+    "FOR EACH STATEMENT EXECUTE FUNCTION todo_sync_horizon_reset()",
+]
+
+# 보관된 할 일도 ID 조회/수정/삭제 대상이므로 보관 테이블에서 삭제되면 같은 방식으로 기록
+TODO_ARCHIVE_TOMBSTONE_TRIGGERS = [
+    "CREATE TRIGGER todo_tombstone_delete AFTER DELETE ON todo_archive "
+    "REFERENCING OLD TABLE AS old_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION todo_tombstone_record()",
+    "CREATE TRIGGER todo_sync_horizon_truncate AFTER TRUNCATE ON todo_archive "
+    "FOR EACH STATEMENT EXECUTE FUNCTION todo_sync_horizon_reset()",
+]
+
+# init_db(create_all)로 만들 때 기준선 행/트리거도 함께 생성
+# (plpgsql 함수 본문의 테이블은 실행 시점에 찾으므로 todo_tombstone보다 먼저 만들어도 됨)
+for _statement in [
+    "INSERT INTO todo_sync_horizon (id, change_xid) VALUES (1, 0)",
+    TODO_TOMBSTONE_FUNCTION,
+    TODO_SYNC_HORIZON_RESET_FUNCTION,
+    *TODO_TOMBSTONE_TRIGGERS,
+]:
+    event.listen(TodoSyncHorizon.__table__, "after_create", DDL(_statement))
+
+
+# ✅ 보관된 할 일 (완료 후 오래된 행을 todo에서 옮겨 둔 cold 테이블)
+class TodoArchive(Base):
+    """
+    완료(DONE) 후 TODO_ARCHIVE_AFTER_DAYS 동안 수정되지 않아 todo 테이블에서 옮겨진 할 일
+    목록/검색은 todo(hot)만 대상으로 하며, ID 조회와 상태별 통계는 여기까지 포함합니다.
+    보관/복원으로 옮겨질 때는 삭제 기록(tombstone)을 남기지 않고, 보관된 할 일을 삭제하면 남깁니다.
+    보관된 할 일을 수정하면 todo 테이블로 되돌린 뒤 수정합니다.
+    """
+
+    __tablename__ = "todo_archive"
+    __table_args__ = (
+        # ✅ 보관 목록 조회 정렬/커서 페이지네이션: ORDER BY created_at, id
+        Index("ix_todo_archive_created_at_id", "created_at", "id"),
+    )
+
+    id: Mapped[PgUUID] = mapped_column(PgUUID, primary_key=True)
+    title: Mapped[str] = mapped_column(String(255))
+    content: Mapped[str] = mapped_column(String(255))
+    status: Mapped[TodoStatus] = mapped_column(Enum(TodoStatus))
+    start_date: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    end_date: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    # ✅ 보관된 시각
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+
+for _statement in TODO_ARCHIVE_TOMBSTONE_TRIGGERS:
+    event.listen(TodoArchive.__table__, "after_create", DDL(_statement))
+
+# create_all에서 보관 테이블의 삭제 트리거가 쓰는 함수를 먼저 만들도록 todo_sync_horizon을 먼저 생성
+TodoArchive.__table__.add_is_dependent_on(TodoSyncHorizon.__table__)
+
+# create_all에서 요약 테이블의 트리거/초기 집계가 두 테이블을 참조하므로 두 테이블을 먼저 생성
+TodoStatusCount.__table__.add_is_dependent_on(Todo.__table__)
+TodoStatusCount.__table__.add_is_dependent_on(TodoArchive.__table__)
+
+# todo ↔ todo_archive 사이에 옮기는 컬럼 (search_vector/change_xid는 todo에서 다시 계산)
+TODO_ARCHIVE_COLUMNS = [
+    "id",
+    "title",
+    "content",
+    "status",
+    "start_date",
+    "end_date",
+    "created_at",
+    "updated_at",
+]
@@ -1,10 +1,10 @@
 # app/schemas/todo.py
 from app.shared.schemas import CamelBaseModel  # 기본 Pydantic 스키마 (camelCase 지원)
 from uuid import UUID  # UUID 타입 지원
-from datetime import datetime  # 날짜 타입 지원
+from datetime import date, datetime, timezone  # 날짜 타입 지원
 from enum import Enum  # Enum 타입 지원
-from typing import Optional  # 선택적 필드 지원
-from pydantic import model_validator  # Pydantic의 데이터 검증 기능 추가
+from typing import Dict, List, Literal, Optional  # 선택적 필드 및 리스트 지원
+from pydantic import field_validator, model_validator  # Pydantic의 데이터 검증 기능 추가
 
 
 # ✅ 할 일(Todo) 상태를 정의하는 Enum (SQLAlchemy 모델과 일치)
@@ -17,6 +17,13 @@ class TodoStatus(str, Enum):
     DONE = "DONE"
 
 
+def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """시간대가 없는(naive) 날짜는 UTC로 간주합니다 (DB 컬럼은 timestamptz)."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
 # ✅ 기본 Todo 스키마 (공통 속성)
 class TodoBase(CamelBaseModel):
     """할 일(Todo)의 기본 속성 (공통 속성)"""
@@ -33,6 +40,8 @@ class TodoCreate(TodoBase):
     start_date: Optional[datetime] = None  # 선택적 시작일
     end_date: Optional[datetime] = None  # 선택적 종료일
 
+    _utc_dates = field_validator("start_date", "end_date")(as_utc)
+
     # ✅ 시작일과 종료일 검증 로직 추가
     @model_validator(mode="after")
     def validate_dates(self) -> "TodoCreate":
@@ -52,6 +61,8 @@ class TodoUpdate(CamelBaseModel):
     start_date: Optional[datetime] = None  # 시작일 (선택적)
     end_date: Optional[datetime] = None  # 종료일 (선택적)
 
+    _utc_dates = field_validator("start_date", "end_date")(as_utc)
+
     # ✅ 최소 하나 이상의 필드가 있어야 업데이트 가능
     @model_validator(mode="after")
     def check_at_least_one_field(self) -> "TodoUpdate":
@@ -74,3 +85,96 @@ class Todo(CamelBaseModel):
     end_date: Optional[datetime] = None  # 종료일
     created_at: datetime  # 생성일
     updated_at: datetime  # 수정일
+
+
+class TodoPage(CamelBaseModel):
+    """커서 기반 페이지네이션으로 조회한 Todo 목록 응답 스키마"""
+
+    items: List[Todo]  # 현재 페이지의 할 일 목록
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+
+
+class TodoBulkError(CamelBaseModel):
+    """일괄 생성 요청 중 검증에 실패한 항목 정보"""
+
+    index: int  # 요청 목록에서의 위치 (0부터 시작)
+    errors: List[str]  # 검증 오류 메시지 목록
+
+
+class TodoBulkResult(CamelBaseModel):
+    """일괄 생성 응답 스키마 (생성된 항목과 실패한 항목을 함께 반환)"""
+
+    created: List[Todo]  # 생성된 할 일 목록 (요청 순서 유지)
+    errors: List[TodoBulkError]  # 검증에 실패해 생성되지 않은 항목
+
+
+# 목록 조회 대상: exclude(todo만, 기본값) / include(보관된 할 일 포함) / only(보관된 할 일만)
+TodoArchiveScope = Literal["exclude", "include", "only"]
+
+
+class TodoDateFilter(CamelBaseModel):
+    """시작일/종료일 기준 목록 필터 (모든 조건은 AND로 결합)"""
+
+    overlaps_from: Optional[datetime] = None  # 기간이 [from, to)와 겹치는 항목
+    overlaps_to: Optional[datetime] = None
+    due_before: Optional[datetime] = None  # 종료일이 이 시각 이전인 항목
+    starts_after: Optional[datetime] = None  # 시작일이 이 시각 이후(포함)인 항목
+
+    _utc_dates = field_validator(
+        "overlaps_from", "overlaps_to", "due_before", "starts_after"
+    )(as_utc)
+
+    @model_validator(mode="after")
+    def validate_range(self) -> "TodoDateFilter":
+        """겹침 기간의 끝이 시작보다 이후인지 확인"""
+        if (
+            self.overlaps_from
+            and self.overlaps_to
+            and self.overlaps_to <= self.overlaps_from
+        ):
+            raise ValueError("to는 from 이후여야 합니다")
+        return self
+
+    def is_empty(self) -> bool:
+        return not any(self.__dict__.values())
+
+
+class TodoCalendarDay(CamelBaseModel):
+    """달력 보기용 하루 단위 집계"""
+
+    day: date  # 날짜 (요청한 시간대 기준)
+    count: int  # 그날과 기간이 겹치는 할 일 수
+
+
+class TodoCalendar(CamelBaseModel):
+    """기간 내 날짜별 할 일 수 응답 스키마"""
+
+    time_zone: str  # 날짜 경계를 계산한 시간대
+    days: List[TodoCalendarDay]  # 날짜 오름차순 (할 일이 없는 날은 count=0)
+
+
+class TodoStats(CamelBaseModel):
+    """상태별 할 일 수 요약 응답 스키마"""
+
+    total: int  # 전체 할 일 수
+    by_status: Dict[TodoStatus, int]  # 상태별 할 일 수 (모든 상태 포함)
+    overdue: int  # 마감일이 지났지만 완료(DONE)되지 않은 할 일 수
+    overdue_by_status: Dict[TodoStatus, int]  # 상태별 마감 초과 수 (DONE 제외)
+    approximate_total: Optional[int] = None  # 통계(pg_class.reltuples) 기반 추정 행 수
+    as_of: datetime  # 집계 기준 시각
+
+
+class TodoChange(CamelBaseModel):
+    """변경 동기화 항목 (생성/수정은 upsert, 삭제는 delete)"""
+
+    op: Literal["upsert", "delete"]  # 클라이언트가 적용할 작업
+    id: UUID  # 할 일 ID
+    todo: Optional[Todo] = None  # upsert일 때 현재 값 (delete면 None)
+
+
+class TodoChanges(CamelBaseModel):
+    """변경 토큰 이후의 변경 목록 응답 스키마"""
+
+    changes: List[TodoChange]  # 변경 순서대로 정렬된 항목
+    next_token: str  # 다음 요청의 since 값
+    has_more: bool  # True면 next_token으로 바로 이어서 조회
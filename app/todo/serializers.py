@@ -0,0 +1,108 @@
+# app/todo/serializers.py
+
+from typing import Any, Dict, Iterable, List, Optional, TypedDict
+
+from pydantic import TypeAdapter  # 미리 컴파일된 직렬화기
+
+from app.todo.models import Todo, TodoStatus  # 할 일(Todo) 모델 및 DB 상태 Enum
+from app.todo.schemas import Todo as TodoSchema  # 응답 스키마 (필드/alias 기준)
+from app.todo.schemas import TodoStatus as TodoStatusSchema
+
+# ✅ 목록 조회 빠른 경로
+# ORM 객체 생성과 model_validate(검증)를 건너뛰고, 필요한 컬럼만 camelCase 이름으로
+# SELECT한 행(dict)을 pydantic-core 직렬화기로 바로 JSON bytes로 변환합니다.
+
+# camelCase 응답 키 → Todo 컬럼 (TodoSchema 필드 순서와 동일)
+TODO_COLUMNS = {
+    field.alias or name: getattr(Todo, name)
+    for name, field in TodoSchema.model_fields.items()
+}
+
+
+def _row_annotation(name: str) -> Any:
+    annotation = TodoSchema.model_fields[name].annotation
+    # DB에서 읽은 status는 모델 쪽 TodoStatus이므로 직렬화 타입도 맞춰줌
+    return TodoStatus if annotation is TodoStatusSchema else annotation
+
+
+# camelCase 응답 키 → TodoSchema 필드 이름
+TODO_FIELD_NAMES = dict(zip(TODO_COLUMNS, TodoSchema.model_fields))
+
+
+# 행 하나의 JSON 구조 (키는 응답과 같은 camelCase)
+TodoRow = TypedDict(
+    "TodoRow",
+    {
+        alias: _row_annotation(name)
+        for alias, name in TODO_FIELD_NAMES.items()
+    },
+    total=False,
+)
+
+# 목록 응답 JSON 구조 (TodoPage와 동일)
+TodoPageJSON = TypedDict(
+    "TodoPageJSON", {"items": List[TodoRow], "nextCursor": Optional[str]}
+)
+
+_row_adapter = TypeAdapter(TodoRow)
+_page_adapter = TypeAdapter(TodoPageJSON)
+
+
+def parse_todo_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    fields 쿼리 값(쉼표로 구분한 camelCase 응답 키, 예: "id,title,status")을 키 목록으로 변환합니다.
+
+    :param fields: 요청한 필드 문자열 (없거나 비어 있으면 전체 필드)
+    :return: 응답 키 목록 (중복 제거, 요청 순서) 또는 None (전체 필드)
+    :raises ValueError: 응답에 없는 키가 있는 경우
+    """
+    if not fields:
+        return None
+    names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in TODO_COLUMNS]
+    if unknown:
+        raise ValueError(
+            f"알 수 없는 필드: {', '.join(unknown)} (사용 가능: {', '.join(TODO_COLUMNS)})"
+        )
+    return names or None
+
+
+def todo_row_columns(source: Any = Todo, fields: Optional[Iterable[str]] = None) -> List[Any]:
+    """
+    SELECT에 사용할 컬럼 목록 (응답 키 이름으로 label 지정)
+    :param source: Todo 또는 같은 컬럼을 가진 TodoArchive
+    :param fields: 조회할 응답 키 (None이면 전체, 순서는 응답 스키마 기준)
+    """
+    return [
+        getattr(source, column.key).label(alias)
+        for alias, column in TODO_COLUMNS.items()
+        if fields is None or alias in fields
+    ]
+
+
+def dump_todo_page(
+    rows: List[Dict[str, Any]],
+    next_cursor: Optional[str],
+    fields: Optional[List[str]] = None,
+) -> bytes:
+    """
+    todo_row_columns()로 조회한 행 목록을 TodoPage 형식의 JSON bytes로 직렬화합니다.
+    (검증 없이 직렬화만 수행, fields가 있으면 그 키만 출력)
+    """
+    include = None if fields is None else {"items": {"__all__": set(fields)}, "nextCursor": True}
+    return _page_adapter.dump_json({"items": rows, "nextCursor": next_cursor}, include=include)
+
+
+def dump_todo_fields(row: Dict[str, Any], fields: List[str]) -> bytes:
+    """todo_row_columns()로 조회한 행 하나에서 fields 키만 JSON bytes로 직렬화합니다."""
+    return _row_adapter.dump_json(row, include=set(fields))
+
+
+def dump_todo_schema_fields(todo: TodoSchema, fields: List[str]) -> bytes:
+    """Todo 스키마(캐시된 단건 등)에서 fields 키만 JSON bytes로 직렬화합니다."""
+    return todo.model_dump_json(by_alias=True, include={TODO_FIELD_NAMES[name] for name in fields})
+
+
+def dump_todo_ndjson(rows: Iterable[Dict[str, Any]]) -> bytes:
+    """행 목록을 한 줄에 하나씩 JSON(NDJSON) bytes로 직렬화합니다."""
+    return b"".join(_row_adapter.dump_json(row) + b"\n" for row in rows)
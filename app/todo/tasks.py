@@ -0,0 +1,48 @@
+# app/todo/tasks.py
+
+import logging
+from datetime import timedelta
+
+from app.core.config import settings  # 보관 기간/정리 주기 설정
+from app.core.tasks import PeriodicTask
+from app.db.base import async_session_maker  # 요청과 무관한 세션
+from app.todo.crud import archive_todos, compact_todo_tombstones
+from app.todo.models import utc_now
+
+logger = logging.getLogger(__name__)
+
+
+async def _compact_tombstones() -> None:
+    before = utc_now() - timedelta(days=settings.TODO_TOMBSTONE_RETENTION_DAYS)
+    async with async_session_maker() as db:
+        deleted = await compact_todo_tombstones(
+            db, before=before, batch_size=settings.TODO_TOMBSTONE_COMPACT_BATCH_SIZE
+        )
+    if deleted:
+        logger.info("보관 기간이 지난 삭제 기록 %d건 정리", deleted)
+
+
+# ✅ 삭제 기록(tombstone) 정리 (워커마다 실행, 지울 행은 SKIP LOCKED로 나눠 가짐)
+todo_tombstone_compactor = PeriodicTask(
+    name="todo-tombstone-compact",
+    interval=settings.TODO_TOMBSTONE_COMPACT_INTERVAL,
+    job=_compact_tombstones,
+)
+
+
+async def _archive_done_todos() -> None:
+    before = utc_now() - timedelta(days=settings.TODO_ARCHIVE_AFTER_DAYS)
+    async with async_session_maker() as db:
+        archived = await archive_todos(
+            db, before=before, batch_size=settings.TODO_ARCHIVE_BATCH_SIZE
+        )
+    if archived:
+        logger.info("완료된 할 일 %d건 보관", archived)
+
+
+# ✅ 오래된 완료 할 일 보관 (워커마다 실행, 옮길 행은 SKIP LOCKED로 나눠 가짐)
+todo_archiver = PeriodicTask(
+    name="todo-archive",
+    interval=settings.TODO_ARCHIVE_INTERVAL,
+    job=_archive_done_todos,
+)
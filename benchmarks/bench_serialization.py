@@ -0,0 +1,109 @@
+# benchmarks/bench_serialization.py
+"""
+목록 응답 직렬화 벤치마크: 기존 경로 vs 빠른 경로
+
+- 기존 경로: 행마다 Todo ORM 객체 생성 → TodoSchema.model_validate → TodoPage
+  → FastAPI response_model 재검증(serialize_response) → JSONResponse 렌더링
+- 빠른 경로: 컬럼 행(dict) → dump_todo_page (검증 없이 pydantic-core 직렬화)
+
+DB 없이 메모리에서 만든 행으로 직렬화 비용만 비교합니다.
+실행: python -m benchmarks.bench_serialization --rows 500 --repeat 50
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+# app.core.config가 DB URL을 요구하므로 벤치마크용 기본값 지정 (DB에는 연결하지 않음)
+os.environ.setdefault("ASYNC_DATABASE_URL", "postgresql+asyncpg://bench@localhost/bench")
+os.environ.setdefault("SYNC_DATABASE_URL", "postgresql://bench@localhost/bench")
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+
+from app.todo.models import Todo, TodoStatus  # noqa: E402
+from app.todo.schemas import Todo as TodoSchema, TodoPage  # noqa: E402
+from app.todo.serializers import TODO_COLUMNS, dump_todo_page  # noqa: E402
+
+
+def make_rows(count: int):
+    """DB에서 읽은 것과 같은 형태의 행(camelCase 키 dict)을 만듭니다."""
+    now = datetime.now(timezone.utc)
+    statuses = list(TodoStatus)
+    return [
+        {
+            "id": uuid4(),
+            "title": f"할 일 {i}",
+            "content": "내용 " * 20,
+            "status": statuses[i % len(statuses)],
+            "startDate": now if i % 2 else None,
+            "endDate": now + timedelta(days=1) if i % 2 else None,
+            "createdAt": now + timedelta(microseconds=i),
+            "updatedAt": now + timedelta(microseconds=i),
+        }
+        for i in range(count)
+    ]
+
+
+def to_orm(rows):
+    """행을 ORM 객체로 변환합니다 (기존 경로의 행별 ORM 객체 생성 비용)."""
+    names = {alias: column.key for alias, column in TODO_COLUMNS.items()}
+    return [Todo(**{names[k]: v for k, v in row.items()}) for row in rows]
+
+
+async def current_path(rows, field):
+    todos = to_orm(rows)
+    page = TodoPage(
+        items=[TodoSchema.model_validate(todo) for todo in todos], next_cursor="c"
+    )
+    content = await serialize_response(field=field, response_content=page)
+    return JSONResponse(content).body
+
+
+async def fast_path(rows, field):
+    return dump_todo_page(rows, "c")
+
+
+async def measure(fn, rows, field, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn(rows, field)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500, help="페이지당 행 수")
+    parser.add_argument("--repeat", type=int, default=50, help="반복 횟수")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    field = create_model_field("Response_read_todos", TodoPage, mode="serialization")
+
+    # 두 경로의 응답 본문이 같은지 먼저 확인
+    expected = json.loads(await current_path(rows, field))
+    actual = json.loads(await fast_path(rows, field))
+    assert expected == actual, "빠른 경로의 응답이 기존 경로와 다릅니다"
+
+    results = {}
+    for name, fn in (("current", current_path), ("fast", fast_path)):
+        timings = await measure(fn, rows, field, args.repeat)
+        results[name] = {
+            "medianMs": round(statistics.median(timings) * 1000, 3),
+            "rowsPerSecond": round(args.rows / statistics.median(timings)),
+        }
+    results["speedup"] = round(
+        results["current"]["medianMs"] / results["fast"]["medianMs"], 2
+    )
+    print(json.dumps({"rows": args.rows, "repeat": args.repeat, **results}, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,117 @@
+# benchmarks/coldstart.py
+"""
+워커 시작 시간(cold start) 측정
+
+uvicorn으로 앱을 --workers N개로 띄우고, 프로세스를 실행한 시점부터
+첫 정상 응답까지의 시간과 워커별 시작 단계 시간(GET /api/v1/system/startup)을 보고합니다.
+각 워커의 시간은 그 프로세스 시작 기준이며, 단계는 다음과 같습니다.
+- imports: 앱 모듈 로드 완료
+- logging: 로깅 설정 완료
+- schema: DB 스키마 확인 완료 (DB_SCHEMA_STARTUP)
+- ready: 요청을 받을 준비 완료
+- firstRequest: 그 워커의 첫 요청 처리 완료
+
+예시:
+    python -m benchmarks.coldstart --workers 4 --runs 3
+    DB_SCHEMA_STARTUP=check python -m benchmarks.coldstart --workers 4
+
+ASYNC_DATABASE_URL/SYNC_DATABASE_URL 환경 변수(또는 .env)가 필요하며, httpx가 필요합니다.
+"""
+import argparse
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+STARTUP_PATH = "/api/v1/system/startup"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run_once(workers: int, timeout: float) -> Dict[str, Any]:
+    """uvicorn을 한 번 띄워 첫 응답 시간과 워커별 시작 보고를 수집합니다."""
+    import httpx
+
+    port = free_port()
+    started = time.time()
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers),
+            "--log-level", "warning",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    reports: Dict[int, Dict[str, Any]] = {}
+    first_response: Optional[float] = None
+    try:
+        deadline = started + timeout
+        while time.time() < deadline and len(reports) < workers:
+            if process.poll() is not None:
+                sys.exit(f"uvicorn이 종료되었습니다 (코드 {process.returncode}). 설정/스키마를 확인하세요.")
+            try:
+                # 매번 새 연결을 열어 여러 워커에 골고루 닿도록 함
+                response = httpx.get(f"http://127.0.0.1:{port}{STARTUP_PATH}", timeout=1.0)
+            except httpx.HTTPError:
+                time.sleep(0.01)
+                continue
+            if response.status_code == 200:
+                if first_response is None:
+                    first_response = time.time() - started
+                report = response.json()
+                reports[report["pid"]] = report
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+    return {
+        "firstResponseSeconds": round(first_response, 4) if first_response else None,
+        "workers": sorted(reports.values(), key=lambda r: r["phases"].get("ready", 0)),
+    }
+
+
+def print_run(index: int, result: Dict[str, Any]) -> None:
+    print(f"▶ run {index}: 실행 → 첫 응답 {result['firstResponseSeconds']}s")
+    for report in result["workers"]:
+        phases = " ".join(f"{name}={seconds:.3f}s" for name, seconds in report["phases"].items())
+        first = report["firstRequest"]
+        print(f"  pid={report['pid']:<8} {phases} firstRequest={first if first is None else f'{first:.3f}s'}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="워커 시작 시간 측정")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--runs", type=int, default=3, help="반복 횟수")
+    parser.add_argument("--timeout", type=float, default=60.0, help="실행당 최대 대기 시간 (초)")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    results: List[Dict[str, Any]] = []
+    for index in range(1, args.runs + 1):
+        result = run_once(args.workers, args.timeout)
+        print_run(index, result)
+        results.append(result)
+
+    firsts = [r["firstResponseSeconds"] for r in results if r["firstResponseSeconds"]]
+    readies = [w["phases"]["ready"] for r in results for w in r["workers"] if "ready" in w["phases"]]
+    if firsts:
+        print(f"실행 → 첫 응답 중앙값 {statistics.median(firsts):.3f}s")
+    if readies:
+        print(f"워커 준비(ready) 중앙값 {statistics.median(readies):.3f}s, 최대 {max(readies):.3f}s")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"workers": args.workers, "runs": results}, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,415 @@
+# benchmarks/loadtest.py
+"""
+Todo API 부하 테스트 / 벤치마크
+
+app.main의 FastAPI 앱을 ASGI로 직접 호출(네트워크 없음)하면서 동시 클라이언트로
+모든 Todo 엔드포인트를 측정합니다. 데이터셋 크기(seed)와 페이로드 크기별로
+처리량(req/s, rows/s)과 p50/p95/p99 지연 시간을 JSON으로 저장하고,
+기준(baseline) 결과와 비교해 임계치를 넘는 성능 저하가 있으면 종료 코드 1을 반환합니다.
+
+DB 선택:
+- 기본: ASYNC_DATABASE_URL 환경 변수의 PostgreSQL (todo 테이블을 TRUNCATE 하므로 전용 DB 사용)
+- --throwaway: PATH의 initdb/pg_ctl로 임시 PostgreSQL을 띄우고 끝나면 삭제
+
+예시:
+    python -m benchmarks.loadtest --throwaway --seed-sizes 1000,100000 \\
+        --concurrency 32 --requests 2000 --output bench.json
+    python -m benchmarks.loadtest --throwaway --baseline bench.json --threshold 0.2
+
+httpx가 필요합니다 (pip install httpx).
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+STATUSES = ["NOT_STARTED", "TODO", "IN_PROGRESS", "DONE"]
+API = "/api/v1/todos"
+
+
+# ✅ 임시 PostgreSQL
+@contextmanager
+def throwaway_postgres(pg_bin: Optional[str]) -> Iterator[str]:
+    """initdb/pg_ctl로 임시 PostgreSQL을 띄우고 asyncpg URL을 반환합니다."""
+
+    def binary(name: str) -> str:
+        path = os.path.join(pg_bin, name) if pg_bin else shutil.which(name)
+        if not path or not os.path.exists(path):
+            sys.exit(f"{name}을(를) 찾을 수 없습니다. PostgreSQL을 설치하거나 --pg-bin을 지정하세요.")
+        return path
+
+    workdir = tempfile.mkdtemp(prefix="todo-bench-")
+    datadir = os.path.join(workdir, "data")
+    subprocess.run(
+        [binary("initdb"), "-D", datadir, "-U", "postgres", "--auth=trust", "-E", "UTF8"],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        [
+            binary("pg_ctl"), "-D", datadir, "-w", "-l", os.path.join(workdir, "pg.log"),
+            "-o", f"-c listen_addresses='' -k {workdir}", "start",
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        yield f"postgresql+asyncpg://postgres@/postgres?host={workdir}"
+    finally:
+        subprocess.run(
+            [binary("pg_ctl"), "-D", datadir, "-m", "fast", "stop"],
+            stdout=subprocess.DEVNULL,
+        )
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+# ✅ 측정 결과 집계
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(
+    name: str, seed: int, payload: int, latencies: List[float], errors: int,
+    elapsed: float, rows_per_request: int, concurrency: int,
+) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+    count = len(latencies)
+    return {
+        "scenario": name,
+        "seedSize": seed,
+        "payloadSize": payload,
+        "concurrency": concurrency,
+        "requests": count,
+        "errors": errors,
+        "requestsPerSecond": round(count / elapsed, 1) if elapsed else 0.0,
+        "rowsPerSecond": round(count * rows_per_request / elapsed, 1) if elapsed else 0.0,
+        "p50Ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95Ms": round(percentile(ordered, 0.95) * 1000, 3),
+        "p99Ms": round(percentile(ordered, 0.99) * 1000, 3),
+        "meanMs": round(statistics.fmean(ordered) * 1000, 3) if ordered else 0.0,
+    }
+
+
+RequestFactory = Callable[[int], Tuple[str, str, Dict[str, Any]]]
+
+
+async def run_scenario(
+    client, make_request: RequestFactory, total: int, concurrency: int,
+    expected: Tuple[int, ...],
+) -> Tuple[List[float], int, float]:
+    """concurrency개의 워커로 total개의 요청을 보내고 (지연 시간 목록, 오류 수, 경과 시간)을 반환합니다."""
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for index in counter:
+            method, url, kwargs = make_request(index)
+            started = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code not in expected:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
+
+
+# ✅ 데이터 준비
+async def seed(engine, size: int) -> None:
+    """todo 테이블을 비우고 size개의 행을 SQL로 한 번에 생성합니다."""
+    from sqlalchemy import text
+
+    async with engine.begin() as conn:
+        await conn.execute(text("TRUNCATE todo"))
+        await conn.execute(
+            text(
+                """
+                INSERT INTO todo (id, title, content, status, start_date, end_date,
+                                  created_at, updated_at)
+                SELECT gen_random_uuid(),
+                       'bench todo ' || i,
+                       repeat('x', 120),
+                       (ARRAY['NOT_STARTED','TODO','IN_PROGRESS','DONE'])[1 + i % 4]::todostatus,
+                       now() - (i || ' minutes')::interval,
+                       now() - (i || ' minutes')::interval + interval '3 days',
+                       now() - ((:size - i) || ' seconds')::interval,
+                       now() - ((:size - i) || ' seconds')::interval
+                FROM generate_series(1, :size) AS i
+                """
+            ),
+            {"size": size},
+        )
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("ANALYZE todo"))
+
+
+async def sample_ids(engine, count: int) -> List[str]:
+    from sqlalchemy import text
+
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text("SELECT id FROM todo ORDER BY random() LIMIT :n"), {"n": count}
+        )
+        return [str(row[0]) for row in result]
+
+
+async def middle_cursor(engine, offset: int) -> Optional[str]:
+    """목록 중간 위치의 커서를 만듭니다 (깊은 페이지 측정용)."""
+    from sqlalchemy import text
+
+    from app.shared.pagination import encode_cursor
+
+    async with engine.connect() as conn:
+        row = (
+            await conn.execute(
+                text("SELECT created_at, id FROM todo ORDER BY created_at, id OFFSET :o LIMIT 1"),
+                {"o": offset},
+            )
+        ).first()
+    return encode_cursor(row[0], row[1]) if row else None
+
+
+def todo_payload(index: int) -> Dict[str, Any]:
+    return {
+        "title": f"load {index}",
+        "content": "y" * 120,
+        "status": STATUSES[index % len(STATUSES)],
+    }
+
+
+# ✅ 시나리오 실행
+async def run_all(args) -> Dict[str, Any]:
+    import httpx
+
+    from app.db.base import engine
+    from app.main import app
+
+    results: List[Dict[str, Any]] = []
+    async with app.router.lifespan_context(app):
+        logging.getLogger("httpx").setLevel(logging.WARNING)  # 요청별 로그 끄기
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for size in args.seed_sizes:
+                print(f"▶ seed {size} rows", file=sys.stderr)
+                await seed(engine, size)
+                ids = await sample_ids(engine, max(args.requests, 1))
+                deep = await middle_cursor(engine, size // 2)
+                etags: Dict[str, str] = {}
+
+                def record(name, payload, rows_per_request, outcome):
+                    latencies, errors, elapsed = outcome
+                    summary = summarize(
+                        name, size, payload, latencies, errors, elapsed,
+                        rows_per_request, args.concurrency,
+                    )
+                    results.append(summary)
+                    print(
+                        f"  {name:<24} payload={payload:<6} "
+                        f"{summary['requestsPerSecond']:>9} req/s "
+                        f"p50={summary['p50Ms']}ms p95={summary['p95Ms']}ms "
+                        f"p99={summary['p99Ms']}ms errors={errors}",
+                        file=sys.stderr,
+                    )
+
+                async def scenario(name, factory, expected=(200,), payload=0, rows=1, total=None):
+                    outcome = await run_scenario(
+                        client, factory, total or args.requests, args.concurrency, expected
+                    )
+                    record(name, payload, rows, outcome)
+
+                # 단건 조회 (캐시 포함) / 조건부 조회
+                await scenario(
+                    "get_item", lambda i: ("GET", f"{API}/{ids[i % len(ids)]}", {})
+                )
+                for todo_id in ids[: min(len(ids), 200)]:
+                    response = await client.get(f"{API}/{todo_id}")
+                    etags[todo_id] = response.headers.get("etag", "")
+                cached = list(etags)
+                await scenario(
+                    "get_item_not_modified",
+                    lambda i: (
+                        "GET",
+                        f"{API}/{cached[i % len(cached)]}",
+                        {"headers": {"If-None-Match": etags[cached[i % len(cached)]]}},
+                    ),
+                    expected=(304,),
+                )
+
+                # 목록 조회 (페이지 크기별, 첫 페이지/깊은 페이지/상태 필터)
+                for limit in args.page_sizes:
+                    await scenario(
+                        "list_first_page",
+                        lambda i, limit=limit: ("GET", f"{API}/", {"params": {"limit": limit}}),
+                        payload=limit, rows=limit,
+                    )
+                    if deep:
+                        await scenario(
+                            "list_deep_page",
+                            lambda i, limit=limit: (
+                                "GET", f"{API}/", {"params": {"limit": limit, "cursor": deep}},
+                            ),
+                            payload=limit, rows=limit,
+                        )
+                    await scenario(
+                        "list_by_status",
+                        lambda i, limit=limit: (
+                            "GET", f"{API}/",
+                            {"params": {"limit": limit, "status": STATUSES[i % len(STATUSES)]}},
+                        ),
+                        payload=limit, rows=limit,
+                    )
+
+                # 전체 내보내기 (스트리밍) - 큰 데이터셋은 요청 수를 줄임
+                if size <= args.export_max_rows:
+                    await scenario(
+                        "export",
+                        lambda i: ("GET", f"{API}/export", {}),
+                        payload=size, rows=size,
+                        total=max(1, min(args.requests, args.export_requests)),
+                    )
+
+                # 쓰기: 단건 생성 / 일괄 생성 / 수정 / 삭제
+                await scenario(
+                    "create",
+                    lambda i: ("POST", f"{API}/", {"json": todo_payload(i)}),
+                    expected=(201,),
+                )
+                for batch in args.bulk_sizes:
+                    items = [todo_payload(i) for i in range(batch)]
+                    await scenario(
+                        "bulk_create",
+                        lambda i, items=items: ("POST", f"{API}/bulk", {"json": items}),
+                        expected=(201,), payload=batch, rows=batch,
+                        total=max(1, args.requests // max(batch // 10, 1)),
+                    )
+                await scenario(
+                    "update",
+                    lambda i: (
+                        "PUT", f"{API}/{ids[i % len(ids)]}",
+                        {"json": {"status": STATUSES[i % len(STATUSES)]}},
+                    ),
+                )
+                random.shuffle(ids)
+                await scenario(
+                    "delete",
+                    lambda i: ("DELETE", f"{API}/{ids[i]}", {}),
+                    expected=(204,),
+                    total=len(ids),
+                )
+
+    return {
+        "meta": {
+            "startedAt": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": sys.version.split()[0],
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "seedSizes": args.seed_sizes,
+            "pageSizes": args.page_sizes,
+            "bulkSizes": args.bulk_sizes,
+        },
+        "results": results,
+    }
+
+
+# ✅ 기준 결과와 비교
+def result_key(result: Dict[str, Any]) -> Tuple[str, int, int]:
+    return result["scenario"], result["seedSize"], result["payloadSize"]
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """p95 지연 시간 증가 또는 처리량 감소가 threshold 비율을 넘는 항목을 반환합니다."""
+    previous = {result_key(r): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in current["results"]:
+        before = previous.get(result_key(result))
+        if before is None:
+            continue
+        name = "{} seed={} payload={}".format(*result_key(result))
+        if before["p95Ms"] and result["p95Ms"] > before["p95Ms"] * (1 + threshold):
+            regressions.append(f"{name}: p95 {before['p95Ms']}ms → {result['p95Ms']}ms")
+        if (
+            before["requestsPerSecond"]
+            and result["requestsPerSecond"] < before["requestsPerSecond"] * (1 - threshold)
+        ):
+            regressions.append(
+                f"{name}: {before['requestsPerSecond']} → {result['requestsPerSecond']} req/s"
+            )
+        if result["errors"] > before["errors"]:
+            regressions.append(f"{name}: errors {before['errors']} → {result['errors']}")
+    return regressions
+
+
+def int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Todo API 부하 테스트")
+    parser.add_argument("--database-url", help="asyncpg URL (기본: ASYNC_DATABASE_URL)")
+    parser.add_argument("--throwaway", action="store_true", help="임시 PostgreSQL 사용")
+    parser.add_argument("--pg-bin", help="initdb/pg_ctl이 있는 디렉터리")
+    parser.add_argument("--seed-sizes", type=int_list, default=[1000, 10000])
+    parser.add_argument("--page-sizes", type=int_list, default=[10, 50, 200])
+    parser.add_argument("--bulk-sizes", type=int_list, default=[100, 1000])
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500, help="시나리오당 요청 수")
+    parser.add_argument("--export-max-rows", type=int, default=100000)
+    parser.add_argument("--export-requests", type=int, default=5)
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=0.2, help="허용 성능 저하 비율")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    database = throwaway_postgres(args.pg_bin) if args.throwaway else nullcontext()
+    with database as throwaway_url:
+        url = throwaway_url or args.database_url or os.environ.get("ASYNC_DATABASE_URL")
+        if not url:
+            sys.exit("--database-url, ASYNC_DATABASE_URL 또는 --throwaway가 필요합니다.")
+        # 앱 설정은 임포트 시점에 읽히므로 앱을 임포트하기 전에 환경 변수를 지정
+        os.environ["ASYNC_DATABASE_URL"] = url
+        os.environ.setdefault("SYNC_DATABASE_URL", url.replace("+asyncpg", ""))
+        os.environ["DB_ECHO_LOG"] = "False"
+        os.environ.setdefault("DB_SCHEMA_STARTUP", "create_all")  # 빈 DB면 테이블 생성
+
+        report = asyncio.run(run_all(args))
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        if regressions:
+            print("성능 저하 감지:", *regressions, sep="\n  ", file=sys.stderr)
+            return 1
+        print("기준 대비 성능 저하 없음", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
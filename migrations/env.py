@@ -9,6 +9,7 @@ from alembic import context  # Alembic의 마이그레이션 실행 컨텍스트
 
 from app.core.config import settings  # 환경 변수에서 DB URL 가져오기
 from app.shared.models import Base  # SQLAlchemy의 Base 클래스 (모든 테이블 정보 포함)
+import app.todo.models  # noqa: F401 - 모델을 임포트해야 Base.metadata에 todo 테이블이 등록됨
 
 # ✅ Alembic 설정 파일 (`alembic.ini`)을 로드하여 로그 설정 적용
 config = context.config
@@ -0,0 +1,86 @@
+"""count archived todo status
+
+Revision ID: 3f8b6d1e2a07
+Revises: a7c3e5f19b24
+Create Date: 2026-10-18 10:04:51.127336
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8b6d1e2a07'
+down_revision: Union[str, None] = 'a7c3e5f19b24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app/todo/models.TODO_STATUS_COUNT_* 와 동일하게 유지
+DUE_DAY = "coalesce((end_date AT TIME ZONE 'UTC')::date, 'infinity')"
+BACKFILL = f"""
+INSERT INTO todo_status_count (status, due_day, shard, count)
+SELECT status, {DUE_DAY}, 0, count(*) FROM (
+    SELECT status, end_date FROM todo UNION ALL SELECT status, end_date FROM todo_archive
+) AS todos GROUP BY 1, 2"""
+
+RESET_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION todo_status_count_reset() RETURNS trigger AS $$
+BEGIN
+    DELETE FROM todo_status_count;{BACKFILL};
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+# 이전 버전 (todo만 집계)
+OLD_RESET_FUNCTION = """
+CREATE OR REPLACE FUNCTION todo_status_count_reset() RETURNS trigger AS $$
+BEGIN
+    DELETE FROM todo_status_count;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+# (트리거 이름, 이벤트, 전이 테이블)
+TRIGGERS = [
+    ("todo_status_count_insert", "INSERT", "NEW TABLE AS new_rows"),
+    ("todo_status_count_update", "UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    ("todo_status_count_delete", "DELETE", "OLD TABLE AS old_rows"),
+]
+
+# 보관된 할 일 수를 요약 테이블에 더하거나(1) 빼기(-1)
+ARCHIVED_COUNTS = """
+INSERT INTO todo_status_count (status, due_day, shard, count)
+SELECT status, {due_day}, 0, {sign} * count(*) FROM todo_archive GROUP BY 1, 2
+ON CONFLICT (status, due_day, shard)
+DO UPDATE SET count = todo_status_count.count + EXCLUDED.count
+"""
+
+
+def upgrade() -> None:
+    op.execute(RESET_FUNCTION)
+
+    # 트리거 생성 ~ 보관분 집계 사이의 보관/복원이 빠지거나 중복되지 않도록 커밋까지 쓰기를 막음
+    op.execute("LOCK TABLE todo_archive IN SHARE ROW EXCLUSIVE MODE")
+    for name, event, transition in TRIGGERS:
+        op.execute(
+            f"CREATE TRIGGER {name} AFTER {event} ON todo_archive REFERENCING {transition} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION todo_status_count_apply()"
+        )
+    op.execute(
+        "CREATE TRIGGER todo_status_count_truncate AFTER TRUNCATE ON todo_archive "
+        "FOR EACH STATEMENT EXECUTE FUNCTION todo_status_count_reset()"
+    )
+    # 이미 보관된 할 일은 todo에서 빠질 때 차감되었으므로 다시 더함
+    op.execute(ARCHIVED_COUNTS.format(due_day=DUE_DAY, sign=1))
+
+
+def downgrade() -> None:
+    op.execute("LOCK TABLE todo_archive IN SHARE ROW EXCLUSIVE MODE")
+    op.execute("DROP TRIGGER IF EXISTS todo_status_count_truncate ON todo_archive")
+    for name, _, _ in reversed(TRIGGERS):
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON todo_archive")
+    op.execute(ARCHIVED_COUNTS.format(due_day=DUE_DAY, sign=-1))
+    op.execute(OLD_RESET_FUNCTION)
@@ -0,0 +1,82 @@
+"""create todo table and indexes
+
+Revision ID: 4b1f2c7a9e30
+Revises: ce091447c9bd
+Create Date: 2026-10-17 10:12:31.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b1f2c7a9e30'
+down_revision: Union[str, None] = 'ce091447c9bd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스 이름, 컬럼) - app/todo/models.Todo.__table_args__와 동일하게 유지
+INDEXES = [
+    ("ix_todo_created_at_id", ["created_at", "id"]),
+    ("ix_todo_status_created_at_id", ["status", "created_at", "id"]),
+    ("ix_todo_start_date_end_date", ["start_date", "end_date"]),
+]
+
+
+def upgrade() -> None:
+    # 기존 DB는 init_db(create_all)로 이미 테이블이 만들어져 있을 수 있으므로
+    # 타입/테이블은 존재하지 않을 때만 생성
+    op.execute(
+        """
+        DO $$ BEGIN
+            CREATE TYPE todostatus AS ENUM ('NOT_STARTED', 'TODO', 'IN_PROGRESS', 'DONE');
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END $$;
+        """
+    )
+    op.create_table(
+        'todo',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('content', sa.String(length=255), nullable=False),
+        sa.Column(
+            'status',
+            postgresql.ENUM(
+                'NOT_STARTED', 'TODO', 'IN_PROGRESS', 'DONE',
+                name='todostatus', create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column('start_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('end_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        if_not_exists=True,
+    )
+
+    # 운영 테이블에 데이터가 있어도 쓰기를 막지 않도록 CONCURRENTLY로 인덱스 생성
+    # (CONCURRENTLY는 트랜잭션 밖에서만 실행 가능)
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(
+                name,
+                'todo',
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name='todo', if_exists=True, postgresql_concurrently=True
+            )
+    op.drop_table('todo')
+    op.execute("DROP TYPE IF EXISTS todostatus")
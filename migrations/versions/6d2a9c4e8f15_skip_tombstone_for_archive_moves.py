@@ -0,0 +1,68 @@
+"""skip tombstone for archive moves
+
+Revision ID: 6d2a9c4e8f15
+Revises: 3f8b6d1e2a07
+Create Date: 2026-10-18 14:22:09.513870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6d2a9c4e8f15'
+down_revision: Union[str, None] = '3f8b6d1e2a07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app/todo/models.TODO_TOMBSTONE_FUNCTION / TODO_ARCHIVE_TOMBSTONE_TRIGGERS 와 동일하게 유지
+CHANGE_XID = "pg_current_xact_id()::text::bigint"
+
+TOMBSTONE_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION todo_tombstone_record() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO todo_tombstone (id, change_xid, deleted_at)
+    SELECT id, {CHANGE_XID}, now() FROM old_rows
+    WHERE NOT EXISTS (SELECT 1 FROM todo WHERE todo.id = old_rows.id)
+      AND NOT EXISTS (SELECT 1 FROM todo_archive WHERE todo_archive.id = old_rows.id)
+    ON CONFLICT (id) DO UPDATE
+    SET change_xid = EXCLUDED.change_xid, deleted_at = EXCLUDED.deleted_at;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+# 이전 버전 (todo에서 지워진 행은 보관으로 옮겨진 것도 모두 기록)
+OLD_TOMBSTONE_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION todo_tombstone_record() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO todo_tombstone (id, change_xid, deleted_at)
+    SELECT id, {CHANGE_XID}, now() FROM old_rows
+    ON CONFLICT (id) DO UPDATE
+    SET change_xid = EXCLUDED.change_xid, deleted_at = EXCLUDED.deleted_at;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.execute(TOMBSTONE_FUNCTION)
+    op.execute(
+        "CREATE TRIGGER todo_tombstone_delete AFTER DELETE ON todo_archive "
+        "REFERENCING OLD TABLE AS old_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION todo_tombstone_record()"
+    )
+    op.execute(
+        "CREATE TRIGGER todo_sync_horizon_truncate AFTER TRUNCATE ON todo_archive "
+        "FOR EACH STATEMENT EXECUTE FUNCTION todo_sync_horizon_reset()"
+    )
+    # 보관할 때 잘못 남은 삭제 기록 정리 (아직 동기화하지 않은 클라이언트에는 삭제로 전달되지 않음)
+    op.execute("DELETE FROM todo_tombstone USING todo_archive WHERE todo_tombstone.id = todo_archive.id")
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS todo_sync_horizon_truncate ON todo_archive")
+    op.execute("DROP TRIGGER IF EXISTS todo_tombstone_delete ON todo_archive")
+    op.execute(OLD_TOMBSTONE_FUNCTION)
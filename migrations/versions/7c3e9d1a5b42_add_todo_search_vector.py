@@ -0,0 +1,54 @@
+"""add todo search vector
+
+Revision ID: 7c3e9d1a5b42
+Revises: 4b1f2c7a9e30
+Create Date: 2026-10-17 15:40:12.209114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3e9d1a5b42'
+down_revision: Union[str, None] = '4b1f2c7a9e30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app/todo/models.TODO_SEARCH_VECTOR와 동일하게 유지
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(content, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    # STORED generated column: INSERT/UPDATE 시 DB가 자동으로 다시 계산
+    # (기존 행을 채우기 위해 테이블을 한 번 다시 씀)
+    op.execute(
+        "ALTER TABLE todo ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR}) STORED"
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_todo_search_vector',
+            'todo',
+            ['search_vector'],
+            unique=False,
+            if_not_exists=True,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_todo_search_vector',
+            table_name='todo',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
+    op.drop_column('todo', 'search_vector')
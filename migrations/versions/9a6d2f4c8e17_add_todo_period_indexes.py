@@ -0,0 +1,56 @@
+"""add todo period indexes
+
+Revision ID: 9a6d2f4c8e17
+Revises: 7c3e9d1a5b42
+Create Date: 2026-10-17 16:25:48.731052
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a6d2f4c8e17'
+down_revision: Union[str, None] = '7c3e9d1a5b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app/todo/models.todo_period와 동일하게 유지 (식이 다르면 조회 시 인덱스를 사용하지 못함)
+PERIOD = "tstzrange(least(start_date, end_date), greatest(start_date, end_date), '[]')"
+HAS_PERIOD = "start_date IS NOT NULL OR end_date IS NOT NULL"
+
+
+def upgrade() -> None:
+    # 기간 식의 통계: && 조건 행 수 추정에 사용 (ANALYZE 후 반영)
+    op.execute(f"CREATE STATISTICS IF NOT EXISTS st_todo_period ON ({PERIOD}) FROM todo")
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_todo_end_date',
+            'todo',
+            ['end_date'],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_todo_period',
+            'todo',
+            [sa.text(PERIOD)],
+            unique=False,
+            if_not_exists=True,
+            postgresql_using='gist',
+            postgresql_where=sa.text(HAS_PERIOD),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in ('ix_todo_period', 'ix_todo_end_date'):
+            op.drop_index(
+                name, table_name='todo', if_exists=True, postgresql_concurrently=True
+            )
+    op.execute("DROP STATISTICS IF EXISTS st_todo_period")
@@ -0,0 +1,74 @@
+"""add todo archive
+
+Revision ID: a7c3e5f19b24
+Revises: e4a9b7d2c158
+Create Date: 2026-10-17 21:12:05.318442
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e5f19b24'
+down_revision: Union[str, None] = 'e4a9b7d2c158'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'todo_archive',
+        sa.Column('id', postgresql.UUID(), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('content', sa.String(length=255), nullable=False),
+        sa.Column(
+            'status',
+            postgresql.ENUM(
+                'NOT_STARTED', 'TODO', 'IN_PROGRESS', 'DONE', name='todostatus', create_type=False
+            ),
+            nullable=False,
+        ),
+        sa.Column('start_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('end_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            'archived_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_todo_archive_created_at_id', 'todo_archive', ['created_at', 'id'], unique=False
+    )
+    # 보관 대상 찾기용 부분 인덱스 (운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_todo_done_updated_at',
+            'todo',
+            ['updated_at'],
+            unique=False,
+            postgresql_where=sa.text("status = 'DONE'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    # 보관된 할 일을 todo로 되돌린 뒤 테이블 삭제
+    op.execute(
+        "INSERT INTO todo (id, title, content, status, start_date, end_date, created_at, updated_at) "
+        "SELECT id, title, content, status, start_date, end_date, created_at, updated_at "
+        "FROM todo_archive ON CONFLICT (id) DO NOTHING"
+    )
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_todo_done_updated_at', table_name='todo', postgresql_concurrently=True
+        )
+    op.drop_index('ix_todo_archive_created_at_id', table_name='todo_archive')
+    op.drop_table('todo_archive')
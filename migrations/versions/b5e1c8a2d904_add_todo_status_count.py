@@ -0,0 +1,105 @@
+"""add todo status count
+
+Revision ID: b5e1c8a2d904
+Revises: 9a6d2f4c8e17
+Create Date: 2026-10-17 17:02:19.554810
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e1c8a2d904'
+down_revision: Union[str, None] = '9a6d2f4c8e17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app/todo/models.TODO_STATUS_COUNT_* 와 동일하게 유지
+DUE_DAY = "coalesce((end_date AT TIME ZONE 'UTC')::date, 'infinity')"
+UPSERT = """
+        INSERT INTO todo_status_count (status, due_day, shard, count)
+        SELECT status, due_day, pg_backend_pid() % 8, sum(delta)
+        FROM ({changes}) AS changes
+        GROUP BY status, due_day
+        HAVING sum(delta) <> 0
+        ON CONFLICT (status, due_day, shard)
+        DO UPDATE SET count = todo_status_count.count + EXCLUDED.count;"""
+ADDED = f"SELECT status, {DUE_DAY} AS due_day, 1 AS delta FROM new_rows"
+REMOVED = f"SELECT status, {DUE_DAY} AS due_day, -1 AS delta FROM old_rows"
+
+FUNCTION = f"""
+CREATE OR REPLACE FUNCTION todo_status_count_apply() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN{UPSERT.format(changes=ADDED)}
+    ELSIF TG_OP = 'DELETE' THEN{UPSERT.format(changes=REMOVED)}
+    ELSE{UPSERT.format(changes=ADDED + " UNION ALL " + REMOVED)}
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+RESET_FUNCTION = """
+CREATE OR REPLACE FUNCTION todo_status_count_reset() RETURNS trigger AS $$
+BEGIN
+    DELETE FROM todo_status_count;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+# (트리거 이름, 이벤트, 전이 테이블)
+TRIGGERS = [
+    ("todo_status_count_insert", "INSERT", "NEW TABLE AS new_rows"),
+    ("todo_status_count_update", "UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    ("todo_status_count_delete", "DELETE", "OLD TABLE AS old_rows"),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'todo_status_count',
+        sa.Column(
+            'status',
+            postgresql.ENUM(
+                'NOT_STARTED', 'TODO', 'IN_PROGRESS', 'DONE',
+                name='todostatus', create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column('due_day', sa.Date(), nullable=False),
+        sa.Column('shard', sa.SmallInteger(), nullable=False),
+        sa.Column('count', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('status', 'due_day', 'shard'),
+    )
+    op.execute(FUNCTION)
+    op.execute(RESET_FUNCTION)
+
+    # 트리거 생성 ~ 초기 집계 사이의 쓰기가 빠지거나 중복되지 않도록 커밋까지 쓰기를 막음
+    op.execute("LOCK TABLE todo IN SHARE ROW EXCLUSIVE MODE")
+    for name, event, transition in TRIGGERS:
+        op.execute(
+            f"CREATE TRIGGER {name} AFTER {event} ON todo REFERENCING {transition} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION todo_status_count_apply()"
+        )
+    op.execute(
+        "CREATE TRIGGER todo_status_count_truncate AFTER TRUNCATE ON todo "
+        "FOR EACH STATEMENT EXECUTE FUNCTION todo_status_count_reset()"
+    )
+    op.execute(
+        "INSERT INTO todo_status_count (status, due_day, shard, count) "
+        f"SELECT status, {DUE_DAY}, 0, count(*) FROM todo GROUP BY 1, 2"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS todo_status_count_truncate ON todo")
+    for name, _, _ in reversed(TRIGGERS):
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON todo")
+    op.execute("DROP FUNCTION IF EXISTS todo_status_count_reset()")
+    op.execute("DROP FUNCTION IF EXISTS todo_status_count_apply()")
+    op.drop_table('todo_status_count')
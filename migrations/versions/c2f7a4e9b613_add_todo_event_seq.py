@@ -0,0 +1,27 @@
+"""add todo event sequence
+
+Revision ID: c2f7a4e9b613
+Revises: b5e1c8a2d904
+Create Date: 2026-10-17 17:48:05.117392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f7a4e9b613'
+down_revision: Union[str, None] = 'b5e1c8a2d904'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 실시간 변경 이벤트 ID (NOTIFY 내용에 포함)
+    op.execute(sa.schema.CreateSequence(sa.Sequence('todo_event_seq'), if_not_exists=True))
+
+
+def downgrade() -> None:
+    op.execute(sa.schema.DropSequence(sa.Sequence('todo_event_seq'), if_exists=True))
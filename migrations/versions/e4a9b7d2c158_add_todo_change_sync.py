@@ -0,0 +1,124 @@
+"""add todo change sync
+
+Revision ID: e4a9b7d2c158
+Revises: c2f7a4e9b613
+Create Date: 2026-10-17 18:31:42.608214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a9b7d2c158'
+down_revision: Union[str, None] = 'c2f7a4e9b613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app/todo/models.TODO_CHANGE_XID* / TODO_TOMBSTONE_* / TODO_SYNC_HORIZON_* 와 동일하게 유지
+CHANGE_XID = "pg_current_xact_id()::text::bigint"
+
+CHANGE_XID_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION todo_change_xid_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.change_xid := {CHANGE_XID};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+
+TOMBSTONE_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION todo_tombstone_record() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO todo_tombstone (id, change_xid, deleted_at)
+    SELECT id, {CHANGE_XID}, now() FROM old_rows
+    ON CONFLICT (id) DO UPDATE
+    SET change_xid = EXCLUDED.change_xid, deleted_at = EXCLUDED.deleted_at;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+HORIZON_RESET_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION todo_sync_horizon_reset() RETURNS trigger AS $$
+BEGIN
+    UPDATE todo_sync_horizon SET change_xid = {CHANGE_XID};
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    # 기존 행은 이 마이그레이션의 트랜잭션 ID로 채워짐 (첫 동기화에서 모두 upsert로 전달)
+    op.add_column(
+        'todo',
+        sa.Column(
+            'change_xid', sa.BigInteger(), server_default=sa.text(CHANGE_XID), nullable=False
+        ),
+    )
+    op.create_index('ix_todo_change_xid_id', 'todo', ['change_xid', 'id'], unique=False)
+
+    op.create_table(
+        'todo_tombstone',
+        sa.Column('id', postgresql.UUID(), nullable=False),
+        sa.Column(
+            'change_xid', sa.BigInteger(), server_default=sa.text(CHANGE_XID), nullable=False
+        ),
+        sa.Column(
+            'deleted_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_todo_tombstone_change_xid_id', 'todo_tombstone', ['change_xid', 'id'], unique=False
+    )
+    op.create_index(
+        'ix_todo_tombstone_deleted_at', 'todo_tombstone', ['deleted_at'], unique=False
+    )
+
+    op.create_table(
+        'todo_sync_horizon',
+        sa.Column('id', sa.SmallInteger(), nullable=False),
+        sa.Column('change_xid', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.execute("INSERT INTO todo_sync_horizon (id, change_xid) VALUES (1, 0)")
+
+    op.execute(CHANGE_XID_FUNCTION)
+    op.execute(TOMBSTONE_FUNCTION)
+    op.execute(HORIZON_RESET_FUNCTION)
+    op.execute(
+        "CREATE TRIGGER todo_change_xid BEFORE UPDATE ON todo "
+        "FOR EACH ROW EXECUTE FUNCTION todo_change_xid_touch()"
+    )
+    op.execute(
+        "CREATE TRIGGER todo_tombstone_delete AFTER DELETE ON todo "
+        "REFERENCING OLD TABLE AS old_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION todo_tombstone_record()"
+    )
+    op.execute(
+        "CREATE TRIGGER todo_sync_horizon_truncate AFTER TRUNCATE ON todo "
+        "FOR EACH STATEMENT EXECUTE FUNCTION todo_sync_horizon_reset()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS todo_sync_horizon_truncate ON todo")
+    op.execute("DROP TRIGGER IF EXISTS todo_tombstone_delete ON todo")
+    op.execute("DROP TRIGGER IF EXISTS todo_change_xid ON todo")
+    op.execute("DROP FUNCTION IF EXISTS todo_sync_horizon_reset()")
+    op.execute("DROP FUNCTION IF EXISTS todo_tombstone_record()")
+    op.execute("DROP FUNCTION IF EXISTS todo_change_xid_touch()")
+    op.drop_table('todo_sync_horizon')
+    op.drop_index('ix_todo_tombstone_deleted_at', table_name='todo_tombstone')
+    op.drop_index('ix_todo_tombstone_change_xid_id', table_name='todo_tombstone')
+    op.drop_table('todo_tombstone')
+    op.drop_index('ix_todo_change_xid_id', table_name='todo')
+    op.drop_column('todo', 'change_xid')
@@ -0,0 +1,37 @@
+# tests/test_coalescing.py
+
+import asyncio
+
+import pytest
+
+from app.core.coalescing import WriteCoalescer
+
+
+def test_flush_failure_after_caller_cancelled_keeps_flusher_alive():
+    async def scenario():
+        release = asyncio.Event()
+        calls = []
+
+        async def flush(items):
+            calls.append(list(items))
+            if items == ["fail"]:
+                await release.wait()  # 호출한 쪽이 취소될 때까지 처리 중 상태로 대기
+                raise RuntimeError("insert failed")
+            return [item.upper() for item in items]
+
+        coalescer = WriteCoalescer("test", flush, max_wait=0, flushers=1)
+        coalescer.start()
+
+        caller = asyncio.create_task(coalescer.submit("fail"))
+        while not calls:
+            await asyncio.sleep(0)
+        caller.cancel()  # 클라이언트 연결 종료
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        release.set()
+
+        # 실패한 묶음 이후에도 같은 처리 작업이 다음 요청을 처리함
+        assert await asyncio.wait_for(coalescer.submit("ok"), 1) == "OK"
+        await coalescer.stop()
+
+    asyncio.run(scenario())
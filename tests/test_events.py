@@ -0,0 +1,46 @@
+# tests/test_events.py
+
+import asyncio
+
+from app.core.events import EventBroker, sse_frame
+
+
+def _broker(queue_size: int = 3) -> EventBroker:
+    broker = EventBroker("test", queue_size=queue_size, buffer_size=100, max_subscribers=10)
+    for i in range(10):
+        broker.publish(str(i), sse_frame("updated", "{}", str(i)))
+    return broker
+
+
+def _drain(subscriber) -> list:
+    frames = []
+    while True:
+        frame = asyncio.run(subscriber.get(0))
+        if not frame:
+            return frames
+        frames.append(frame)
+
+
+def test_subscribe_replays_missed_events():
+    broker = _broker()
+    subscriber = broker.subscribe("7")
+    assert _drain(subscriber) == [sse_frame("updated", "{}", str(i)) for i in (8, 9)]
+
+
+def test_subscribe_too_far_behind_sends_reset():
+    broker = _broker()
+    for last_event_id in ("6", "0"):  # 정확히 queue_size개 / 그 이상 놓침
+        subscriber = broker.subscribe(last_event_id)
+        assert _drain(subscriber) == [sse_frame("reset", '{"reason":"too_far_behind"}')]
+
+        # reset 이후 새 이벤트는 퇴출 없이 받음
+        broker.publish("next", sse_frame("updated", "{}", "next"))
+        assert not subscriber.evicted
+        assert _drain(subscriber) == [sse_frame("updated", "{}", "next")]
+        broker.unsubscribe(subscriber)
+
+
+def test_subscribe_unknown_event_id_sends_reset():
+    broker = _broker()
+    subscriber = broker.subscribe("missing")
+    assert _drain(subscriber) == [sse_frame("reset", '{"reason":"unknown_last_event_id"}')]
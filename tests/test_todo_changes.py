@@ -0,0 +1,69 @@
+# tests/test_todo_changes.py
+
+import asyncio
+from datetime import timedelta
+from uuid import UUID
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from app.db.base import async_session_maker, engine
+from app.main import app
+from app.shared.pagination import encode_cursor
+from app.todo.crud import archive_todos, get_todo_change_bounds
+from app.todo.models import utc_now
+
+TODOS = "/api/v1/todos"
+
+
+async def _sync(client, since: str):
+    """since 이후의 변경을 모두 읽어 ({id: op}, 다음 토큰)을 반환합니다."""
+    ops = {}
+    while True:
+        response = await client.get(f"{TODOS}/changes", params={"since": since, "limit": 200})
+        assert response.status_code == 200, response.text
+        body = response.json()
+        ops.update((change["id"], change["op"]) for change in body["changes"])
+        since = body["nextToken"]
+        if not body["hasMore"]:
+            return ops, since
+
+
+def test_archived_todo_is_not_reported_as_deleted():
+    async def scenario():
+        try:
+            async with async_session_maker() as db:
+                upper, _ = await get_todo_change_bounds(db)
+        except (OSError, ConnectionError) as e:  # 테스트용 DB가 없으면 건너뜀
+            pytest.skip(f"DB에 연결할 수 없습니다: {e}")
+        since = encode_cursor(upper, UUID(int=0))
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post(
+                f"{TODOS}/", json={"title": "archive", "content": "sync", "status": "DONE"}
+            )
+            assert response.status_code in (200, 201), response.text
+            todo_id = response.json()["id"]
+
+            ops, since = await _sync(client, since)
+            assert ops[todo_id] == "upsert"
+
+            # 방금 완료한 할 일까지 보관 (이보다 오래된 완료 할 일도 함께 옮겨질 수 있음)
+            async with async_session_maker() as db:
+                assert await archive_todos(db, before=utc_now() + timedelta(seconds=1)) >= 1
+
+            # 보관된 할 일은 계속 ID로 조회되므로 변경 동기화에서 삭제로 전달되지 않음
+            assert (await client.get(f"{TODOS}/{todo_id}")).status_code == 200
+            ops, since = await _sync(client, since)
+            assert todo_id not in ops
+
+            # 보관된 할 일을 삭제하면 삭제로 전달
+            assert (await client.delete(f"{TODOS}/{todo_id}")).status_code in (200, 204)
+            ops, since = await _sync(client, since)
+            assert ops[todo_id] == "delete"
+        await engine.dispose()
+
+    asyncio.run(scenario())
+